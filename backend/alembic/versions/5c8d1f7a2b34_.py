@@ -0,0 +1,44 @@
+"""index agent_messages by session
+
+Revision ID: 5c8d1f7a2b34
+Revises: 9ebf5c2e170a
+Create Date: 2026-10-18 14:03:52.617204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8d1f7a2b34"
+down_revision: Union[str, Sequence[str], None] = "9ebf5c2e170a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves session message listing and keyset pagination (WHERE session_id = ? AND
+    # id > ? ORDER BY id). Built concurrently so large tables stay writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_agent_messages_session_id_id",
+            "agent_messages",
+            ["session_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_agent_messages_session_id_id",
+            table_name="agent_messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
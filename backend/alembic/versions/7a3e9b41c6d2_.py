@@ -0,0 +1,96 @@
+"""session/run status change feed
+
+Revision ID: 7a3e9b41c6d2
+Revises: 5c8d1f7a2b34
+Create Date: 2026-10-18 15:26:07.180343
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3e9b41c6d2"
+down_revision: Union[str, Sequence[str], None] = "5c8d1f7a2b34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "agent_status_events",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("session_id", sa.Uuid(), nullable=False),
+        sa.Column("run_id", sa.Uuid(), nullable=True),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["session_id"], ["agent_sessions.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["run_id"], ["agent_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_agent_status_events_session_id"),
+        "agent_status_events",
+        ["session_id"],
+        unique=False,
+    )
+
+    # Record every status transition, whichever code path made it.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION record_agent_status_event() RETURNS trigger AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'agent_runs' THEN
+                INSERT INTO agent_status_events (session_id, run_id, entity, status)
+                VALUES (NEW.session_id, NEW.id, 'run', NEW.status);
+            ELSE
+                INSERT INTO agent_status_events (session_id, run_id, entity, status)
+                VALUES (NEW.id, NULL, 'session', NEW.status);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in ("agent_sessions", "agent_runs"):
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_status_event_insert
+            AFTER INSERT ON {table}
+            FOR EACH ROW
+            EXECUTE FUNCTION record_agent_status_event()
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_status_event_update
+            AFTER UPDATE OF status ON {table}
+            FOR EACH ROW
+            WHEN (OLD.status IS DISTINCT FROM NEW.status)
+            EXECUTE FUNCTION record_agent_status_event()
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("agent_sessions", "agent_runs"):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_status_event_insert ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_status_event_update ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_agent_status_event()")
+    op.drop_index(
+        op.f("ix_agent_status_events_session_id"), table_name="agent_status_events"
+    )
+    op.drop_table("agent_status_events")
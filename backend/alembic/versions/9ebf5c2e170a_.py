@@ -0,0 +1,49 @@
+"""notify run queue changes
+
+Revision ID: 9ebf5c2e170a
+Revises: 331320b4f8d1
+Create Date: 2026-10-18 10:12:31.418207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9ebf5c2e170a"
+down_revision: Union[str, Sequence[str], None] = "331320b4f8d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Wake long-polling run claimers whenever a run becomes claimable: a run is enqueued
+    # or requeued, or a run finishes (unblocking the next queued run of its session).
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_agent_run_queue() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('agent_run_queue', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER agent_runs_notify_queue
+        AFTER INSERT OR UPDATE OF status ON agent_runs
+        FOR EACH ROW
+        WHEN (NEW.status IN ('queued', 'completed', 'failed', 'canceled'))
+        EXECUTE FUNCTION notify_agent_run_queue()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS agent_runs_notify_queue ON agent_runs")
+    op.execute("DROP FUNCTION IF EXISTS notify_agent_run_queue()")
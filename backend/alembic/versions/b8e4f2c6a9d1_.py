@@ -0,0 +1,63 @@
+"""partial indexes for run claims
+
+Revision ID: b8e4f2c6a9d1
+Revises: e3a9c5d1b7f2
+Create Date: 2026-10-18 18:12:44.301957
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e4f2c6a9d1"
+down_revision: Union[str, Sequence[str], None] = "e3a9c5d1b7f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Claims only look at queued runs (ordered by scheduled_at, created_at) and at the
+    # claimed/running runs of a session. Both subsets stay small while completed runs
+    # pile up, so partial indexes keep claims independent of the run history. Built
+    # concurrently so large tables stay writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_agent_runs_queued_scheduled_at",
+            "agent_runs",
+            ["scheduled_at", "created_at"],
+            unique=False,
+            postgresql_where=sa.text("status = 'queued'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_agent_runs_active_session_id",
+            "agent_runs",
+            ["session_id"],
+            unique=False,
+            postgresql_where=sa.text("status IN ('claimed', 'running')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_agent_runs_active_session_id",
+            table_name="agent_runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_agent_runs_queued_scheduled_at",
+            table_name="agent_runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
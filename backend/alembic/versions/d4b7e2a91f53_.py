@@ -0,0 +1,32 @@
+"""agent_sessions.state_version for delta state patches
+
+Revision ID: d4b7e2a91f53
+Revises: 7a3e9b41c6d2
+Create Date: 2026-10-18 17:02:41.518907
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b7e2a91f53"
+down_revision: Union[str, Sequence[str], None] = "7a3e9b41c6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "agent_sessions",
+        sa.Column("state_version", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("agent_sessions", "state_version")
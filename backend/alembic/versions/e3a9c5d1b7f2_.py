@@ -0,0 +1,51 @@
+"""notify user input request changes
+
+Revision ID: e3a9c5d1b7f2
+Revises: d4b7e2a91f53
+Create Date: 2026-10-18 16:41:07.529314
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9c5d1b7f2"
+down_revision: Union[str, Sequence[str], None] = "d4b7e2a91f53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Wake executors long-polling a user input request as soon as it is answered or
+    # expires. The payload is the request id so only its own waiter re-checks.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_user_input_request() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('user_input_requests', NEW.id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER user_input_requests_notify
+        AFTER UPDATE OF status ON user_input_requests
+        FOR EACH ROW
+        WHEN (NEW.status <> 'pending')
+        EXECUTE FUNCTION notify_user_input_request()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS user_input_requests_notify ON user_input_requests"
+    )
+    op.execute("DROP FUNCTION IF EXISTS notify_user_input_request()")
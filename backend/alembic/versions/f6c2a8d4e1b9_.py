@@ -0,0 +1,44 @@
+"""index agent_status_events by created_at
+
+Revision ID: f6c2a8d4e1b9
+Revises: b8e4f2c6a9d1
+Create Date: 2026-10-18 19:04:31.552810
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c2a8d4e1b9"
+down_revision: Union[str, Sequence[str], None] = "b8e4f2c6a9d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the feed's recent-window re-read (created_at >= now - N) and retention
+    # pruning. Built concurrently so the trigger-written table stays writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_agent_status_events_created_at",
+            "agent_status_events",
+            ["created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_agent_status_events_created_at",
+            table_name="agent_status_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -7,6 +7,7 @@ from app.api.v1 import (
     env_vars,
     models,
     internal_claude_md,
+    internal_config_versions,
     internal_env_vars,
     internal_plugin_config,
     internal_slash_commands,
@@ -24,6 +25,7 @@ from app.api.v1 import (
     runs,
     schedules,
     scheduled_tasks,
+    session_changes,
     sessions,
     slash_commands,
     skill_installs,
@@ -41,6 +43,7 @@ from app.schemas.response import Response
 api_v1_router = APIRouter()
 
 api_v1_router.include_router(sessions.router)
+api_v1_router.include_router(session_changes.router)
 api_v1_router.include_router(tasks.router)
 api_v1_router.include_router(runs.router)
 api_v1_router.include_router(schedules.router)
@@ -61,6 +64,7 @@ api_v1_router.include_router(internal_user_input_requests.router)
 api_v1_router.include_router(internal_slash_commands.router)
 api_v1_router.include_router(internal_subagents.router)
 api_v1_router.include_router(internal_plugin_config.router)
+api_v1_router.include_router(internal_config_versions.router)
 api_v1_router.include_router(mcp_servers.router)
 api_v1_router.include_router(user_mcp_installs.router)
 api_v1_router.include_router(skills.router)
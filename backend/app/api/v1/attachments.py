@@ -45,7 +45,7 @@ def _get_file_size(file: UploadFile) -> int | None:
 
 
 @router.post("/upload", response_model=ResponseSchema[InputFile])
-async def upload_attachment(
+def upload_attachment(
     file: UploadFile = File(...),
     user_id: str = Depends(get_current_user_id),
 ) -> JSONResponse:
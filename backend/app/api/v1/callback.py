@@ -5,7 +5,11 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
-from app.schemas.callback import AgentCallbackRequest, CallbackResponse
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    CallbackResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.services.callback_service import CallbackService
 
@@ -17,7 +21,7 @@ callback_service = CallbackService()
 
 
 @router.post("", response_model=ResponseSchema[CallbackResponse])
-async def receive_callback(
+def receive_callback(
     callback: AgentCallbackRequest,
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -29,7 +33,20 @@ async def receive_callback(
     )
 
 
+@router.post("/batch", response_model=ResponseSchema[list[CallbackResponse]])
+def receive_callback_batch(
+    request: AgentCallbackBatchRequest,
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Receives a batch of executor callbacks and applies them in one transaction."""
+    result = callback_service.process_agent_callbacks(db, request.callbacks)
+    return Response.success(
+        data=result,
+        message="Callbacks processed successfully",
+    )
+
+
 @router.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "callback-receiver"}
@@ -17,7 +17,7 @@ env_var_service = EnvVarService()
 
 
 @router.get("", response_model=ResponseSchema[list[EnvVarPublicResponse]])
-async def list_env_vars(
+def list_env_vars(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -26,7 +26,7 @@ async def list_env_vars(
 
 
 @router.post("", response_model=ResponseSchema[EnvVarPublicResponse])
-async def create_env_var(
+def create_env_var(
     request: EnvVarCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -36,7 +36,7 @@ async def create_env_var(
 
 
 @router.patch("/{env_var_id}", response_model=ResponseSchema[EnvVarPublicResponse])
-async def update_env_var(
+def update_env_var(
     env_var_id: int,
     request: EnvVarUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -47,7 +47,7 @@ async def update_env_var(
 
 
 @router.delete("/{env_var_id}", response_model=ResponseSchema[dict])
-async def delete_env_var(
+def delete_env_var(
     env_var_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
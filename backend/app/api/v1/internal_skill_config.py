@@ -35,7 +35,7 @@ def require_internal_token(
     "/skill-config/resolve",
     response_model=ResponseSchema[dict],
 )
-async def resolve_skill_config(
+def resolve_skill_config(
     request: SkillConfigResolveRequest,
     _: None = Depends(require_internal_token),
     user_id: str = Depends(get_current_user_id),
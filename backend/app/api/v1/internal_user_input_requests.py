@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -40,7 +40,7 @@ def require_internal_token(
     "/user-input-requests",
     response_model=ResponseSchema[UserInputRequestResponse],
 )
-async def create_user_input_request(
+def create_user_input_request(
     request: UserInputRequestCreateRequest,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -55,8 +55,15 @@ async def create_user_input_request(
 )
 async def get_user_input_request(
     request_id: uuid.UUID,
+    wait_seconds: float = Query(default=0, ge=0, le=60),
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    result = user_input_service.get_request(db, request_id=str(request_id))
+    """Get a user input request.
+
+    With `wait_seconds > 0` this long-polls until the request is answered or expires.
+    """
+    result = await user_input_service.wait_for_request(
+        db, request_id=str(request_id), wait_seconds=wait_seconds
+    )
     return Response.success(data=result, message="User input request retrieved")
@@ -17,7 +17,7 @@ service = McpServerService()
 
 
 @router.get("", response_model=ResponseSchema[list[McpServerResponse]])
-async def list_mcp_servers(
+def list_mcp_servers(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -26,7 +26,7 @@ async def list_mcp_servers(
 
 
 @router.get("/{server_id}", response_model=ResponseSchema[McpServerResponse])
-async def get_mcp_server(
+def get_mcp_server(
     server_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -36,7 +36,7 @@ async def get_mcp_server(
 
 
 @router.post("", response_model=ResponseSchema[McpServerResponse])
-async def create_mcp_server(
+def create_mcp_server(
     request: McpServerCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -46,7 +46,7 @@ async def create_mcp_server(
 
 
 @router.patch("/{server_id}", response_model=ResponseSchema[McpServerResponse])
-async def update_mcp_server(
+def update_mcp_server(
     server_id: int,
     request: McpServerUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -57,7 +57,7 @@ async def update_mcp_server(
 
 
 @router.delete("/{server_id}", response_model=ResponseSchema[dict])
-async def delete_mcp_server(
+def delete_mcp_server(
     server_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -17,7 +17,7 @@ session_service = SessionService()
 
 
 @router.get("/{message_id}", response_model=ResponseSchema[MessageResponse])
-async def get_message(
+def get_message(
     message_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
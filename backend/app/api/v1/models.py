@@ -9,7 +9,7 @@ router = APIRouter(prefix="/models", tags=["models"])
 
 
 @router.get("", response_model=ResponseSchema[ModelConfigResponse])
-async def get_model_config() -> JSONResponse:
+def get_model_config() -> JSONResponse:
     """Get model configuration for UI selection."""
     settings = get_settings()
     payload = ModelConfigResponse(
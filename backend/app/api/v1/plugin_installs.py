@@ -19,7 +19,7 @@ service = UserPluginInstallService()
 
 
 @router.get("", response_model=ResponseSchema[list[UserPluginInstallResponse]])
-async def list_plugin_installs(
+def list_plugin_installs(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -28,7 +28,7 @@ async def list_plugin_installs(
 
 
 @router.post("", response_model=ResponseSchema[UserPluginInstallResponse])
-async def create_plugin_install(
+def create_plugin_install(
     request: UserPluginInstallCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -40,7 +40,7 @@ async def create_plugin_install(
 @router.patch(
     "/bulk", response_model=ResponseSchema[UserPluginInstallBulkUpdateResponse]
 )
-async def bulk_update_plugin_installs(
+def bulk_update_plugin_installs(
     request: UserPluginInstallBulkUpdateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -50,7 +50,7 @@ async def bulk_update_plugin_installs(
 
 
 @router.patch("/{install_id}", response_model=ResponseSchema[UserPluginInstallResponse])
-async def update_plugin_install(
+def update_plugin_install(
     install_id: int,
     request: UserPluginInstallUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -61,7 +61,7 @@ async def update_plugin_install(
 
 
 @router.delete("/{install_id}", response_model=ResponseSchema[dict])
-async def delete_plugin_install(
+def delete_plugin_install(
     install_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -13,7 +13,7 @@ service = PluginService()
 
 
 @router.get("", response_model=ResponseSchema[list[PluginResponse]])
-async def list_plugins(
+def list_plugins(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -22,7 +22,7 @@ async def list_plugins(
 
 
 @router.get("/{plugin_id}", response_model=ResponseSchema[PluginResponse])
-async def get_plugin(
+def get_plugin(
     plugin_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -32,7 +32,7 @@ async def get_plugin(
 
 
 @router.post("", response_model=ResponseSchema[PluginResponse])
-async def create_plugin(
+def create_plugin(
     request: PluginCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -42,7 +42,7 @@ async def create_plugin(
 
 
 @router.patch("/{plugin_id}", response_model=ResponseSchema[PluginResponse])
-async def update_plugin(
+def update_plugin(
     plugin_id: int,
     request: PluginUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -53,7 +53,7 @@ async def update_plugin(
 
 
 @router.delete("/{plugin_id}", response_model=ResponseSchema[dict])
-async def delete_plugin(
+def delete_plugin(
     plugin_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
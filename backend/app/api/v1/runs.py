@@ -9,12 +9,19 @@ from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.run import (
+    RunBatchClaimRequest,
+    RunBatchClaimResponse,
     RunClaimRequest,
     RunClaimResponse,
     RunFailRequest,
+    RunHeartbeatRequest,
+    RunHeartbeatResponse,
     RunResponse,
     RunStartRequest,
+    RunWaitRequest,
+    RunWaitResponse,
 )
+from app.services.run_lease_reaper import run_lease_reaper
 from app.services.run_service import RunService
 from app.services.session_service import SessionService
 
@@ -25,7 +32,7 @@ session_service = SessionService()
 
 
 @router.post("/claim", response_model=ResponseSchema[RunClaimResponse | None])
-async def claim_next_run(
+def claim_next_run(
     request: RunClaimRequest,
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -34,8 +41,56 @@ async def claim_next_run(
     return Response.success(data=result, message="Run claimed" if result else "No runs")
 
 
+@router.post("/claim-batch", response_model=ResponseSchema[RunBatchClaimResponse])
+async def claim_run_batch(
+    request: RunBatchClaimRequest,
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Claim up to `max_runs` available runs (at most one per session).
+
+    With `wait_seconds > 0` this long-polls until a run becomes claimable.
+    """
+    result = await run_service.claim_run_batch_wait(db, request)
+    return Response.success(
+        data=result,
+        message=f"{len(result.runs)} runs claimed" if result.runs else "No runs",
+    )
+
+
+@router.post("/wait", response_model=ResponseSchema[RunWaitResponse])
+async def wait_for_runs(
+    request: RunWaitRequest,
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Long-poll up to `wait_seconds` until a run is claimable (nothing is claimed)."""
+    result = await run_service.wait_for_runs(db, request)
+    return Response.success(
+        data=result, message="Runs available" if result.available else "No runs"
+    )
+
+
+@router.post("/heartbeat", response_model=ResponseSchema[RunHeartbeatResponse])
+def heartbeat_runs(
+    request: RunHeartbeatRequest,
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Renew the claim leases of many runs in one request."""
+    result = run_service.heartbeat_runs(db, request)
+    return Response.success(
+        data=result, message=f"{len(result.renewed)} leases renewed"
+    )
+
+
+@router.get("/lease-reaper/stats")
+async def get_lease_reaper_stats() -> JSONResponse:
+    """Get expired-lease sweep counters (runs reclaimed, sweep duration)."""
+    return Response.success(
+        data=run_lease_reaper.get_stats(), message="Lease reaper stats retrieved"
+    )
+
+
 @router.post("/{run_id}/start", response_model=ResponseSchema[RunResponse])
-async def start_run(
+def start_run(
     run_id: uuid.UUID,
     request: RunStartRequest,
     db: Session = Depends(get_db),
@@ -46,7 +101,7 @@ async def start_run(
 
 
 @router.post("/{run_id}/fail", response_model=ResponseSchema[RunResponse])
-async def fail_run(
+def fail_run(
     run_id: uuid.UUID,
     request: RunFailRequest,
     db: Session = Depends(get_db),
@@ -57,7 +112,7 @@ async def fail_run(
 
 
 @router.get("/{run_id}", response_model=ResponseSchema[RunResponse])
-async def get_run(
+def get_run(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -74,7 +129,7 @@ async def get_run(
 
 
 @router.get("/session/{session_id}", response_model=ResponseSchema[list[RunResponse]])
-async def list_runs_by_session(
+def list_runs_by_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user_id, get_db
+from app.schemas.response import Response, ResponseSchema
+from app.schemas.status_event import StatusEventPageResponse
+from app.services.status_event_service import StatusEventService
+
+router = APIRouter(prefix="/session-changes", tags=["sessions"])
+
+status_event_service = StatusEventService()
+
+
+@router.get("", response_model=ResponseSchema[StatusEventPageResponse])
+def list_session_changes(
+    since: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=200, ge=1, le=1000),
+    kind: str = Query(default="chat"),
+    lookback_seconds: int = Query(default=0, ge=0, le=86400),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Lists session/run status transitions after `since` (omit it to get the head).
+
+    `lookback_seconds` restricts the page to events written in that recent window, so
+    consumers can re-read transitions whose transaction committed behind their cursor.
+    """
+    kind_filter = kind.strip().lower()
+    page = status_event_service.list_changes(
+        db,
+        user_id,
+        since=since,
+        limit=limit,
+        kind=None if kind_filter in {"", "all"} else kind_filter,
+        lookback_seconds=lookback_seconds,
+    )
+    return Response.success(data=page, message="Session changes retrieved")
@@ -12,7 +12,11 @@ from app.core.settings import get_settings
 from app.core.deps import get_current_user_id, get_db
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.schemas.message import MessageResponse, MessageWithFilesResponse
+from app.schemas.message import (
+    MessagePageResponse,
+    MessageResponse,
+    MessageWithFilesResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.session import (
     SessionCancelRequest,
@@ -92,7 +96,7 @@ def _cancel_executor_manager(session_id: uuid.UUID, reason: str | None) -> bool:
 
 
 @router.post("", response_model=ResponseSchema[SessionResponse])
-async def create_session(
+def create_session(
     request: SessionCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -106,7 +110,7 @@ async def create_session(
 
 
 @router.get("", response_model=ResponseSchema[list[SessionResponse]])
-async def list_sessions(
+def list_sessions(
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
     offset: int = 0,
@@ -132,7 +136,7 @@ async def list_sessions(
 
 
 @router.get("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def get_session(
+def get_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -151,7 +155,7 @@ async def get_session(
 
 
 @router.get("/{session_id}/state", response_model=ResponseSchema[SessionStateResponse])
-async def get_session_state(
+def get_session_state(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -170,7 +174,7 @@ async def get_session_state(
 
 
 @router.patch("/{session_id}", response_model=ResponseSchema[SessionResponse])
-async def update_session(
+def update_session(
     session_id: uuid.UUID,
     request: SessionUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -193,7 +197,7 @@ async def update_session(
 @router.post(
     "/{session_id}/cancel", response_model=ResponseSchema[SessionCancelResponse]
 )
-async def cancel_session(
+def cancel_session(
     session_id: uuid.UUID,
     request: SessionCancelRequest,
     user_id: str = Depends(get_current_user_id),
@@ -218,7 +222,7 @@ async def cancel_session(
 
 
 @router.delete("/{session_id}", response_model=ResponseSchema[dict])
-async def delete_session(
+def delete_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -238,14 +242,23 @@ async def delete_session(
 
 
 @router.get(
-    "/{session_id}/messages", response_model=ResponseSchema[list[MessageResponse]]
+    "/{session_id}/messages",
+    response_model=ResponseSchema[list[MessageResponse] | MessagePageResponse],
 )
-async def get_session_messages(
+def get_session_messages(
     session_id: uuid.UUID,
+    after_id: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    include_total: bool = Query(default=False),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    """Gets all messages for a session."""
+    """Gets messages for a session.
+
+    Without `after_id`/`limit` this returns the legacy message list. With either, it
+    returns a keyset page (`items`, `next_cursor`, `has_more`); `include_total=true`
+    adds the capped `approximate_total`.
+    """
     # Verify session exists
     db_session = session_service.get_session(db, session_id)
     if db_session.user_id != user_id:
@@ -253,6 +266,18 @@ async def get_session_messages(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
+    if after_id is not None or limit is not None:
+        page = message_service.get_messages_page(
+            db,
+            session_id,
+            after_id=after_id,
+            limit=limit or 100,
+            include_total=include_total,
+        )
+        return Response.success(
+            data=page,
+            message="Messages retrieved successfully",
+        )
     messages = message_service.get_messages(db, session_id)
     return Response.success(
         data=[MessageResponse.model_validate(m) for m in messages],
@@ -264,7 +289,7 @@ async def get_session_messages(
     "/{session_id}/messages-with-files",
     response_model=ResponseSchema[list[MessageWithFilesResponse]],
 )
-async def get_session_messages_with_files(
+def get_session_messages_with_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -288,7 +313,7 @@ async def get_session_messages_with_files(
     "/{session_id}/tool-executions",
     response_model=ResponseSchema[list[ToolExecutionResponse]],
 )
-async def get_session_tool_executions(
+def get_session_tool_executions(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(default=500, ge=1, le=2000),
@@ -319,7 +344,7 @@ async def get_session_tool_executions(
     "/{session_id}/computer/browser/{tool_use_id}",
     response_model=ResponseSchema[ComputerBrowserScreenshotResponse],
 )
-async def get_session_browser_screenshot(
+def get_session_browser_screenshot(
     session_id: uuid.UUID,
     tool_use_id: str,
     user_id: str = Depends(get_current_user_id),
@@ -353,7 +378,7 @@ async def get_session_browser_screenshot(
 
 
 @router.get("/{session_id}/usage", response_model=ResponseSchema[UsageResponse])
-async def get_session_usage(
+def get_session_usage(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -377,7 +402,7 @@ async def get_session_usage(
     "/{session_id}/workspace/files",
     response_model=ResponseSchema[list[FileNode]],
 )
-async def get_session_workspace_files(
+def get_session_workspace_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -434,7 +459,7 @@ async def get_session_workspace_files(
     "/{session_id}/workspace/archive",
     response_model=ResponseSchema[WorkspaceArchiveResponse],
 )
-async def get_session_workspace_archive(
+def get_session_workspace_archive(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
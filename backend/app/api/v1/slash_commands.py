@@ -17,7 +17,7 @@ service = SlashCommandService()
 
 
 @router.get("", response_model=ResponseSchema[list[SlashCommandResponse]])
-async def list_slash_commands(
+def list_slash_commands(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
@@ -26,7 +26,7 @@ async def list_slash_commands(
 
 
 @router.get("/{command_id}", response_model=ResponseSchema[SlashCommandResponse])
-async def get_slash_command(
+def get_slash_command(
     command_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -36,7 +36,7 @@ async def get_slash_command(
 
 
 @router.post("", response_model=ResponseSchema[SlashCommandResponse])
-async def create_slash_command(
+def create_slash_command(
     request: SlashCommandCreateRequest,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
@@ -46,7 +46,7 @@ async def create_slash_command(
 
 
 @router.patch("/{command_id}", response_model=ResponseSchema[SlashCommandResponse])
-async def update_slash_command(
+def update_slash_command(
     command_id: int,
     request: SlashCommandUpdateRequest,
     user_id: str = Depends(get_current_user_id),
@@ -62,7 +62,7 @@ async def update_slash_command(
 
 
 @router.delete("/{command_id}", response_model=ResponseSchema[dict])
-async def delete_slash_command(
+def delete_slash_command(
     command_id: int,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
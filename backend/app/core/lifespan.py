@@ -1,9 +1,14 @@
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 
 from app.core.database import engine
+from app.core.pg_notify import pg_notify_listener
+from app.core.settings import get_settings
+from app.services.run_lease_reaper import run_lease_reaper
+from app.services.status_event_pruner import status_event_pruner
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +19,22 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting application...")
     logger.info("Database engine initialized")
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    settings = get_settings()
+    limiter.total_tokens = max(
+        1,
+        settings.threadpool_max_workers
+        or settings.db_pool_size + settings.db_max_overflow,
+    )
+    logger.info(f"Threadpool size: {limiter.total_tokens}")
+    await pg_notify_listener.start()
+    await run_lease_reaper.start()
+    await status_event_pruner.start()
     yield
     # Shutdown
+    await status_event_pruner.stop()
+    await run_lease_reaper.stop()
+    await pg_notify_listener.stop()
     logger.info("Shutting down database engine...")
     engine.dispose()
     logger.info("Database engine disposed")
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+RUN_QUEUE_CHANNEL = "agent_run_queue"
+USER_INPUT_CHANNEL = "user_input_requests"
+
+
+class PgNotifyListener:
+    """Process-wide Postgres LISTEN connection that wakes async waiters on NOTIFY.
+
+    Waiters `subscribe` before checking the database and then `wait` on the yielded
+    event, so a notification sent between the check and the wait still wakes them.
+    Waits always have a timeout and waiters re-check after waking, so a missed
+    notification (listener down, non-Postgres database) only degrades to polling at
+    `fallback_interval_seconds`. A waiter may pass a `key` to be woken only by
+    notifications whose payload equals it.
+    """
+
+    def __init__(
+        self,
+        channels: list[str],
+        *,
+        fallback_interval_seconds: float = 1.0,
+        reconnect_delay_seconds: float = 5.0,
+    ) -> None:
+        self.channels = channels
+        self.fallback_interval_seconds = fallback_interval_seconds
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._conn = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._events: dict[str, asyncio.Event] = {}
+        self._subscribers: dict[str, int] = {}
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._stopped = False
+
+    @property
+    def listening(self) -> bool:
+        return self._conn is not None
+
+    async def start(self) -> None:
+        self._stopped = False
+        self._loop = asyncio.get_running_loop()
+        if engine.dialect.name != "postgresql":
+            logger.info(
+                "pg_notify_disabled_non_postgres",
+                extra={"dialect": engine.dialect.name},
+            )
+            return
+        self._connect()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._reconnect_task
+            self._reconnect_task = None
+        self._disconnect()
+        self._wake_all()
+
+    def _connect(self) -> None:
+        import psycopg2
+        import psycopg2.extensions
+
+        dsn = engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        try:
+            conn = psycopg2.connect(dsn)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                for channel in self.channels:
+                    cursor.execute(f'LISTEN "{channel}"')
+        except Exception as exc:
+            logger.warning(f"Failed to start Postgres LISTEN connection: {exc}")
+            self._schedule_reconnect()
+            return
+
+        self._conn = conn
+        assert self._loop is not None
+        self._loop.add_reader(conn.fileno(), self._on_readable)
+        logger.info("pg_notify_listening", extra={"channels": self.channels})
+        # Anything enqueued while we were not listening must be picked up now.
+        self._wake_all()
+
+    def _disconnect(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._loop is not None:
+            with suppress(Exception):
+                self._loop.remove_reader(conn.fileno())
+        with suppress(Exception):
+            conn.close()
+
+    def _schedule_reconnect(self) -> None:
+        if self._stopped or self._loop is None:
+            return
+        if self._reconnect_task and not self._reconnect_task.done():
+            return
+
+        async def _reconnect() -> None:
+            await asyncio.sleep(self.reconnect_delay_seconds)
+            if not self._stopped:
+                self._connect()
+
+        self._reconnect_task = self._loop.create_task(_reconnect())
+
+    def _on_readable(self) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            conn.poll()
+        except Exception as exc:
+            logger.warning(f"Postgres LISTEN connection lost: {exc}")
+            self._disconnect()
+            self._wake_all()
+            self._schedule_reconnect()
+            return
+
+        wakeups = set()
+        for notify in conn.notifies:
+            wakeups.add(notify.channel)
+            if notify.payload:
+                wakeups.add(self._event_key(notify.channel, notify.payload))
+        conn.notifies.clear()
+        for event_key in wakeups:
+            self._wake(event_key)
+
+    @staticmethod
+    def _event_key(channel: str, key: str | None) -> str:
+        return f"{channel}:{key}" if key else channel
+
+    def _wake(self, event_key: str) -> None:
+        event = self._events.pop(event_key, None)
+        if event is not None:
+            event.set()
+
+    def _wake_all(self) -> None:
+        for event_key in list(self._events):
+            self._wake(event_key)
+
+    @contextmanager
+    def subscribe(
+        self, channel: str, *, key: str | None = None
+    ) -> Iterator[asyncio.Event]:
+        """Register for the next notification on `channel` (with payload `key`, if given).
+
+        The yielded event is set by the first matching notification; subscribe again
+        for the next one. The registration is dropped when the last subscriber exits.
+        """
+        event_key = self._event_key(channel, key)
+        event = self._events.get(event_key)
+        if event is None:
+            event = asyncio.Event()
+            self._events[event_key] = event
+        self._subscribers[event_key] = self._subscribers.get(event_key, 0) + 1
+        try:
+            yield event
+        finally:
+            remaining = self._subscribers.pop(event_key) - 1
+            if remaining:
+                self._subscribers[event_key] = remaining
+            else:
+                self._events.pop(event_key, None)
+
+    async def wait(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait for a subscribed notification.
+
+        Returns:
+            True when woken by a notification, False on timeout.
+        """
+        if timeout <= 0:
+            return False
+        if not self.listening:
+            timeout = min(timeout, self.fallback_interval_seconds)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+
+pg_notify_listener = PgNotifyListener([RUN_QUEUE_CHANNEL, USER_INPUT_CHANNEL])
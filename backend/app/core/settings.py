@@ -19,6 +19,28 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=5)
     db_max_overflow: int = Field(default=10)
     db_pool_timeout_seconds: int = Field(default=30)
+    # Request handlers are sync and run on the threadpool so blocking DB/S3 calls never
+    # stall the event loop. Unset, it matches db_pool_size + db_max_overflow: extra
+    # threads would only queue on the connection pool.
+    threadpool_max_workers: int | None = Field(
+        default=None, alias="THREADPOOL_MAX_WORKERS"
+    )
+    # Paged message listings count at most this many rows per session; the count is
+    # reported as approximate beyond it so long sessions never pay for a full COUNT(*).
+    message_count_cap: int = Field(default=10000, alias="MESSAGE_COUNT_CAP")
+    # Claimed runs whose lease expired are requeued by a periodic sweep instead of on every
+    # claim. 0 disables the sweep (only when another backend replica runs it).
+    run_lease_sweep_interval_seconds: float = Field(
+        default=5.0, alias="RUN_LEASE_SWEEP_INTERVAL_SECONDS"
+    )
+    # Status change feed events (agent_status_events) older than this are pruned every
+    # STATUS_EVENT_PRUNE_INTERVAL_SECONDS. 0 keeps them forever.
+    status_event_retention_hours: float = Field(
+        default=168.0, alias="STATUS_EVENT_RETENTION_HOURS"
+    )
+    status_event_prune_interval_seconds: float = Field(
+        default=3600.0, alias="STATUS_EVENT_PRUNE_INTERVAL_SECONDS"
+    )
 
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -13,6 +13,7 @@ from app.models.project import Project
 from app.models.skill import Skill
 from app.models.skill_import_job import SkillImportJob
 from app.models.slash_command import SlashCommand
+from app.models.status_event import AgentStatusEvent
 from app.models.sub_agent import SubAgent
 from app.models.tool_execution import ToolExecution
 from app.models.usage_log import UsageLog
@@ -28,6 +29,7 @@ __all__ = [
     "AgentRun",
     "AgentScheduledTask",
     "AgentSession",
+    "AgentStatusEvent",
     "UserClaudeMdSetting",
     "UserEnvVar",
     "McpServer",
@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, BigInteger, ForeignKey, String, Text
+from sqlalchemy import JSON, BigInteger, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base, TimestampMixin
@@ -32,3 +32,5 @@ class AgentMessage(Base, TimestampMixin):
         back_populates="result_message",
         foreign_keys="ToolExecution.result_message_id",
     )
+
+    __table_args__ = (Index("ix_agent_messages_session_id_id", "session_id", "id"),)
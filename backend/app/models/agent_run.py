@@ -6,6 +6,7 @@ from sqlalchemy import (
     BigInteger,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -88,3 +89,19 @@ class AgentRun(Base, TimestampMixin):
     usage_logs: Mapped[list["UsageLog"]] = relationship(
         back_populates="run", cascade="all, delete-orphan"
     )
+
+    # Partial indexes for the claim query: due queued runs in claim order, and the
+    # active-run check per session.
+    __table_args__ = (
+        Index(
+            "ix_agent_runs_queued_scheduled_at",
+            "scheduled_at",
+            "created_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_agent_runs_active_session_id",
+            "session_id",
+            postgresql_where=text("status IN ('claimed', 'running')"),
+        ),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, JSON, Boolean, String, Text, text
+from sqlalchemy import ForeignKey, JSON, Boolean, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base, TimestampMixin
@@ -32,6 +32,7 @@ class AgentSession(Base, TimestampMixin):
     config_snapshot: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     workspace_archive_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     state_patch: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    state_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     workspace_files_prefix: Mapped[str | None] = mapped_column(Text, nullable=True)
     workspace_manifest_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     workspace_archive_key: Mapped[str | None] = mapped_column(Text, nullable=True)
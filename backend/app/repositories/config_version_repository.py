@@ -0,0 +1,19 @@
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+
+class ConfigVersionRepository:
+    @staticmethod
+    def get_stamp(session_db: Session, model: Any, *criteria: Any) -> str:
+        """Return a cheap change stamp (row count + latest updated_at) for matching rows.
+
+        Any insert or update moves `max(updated_at)`; deletes change the count.
+        """
+        count, latest = (
+            session_db.query(func.count(model.id), func.max(model.updated_at))
+            .filter(*criteria)
+            .one()
+        )
+        return f"{count}:{latest.isoformat() if latest else ''}"
@@ -1,6 +1,7 @@
 import uuid
 from typing import Any
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.agent_message import AgentMessage
@@ -34,15 +35,27 @@ class MessageRepository:
             session_db.query(AgentMessage).filter(AgentMessage.id == message_id).first()
         )
 
+    @staticmethod
+    def list_by_ids(session_db: Session, message_ids: list[int]) -> list[AgentMessage]:
+        """Gets messages by IDs."""
+        if not message_ids:
+            return []
+        return (
+            session_db.query(AgentMessage)
+            .filter(AgentMessage.id.in_(message_ids))
+            .all()
+        )
+
     @staticmethod
     def list_by_session(
         session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
     ) -> list[AgentMessage]:
         """Lists messages for a session."""
+        # Order by id: messages stored in one callback batch share created_at.
         return (
             session_db.query(AgentMessage)
             .filter(AgentMessage.session_id == session_id)
-            .order_by(AgentMessage.created_at.asc())
+            .order_by(AgentMessage.id.asc())
             .limit(limit)
             .offset(offset)
             .all()
@@ -56,3 +69,33 @@ class MessageRepository:
             .filter(AgentMessage.session_id == session_id)
             .count()
         )
+
+    @staticmethod
+    def list_by_session_after(
+        session_db: Session,
+        session_id: uuid.UUID,
+        after_id: int | None = None,
+        limit: int = 100,
+    ) -> list[AgentMessage]:
+        """Lists messages for a session with id greater than `after_id` (keyset page)."""
+        query = session_db.query(AgentMessage).filter(
+            AgentMessage.session_id == session_id
+        )
+        if after_id is not None:
+            query = query.filter(AgentMessage.id > after_id)
+        return query.order_by(AgentMessage.id.asc()).limit(limit).all()
+
+    @staticmethod
+    def count_by_session_capped(
+        session_db: Session, session_id: uuid.UUID, cap: int
+    ) -> int:
+        """Counts messages for a session, stopping at `cap` rows."""
+        limited = (
+            select(AgentMessage.id)
+            .where(AgentMessage.session_id == session_id)
+            .limit(cap)
+            .subquery()
+        )
+        return int(
+            session_db.execute(select(func.count()).select_from(limited)).scalar_one()
+        )
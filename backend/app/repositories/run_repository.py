@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import exists, select, update
+from sqlalchemy import exists, func, select, update
 from sqlalchemy.orm import Session, aliased
 
 from app.models.agent_run import AgentRun
@@ -45,6 +45,13 @@ class RunRepository:
         """Gets a run by ID."""
         return session_db.query(AgentRun).filter(AgentRun.id == run_id).first()
 
+    @staticmethod
+    def list_by_ids(session_db: Session, run_ids: list[uuid.UUID]) -> list[AgentRun]:
+        """Gets runs by IDs."""
+        if not run_ids:
+            return []
+        return session_db.query(AgentRun).filter(AgentRun.id.in_(run_ids)).all()
+
     @staticmethod
     def list_by_session(
         session_db: Session,
@@ -83,6 +90,8 @@ class RunRepository:
     def release_expired_claims(session_db: Session) -> int:
         """Release expired claimed runs back to queued.
 
+        Called by the periodic lease reaper, not on the claim path.
+
         Returns:
             Number of released runs.
         """
@@ -97,6 +106,74 @@ class RunRepository:
         result = session_db.connection().execute(stmt)
         return result.rowcount
 
+    @staticmethod
+    def renew_leases(
+        session_db: Session,
+        worker_id: str,
+        run_ids: list[uuid.UUID],
+        lease_seconds: int,
+    ) -> list[uuid.UUID]:
+        """Extend the leases of runs still claimed by `worker_id`.
+
+        Returns:
+            IDs of the renewed runs.
+        """
+        if not run_ids:
+            return []
+        lease_until = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        stmt = (
+            update(AgentRun)
+            .where(AgentRun.id.in_(run_ids))
+            .where(AgentRun.status == "claimed")
+            .where(AgentRun.claimed_by == worker_id)
+            .values(lease_expires_at=lease_until)
+            .returning(AgentRun.id)
+        )
+        return list(session_db.connection().execute(stmt).scalars().all())
+
+    @staticmethod
+    def get_next_scheduled_at(
+        session_db: Session,
+        schedule_modes: list[str] | None = None,
+    ) -> datetime | None:
+        """Gets the earliest scheduled_at of queued runs that are not due yet."""
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(func.min(AgentRun.scheduled_at))
+            .where(AgentRun.status == "queued")
+            .where(AgentRun.scheduled_at > now)
+        )
+        if schedule_modes:
+            stmt = stmt.where(AgentRun.schedule_mode.in_(schedule_modes))
+        return session_db.execute(stmt).scalar()
+
+    @staticmethod
+    def has_claimable(
+        session_db: Session,
+        schedule_modes: list[str] | None = None,
+    ) -> bool:
+        """Checks whether claim_next/claim_batch would find a run, without locking it."""
+        now = datetime.now(timezone.utc)
+
+        running_or_claimed = aliased(AgentRun)
+        has_active_run = exists(
+            select(1)
+            .select_from(running_or_claimed)
+            .where(running_or_claimed.session_id == AgentRun.session_id)
+            .where(running_or_claimed.status.in_(["claimed", "running"]))
+        )
+
+        stmt = (
+            select(AgentRun.id)
+            .where(AgentRun.status == "queued")
+            .where(AgentRun.scheduled_at <= now)
+            .where(~has_active_run)
+            .limit(1)
+        )
+        if schedule_modes:
+            stmt = stmt.where(AgentRun.schedule_mode.in_(schedule_modes))
+        return session_db.execute(stmt).first() is not None
+
     @staticmethod
     def claim_next(
         session_db: Session,
@@ -112,8 +189,6 @@ class RunRepository:
         if lease_seconds <= 0:
             lease_seconds = 30
 
-        _ = RunRepository.release_expired_claims(session_db)
-
         now = datetime.now(timezone.utc)
         lease_until = now + timedelta(seconds=lease_seconds)
 
@@ -145,3 +220,77 @@ class RunRepository:
         run.claimed_by = worker_id
         run.lease_expires_at = lease_until
         return run
+
+    @staticmethod
+    def claim_batch(
+        session_db: Session,
+        worker_id: str,
+        max_runs: int,
+        lease_seconds: int = 30,
+        schedule_modes: list[str] | None = None,
+    ) -> list[AgentRun]:
+        """Claims up to `max_runs` available runs in a single transaction.
+
+        Only the oldest eligible queued run of each session is a candidate, so a batch never
+        holds more than one claimed/running run per session. Candidates locked by another
+        worker are skipped (FOR UPDATE SKIP LOCKED).
+        """
+        if max_runs <= 0:
+            return []
+        if lease_seconds <= 0:
+            lease_seconds = 30
+
+        now = datetime.now(timezone.utc)
+        lease_until = now + timedelta(seconds=lease_seconds)
+
+        running_or_claimed = aliased(AgentRun)
+        has_active_run = exists(
+            select(1)
+            .select_from(running_or_claimed)
+            .where(running_or_claimed.session_id == AgentRun.session_id)
+            .where(running_or_claimed.status.in_(["claimed", "running"]))
+        )
+
+        ranked = (
+            select(
+                AgentRun.id,
+                func.row_number()
+                .over(
+                    partition_by=AgentRun.session_id,
+                    order_by=(AgentRun.scheduled_at.asc(), AgentRun.created_at.asc()),
+                )
+                .label("session_rank"),
+            )
+            .where(AgentRun.status == "queued")
+            .where(AgentRun.scheduled_at <= now)
+            .where(~has_active_run)
+        )
+        if schedule_modes:
+            ranked = ranked.where(AgentRun.schedule_mode.in_(schedule_modes))
+        ranked_sq = ranked.subquery()
+
+        # Repeat the row filters on the locking select: when a row is locked by a
+        # concurrent claim, Postgres re-checks only these conditions against the
+        # committed row, not the subquery.
+        stmt = (
+            select(AgentRun)
+            .where(
+                AgentRun.id.in_(
+                    select(ranked_sq.c.id).where(ranked_sq.c.session_rank == 1)
+                )
+            )
+            .where(AgentRun.status == "queued")
+            .where(AgentRun.scheduled_at <= now)
+            .order_by(AgentRun.scheduled_at.asc(), AgentRun.created_at.asc())
+            .with_for_update(skip_locked=True)
+            .limit(max_runs)
+        )
+        if schedule_modes:
+            stmt = stmt.where(AgentRun.schedule_mode.in_(schedule_modes))
+
+        runs = list(session_db.execute(stmt).scalars().all())
+        for run in runs:
+            run.status = "claimed"
+            run.claimed_by = worker_id
+            run.lease_expires_at = lease_until
+        return runs
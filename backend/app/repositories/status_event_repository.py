@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
+from app.models.status_event import AgentStatusEvent
+
+
+class StatusEventRepository:
+    """Data access layer for the session/run status change feed."""
+
+    @staticmethod
+    def get_head_id(session_db: Session) -> int:
+        """Returns the newest event id (0 when the feed is empty)."""
+        return int(session_db.query(func.max(AgentStatusEvent.id)).scalar() or 0)
+
+    @staticmethod
+    def list_since(
+        session_db: Session,
+        user_id: str,
+        since: int,
+        limit: int,
+        kind: str | None = None,
+        created_after: datetime | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Lists a user's events with id > since, oldest first.
+
+        With `created_after`, only events written at or after that time are listed.
+        Each row is (event, session title, current session status, run last_error).
+        """
+        query = (
+            session_db.query(
+                AgentStatusEvent,
+                AgentSession.title,
+                AgentSession.status,
+                AgentRun.last_error,
+            )
+            .join(AgentSession, AgentSession.id == AgentStatusEvent.session_id)
+            .outerjoin(AgentRun, AgentRun.id == AgentStatusEvent.run_id)
+            .filter(AgentStatusEvent.id > since)
+            .filter(AgentSession.user_id == user_id)
+            .filter(AgentSession.is_deleted.is_(False))
+        )
+        if kind:
+            query = query.filter(AgentSession.kind == kind)
+        if created_after is not None:
+            query = query.filter(AgentStatusEvent.created_at >= created_after)
+        return query.order_by(AgentStatusEvent.id.asc()).limit(limit).all()
+
+    @staticmethod
+    def delete_older_than(session_db: Session, cutoff: datetime, limit: int) -> int:
+        """Deletes up to `limit` of the oldest events created before `cutoff`.
+
+        Note: Does not commit. Transaction handled by Service layer.
+
+        Returns:
+            Number of deleted events.
+        """
+        oldest = (
+            select(AgentStatusEvent.id)
+            .where(AgentStatusEvent.created_at < cutoff)
+            .order_by(AgentStatusEvent.id.asc())
+            .limit(limit)
+        )
+        stmt = delete(AgentStatusEvent).where(AgentStatusEvent.id.in_(oldest))
+        result = session_db.connection().execute(stmt)
+        return result.rowcount
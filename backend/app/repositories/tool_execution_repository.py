@@ -62,6 +62,24 @@ class ToolExecutionRepository:
             .first()
         )
 
+    @staticmethod
+    def list_by_session_and_tool_use_ids(
+        session_db: Session,
+        session_id: uuid.UUID,
+        tool_use_ids: list[str],
+    ) -> list[ToolExecution]:
+        """Gets tool executions for many tool_use_ids of one session in one query."""
+        if not tool_use_ids:
+            return []
+        return (
+            session_db.query(ToolExecution)
+            .filter(
+                ToolExecution.session_id == session_id,
+                ToolExecution.tool_use_id.in_(tool_use_ids),
+            )
+            .all()
+        )
+
     @staticmethod
     def list_by_session(
         session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
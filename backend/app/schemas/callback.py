@@ -68,6 +68,32 @@ class AgentCurrentState(BaseModel):
     current_step: str | None = None
 
 
+class WorkspaceStateDelta(BaseModel):
+    """Workspace changes since the previous state version."""
+
+    repository: str | None = None
+    branch: str | None = None
+    last_change: datetime
+    file_changes_upsert: list[FileChange] = Field(default_factory=list)
+    file_changes_removed: list[str] = Field(default_factory=list)
+
+
+class AgentStateDelta(BaseModel):
+    """Changes to AgentCurrentState relative to state version `base_version`.
+
+    `changed` names the top-level fields that differ; each is replaced by the value
+    below, except `workspace_state`, which is merged (or cleared when None).
+    """
+
+    base_version: int
+    changed: list[str] = Field(default_factory=list)
+    todos: list[TodoItem] | None = None
+    mcp_status: list[McpStatus] | None = None
+    browser: BrowserState | None = None
+    workspace_state: WorkspaceStateDelta | None = None
+    current_step: str | None = None
+
+
 class AgentCallbackRequest(BaseModel):
     """Agent execution callback request."""
 
@@ -78,6 +104,8 @@ class AgentCallbackRequest(BaseModel):
     error_message: str | None = None
     new_message: Any | None = None
     state_patch: AgentCurrentState | None = None
+    state_delta: AgentStateDelta | None = None
+    state_version: int | None = None
     sdk_session_id: str | None = None
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
@@ -85,6 +113,12 @@ class AgentCallbackRequest(BaseModel):
     workspace_export_status: str | None = None
 
 
+class AgentCallbackBatchRequest(BaseModel):
+    """Batch of agent callbacks, applied in order within one transaction."""
+
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list, max_length=500)
+
+
 class CallbackResponse(BaseModel):
     """Callback response."""
 
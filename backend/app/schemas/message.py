@@ -25,6 +25,21 @@ class MessageResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MessagePageResponse(BaseModel):
+    """Keyset page of session messages.
+
+    Pass `next_cursor` back as `after_id` to fetch newer messages; it stays at the
+    requested cursor when nothing new exists, so pollers can reuse it as a high-water mark.
+    The capped count is only filled in when requested with `include_total`.
+    """
+
+    items: list[MessageResponse]
+    next_cursor: int | None
+    has_more: bool
+    approximate_total: int | None = None
+    total_is_capped: bool | None = None
+
+
 class MessageWithFilesResponse(MessageResponse):
     """Message response including user-uploaded attachments.
 
@@ -62,6 +62,52 @@ class RunClaimResponse(BaseModel):
     sdk_session_id: str | None = None
 
 
+class RunBatchClaimRequest(BaseModel):
+    """Claim up to `max_runs` runs in one request."""
+
+    worker_id: str
+    max_runs: int = Field(default=1, ge=1, le=100)
+    lease_seconds: int = 30
+    schedule_modes: list[str] | None = None
+    # Long-poll: when nothing is claimable, wait up to this long for a run to be
+    # enqueued/become due before returning an empty batch.
+    wait_seconds: float = Field(default=0, ge=0, le=60)
+
+
+class RunBatchClaimResponse(BaseModel):
+    """Batch claim response; `runs` is empty when nothing is available."""
+
+    runs: list[RunClaimResponse] = Field(default_factory=list)
+
+
+class RunWaitRequest(BaseModel):
+    """Long-poll until a run is claimable, without claiming it."""
+
+    schedule_modes: list[str] | None = None
+    wait_seconds: float = Field(default=20, ge=0, le=60)
+
+
+class RunWaitResponse(BaseModel):
+    """Wait result; `available` is false when the wait timed out."""
+
+    available: bool = False
+
+
+class RunHeartbeatRequest(BaseModel):
+    """Renew the claim leases of runs a worker is still dispatching."""
+
+    worker_id: str
+    run_ids: list[UUID] = Field(default_factory=list, max_length=500)
+    lease_seconds: int = 30
+
+
+class RunHeartbeatResponse(BaseModel):
+    """Heartbeat result; `lost` runs are no longer claimed by the worker."""
+
+    renewed: list[UUID] = Field(default_factory=list)
+    lost: list[UUID] = Field(default_factory=list)
+
+
 class RunStartRequest(BaseModel):
     """Mark run as running request."""
 
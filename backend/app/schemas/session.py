@@ -49,6 +49,7 @@ class SessionUpdateRequest(BaseModel):
     workspace_archive_url: str | None = None
     project_id: UUID | None = None
     state_patch: dict[str, Any] | None = None
+    state_version: int | None = None
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
     workspace_archive_key: str | None = None
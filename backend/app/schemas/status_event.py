@@ -0,0 +1,32 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class StatusEventResponse(BaseModel):
+    """One session or run status transition."""
+
+    event_id: int
+    session_id: UUID
+    run_id: UUID | None = None
+    entity: str
+    status: str
+    session_status: str
+    title: str | None = None
+    last_error: str | None = None
+    created_at: datetime
+
+
+class StatusEventPageResponse(BaseModel):
+    """Page of the status change feed.
+
+    Pass `next_cursor` back as `since`. Ids are assigned when a transition is written,
+    so a transaction that commits late can surface an id below the cursor; consumers
+    that cannot miss events should also re-read a recent time window
+    (`since=0&lookback_seconds=N`).
+    """
+
+    items: list[StatusEventResponse]
+    next_cursor: int
+    has_more: bool
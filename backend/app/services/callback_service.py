@@ -1,17 +1,22 @@
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.models.agent_message import AgentMessage
 from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
+from app.models.tool_execution import ToolExecution
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.tool_execution_repository import ToolExecutionRepository
 from app.repositories.usage_log_repository import UsageLogRepository
 from app.schemas.callback import (
     AgentCallbackRequest,
+    AgentStateDelta,
     CallbackResponse,
     CallbackStatus,
 )
@@ -93,7 +98,16 @@ class CallbackService:
         message: dict[str, Any],
         session_id: uuid.UUID,
         message_id: int,
+        tool_executions: dict[str, ToolExecution],
+        seen_at: dict[str, datetime],
     ) -> None:
+        """Upsert tool executions for one message.
+
+        `tool_executions` holds the rows already loaded or created in this batch, keyed by
+        tool_use_id, so a ToolUseBlock and its ToolResultBlock arriving in the same batch
+        update one row without further queries. `seen_at` records when rows created in
+        this batch were first reported (their created_at is not populated until commit).
+        """
         content = message.get("content", [])
         if not isinstance(content, list):
             return
@@ -112,11 +126,7 @@ class CallbackService:
                 if not tool_use_id or not tool_name:
                     continue
 
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
-                    session_id=session_id,
-                    tool_use_id=tool_use_id,
-                )
+                existing = tool_executions.get(tool_use_id)
                 if existing:
                     existing.tool_name = tool_name
                     existing.tool_input = tool_input
@@ -126,7 +136,7 @@ class CallbackService:
                     )
                     continue
 
-                ToolExecutionRepository.create(
+                tool_executions[tool_use_id] = ToolExecutionRepository.create(
                     session_db=session_db,
                     session_id=session_id,
                     message_id=message_id,
@@ -134,6 +144,7 @@ class CallbackService:
                     tool_name=tool_name,
                     tool_input=tool_input,
                 )
+                seen_at[tool_use_id] = datetime.now(timezone.utc)
                 logger.debug(
                     f"Created tool execution (tool_use_id={tool_use_id}, tool={tool_name}) in message {message_id}"
                 )
@@ -149,14 +160,10 @@ class CallbackService:
                 # Persist an explicit tool_output payload even when the tool returns an empty/None content.
                 # This lets the UI reliably treat the tool step as "done" once a ToolResultBlock arrives.
                 tool_output = {"content": result_content}
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
-                    session_id=session_id,
-                    tool_use_id=tool_use_id,
-                )
+                existing = tool_executions.get(tool_use_id)
 
                 if not existing:
-                    ToolExecutionRepository.create(
+                    tool_executions[tool_use_id] = ToolExecutionRepository.create(
                         session_db=session_db,
                         session_id=session_id,
                         message_id=message_id,
@@ -175,18 +182,44 @@ class CallbackService:
                 existing.result_message_id = message_id
                 existing.is_error = bool(is_error)
 
-                if existing.duration_ms is None and existing.created_at is not None:
-                    duration = datetime.now(timezone.utc) - existing.created_at
+                started_at = existing.created_at or seen_at.get(tool_use_id)
+                if existing.duration_ms is None and started_at is not None:
+                    duration = datetime.now(timezone.utc) - started_at
                     existing.duration_ms = int(duration.total_seconds() * 1000)
 
                 logger.debug(
                     f"Updated tool execution result (tool_use_id={tool_use_id}) in message {message_id}"
                 )
 
-    def _extract_and_persist_usage(
-        self, db: Session, session_id: uuid.UUID, message: dict[str, Any]
+    @staticmethod
+    def _collect_tool_use_ids(messages: list[dict[str, Any]]) -> list[str]:
+        ids: list[str] = []
+        for message in messages:
+            content = message.get("content", [])
+            if not isinstance(content, list):
+                continue
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                block_type = block.get("_type", "")
+                if "ToolUseBlock" in block_type:
+                    tool_use_id = block.get("id")
+                elif "ToolResultBlock" in block_type:
+                    tool_use_id = block.get("tool_use_id")
+                else:
+                    continue
+                if isinstance(tool_use_id, str) and tool_use_id:
+                    ids.append(tool_use_id)
+        return list(dict.fromkeys(ids))
+
+    def _persist_usage(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        message: dict[str, Any],
+        db_run: AgentRun | None,
     ) -> None:
-        """Extracts and persists usage data from a ResultMessage."""
+        """Persists usage data from a ResultMessage (does not commit)."""
         message_type = message.get("_type", "")
 
         if "ResultMessage" not in message_type:
@@ -200,14 +233,6 @@ class CallbackService:
         total_cost_usd = message.get("total_cost_usd")
         duration_ms = message.get("duration_ms")
 
-        db_run = (
-            db.query(AgentRun)
-            .filter(AgentRun.session_id == session_id)
-            .filter(AgentRun.status.in_(["claimed", "running"]))
-            .order_by(AgentRun.created_at.desc())
-            .first()
-        )
-
         UsageLogRepository.create(
             session_db=db,
             session_id=session_id,
@@ -216,7 +241,6 @@ class CallbackService:
             duration_ms=duration_ms,
             usage_json=usage_data,
         )
-        db.commit()
 
         input_tokens = usage_data.get("input_tokens")
         output_tokens = usage_data.get("output_tokens")
@@ -233,116 +257,204 @@ class CallbackService:
             },
         )
 
-    def _persist_message_and_tools(
-        self, db: Session, session_id: uuid.UUID, message: dict[str, Any]
-    ) -> None:
-        role = self._extract_role_from_message(message)
-
-        text_preview = None
+    @staticmethod
+    def _text_preview(message: dict[str, Any]) -> str | None:
         content = message.get("content", [])
         if isinstance(content, list) and len(content) > 0:
             for block in content:
                 if isinstance(block, dict) and "TextBlock" in block.get("_type", ""):
-                    text_preview = block.get("text", "")[:500]
-                    break
-
-        db_message = MessageRepository.create(
-            session_db=db,
-            session_id=session_id,
-            role=role,
-            content=message,
-            text_preview=text_preview,
-        )
-
-        db.flush()
+                    return block.get("text", "")[:500]
+        return None
 
-        self._extract_tool_executions(db, message, session_id, db_message.id)
+    def _build_session_update(
+        self, db_session: AgentSession, callbacks: list[AgentCallbackRequest]
+    ) -> dict[str, Any]:
+        """Merge the session field updates of consecutive callbacks (last one wins)."""
+        update_data: dict[str, Any] = {}
+        sdk_session_id = db_session.sdk_session_id
+        state = db_session.state_patch
+        state_version = db_session.state_version
+        for callback in callbacks:
+            derived_sdk_session_id = callback.sdk_session_id
+            if (
+                not derived_sdk_session_id
+                and callback.new_message
+                and isinstance(callback.new_message, dict)
+            ):
+                derived_sdk_session_id = self._extract_sdk_session_id_from_message(
+                    callback.new_message
+                )
+            if derived_sdk_session_id and derived_sdk_session_id != sdk_session_id:
+                update_data["sdk_session_id"] = derived_sdk_session_id
+                sdk_session_id = derived_sdk_session_id
 
-        db.commit()
-        logger.debug(
-            "message_persisted",
-            extra={
-                "session_id": str(session_id),
-                "message_id": db_message.id,
-                "role": role,
-            },
+            if callback.status in [CallbackStatus.COMPLETED, CallbackStatus.FAILED]:
+                update_data["status"] = callback.status.value
+
+            if callback.state_patch is not None:
+                state = callback.state_patch.model_dump(mode="json")
+                state_version = callback.state_version
+                update_data["state_patch"] = state
+                update_data["state_version"] = state_version
+            elif callback.state_delta is not None:
+                delta = callback.state_delta
+                if state is None or state_version != delta.base_version:
+                    # A delta was lost or reordered; the next full snapshot resyncs.
+                    logger.warning(
+                        "callback_state_delta_skipped",
+                        extra={
+                            "session_id": str(db_session.id),
+                            "state_version": state_version,
+                            "base_version": delta.base_version,
+                        },
+                    )
+                else:
+                    state = self._apply_state_delta(state, delta)
+                    state_version = callback.state_version
+                    update_data["state_patch"] = state
+                    update_data["state_version"] = state_version
+
+            if callback.workspace_files_prefix is not None:
+                update_data["workspace_files_prefix"] = callback.workspace_files_prefix
+            if callback.workspace_manifest_key is not None:
+                update_data["workspace_manifest_key"] = callback.workspace_manifest_key
+            if callback.workspace_archive_key is not None:
+                update_data["workspace_archive_key"] = callback.workspace_archive_key
+            if callback.workspace_export_status is not None:
+                update_data["workspace_export_status"] = (
+                    callback.workspace_export_status
+                )
+        return update_data
+
+    @staticmethod
+    def _apply_state_delta(
+        state: dict[str, Any], delta: AgentStateDelta
+    ) -> dict[str, Any]:
+        """Return a copy of a stored state_patch with a delta applied."""
+        updated = dict(state)
+        dumped = delta.model_dump(mode="json")
+        for name in delta.changed:
+            if name == "workspace_state":
+                continue
+            if name in dumped:
+                updated[name] = dumped[name]
+
+        if "workspace_state" not in delta.changed:
+            return updated
+        workspace_delta = dumped["workspace_state"]
+        if workspace_delta is None:
+            updated["workspace_state"] = None
+            return updated
+
+        workspace = dict(updated.get("workspace_state") or {})
+        # Entries are grouped by path: an upsert replaces all entries of its path.
+        file_changes: dict[str, list[dict[str, Any]]] = {}
+        for item in workspace.get("file_changes") or []:
+            file_changes.setdefault(item["path"], []).append(item)
+        for path in workspace_delta["file_changes_removed"]:
+            file_changes.pop(path, None)
+        upserted: dict[str, list[dict[str, Any]]] = {}
+        for item in workspace_delta["file_changes_upsert"]:
+            upserted.setdefault(item["path"], []).append(item)
+        file_changes.update(upserted)
+        items = [item for group in file_changes.values() for item in group]
+        workspace.update(
+            repository=workspace_delta["repository"],
+            branch=workspace_delta["branch"],
+            last_change=workspace_delta["last_change"],
+            file_changes=items,
+            total_added_lines=sum(item.get("added_lines") or 0 for item in items),
+            total_deleted_lines=sum(item.get("deleted_lines") or 0 for item in items),
         )
+        updated["workspace_state"] = workspace
+        return updated
 
-    def process_agent_callback(
-        self, db: Session, callback: AgentCallbackRequest
-    ) -> CallbackResponse:
+    @staticmethod
+    def _get_active_run(db: Session, session_id: uuid.UUID) -> AgentRun | None:
+        db_run = (
+            db.query(AgentRun)
+            .filter(AgentRun.session_id == session_id)
+            .filter(AgentRun.status.in_(["claimed", "running"]))
+            .order_by(AgentRun.created_at.desc())
+            .first()
+        )
+        # The identity map may hold a newer in-memory status from earlier in the batch.
+        if db_run and db_run.status not in ("claimed", "running"):
+            return None
+        return db_run
+
+    @staticmethod
+    def _apply_run_progress(db_run: AgentRun, callback: AgentCallbackRequest) -> None:
+        db_run.progress = int(callback.progress or 0)
+
+        if callback.status == CallbackStatus.RUNNING and db_run.status == "claimed":
+            db_run.status = "running"
+            if db_run.started_at is None:
+                db_run.started_at = datetime.now(timezone.utc)
+
+        if callback.status in [CallbackStatus.COMPLETED, CallbackStatus.FAILED]:
+            db_run.status = callback.status.value
+            db_run.finished_at = datetime.now(timezone.utc)
+            if callback.status == CallbackStatus.COMPLETED:
+                db_run.progress = 100
+                db_run.last_error = None
+            elif callback.status == CallbackStatus.FAILED:
+                if callback.error_message:
+                    db_run.last_error = callback.error_message
+
+    def _ingest_session_callbacks(
+        self,
+        db: Session,
+        callback_session_id: str,
+        callbacks: list[AgentCallbackRequest],
+    ) -> tuple[CallbackResponse, int]:
+        """Apply one session's callbacks in order. Does not commit.
+
+        Returns:
+            (response shared by the session's callbacks, number of messages persisted)
+        """
         session_service = SessionService()
         db_session = session_service.find_session_by_sdk_id_or_uuid(
-            db, callback.session_id
+            db, callback_session_id
         )
 
         if not db_session:
             logger.warning(
                 "callback_session_not_found",
-                extra={"callback_session_id": callback.session_id},
+                extra={"callback_session_id": callback_session_id},
             )
-            return CallbackResponse(
-                session_id=callback.session_id,
-                status="callback_received",
-                message="Session not found yet",
+            return (
+                CallbackResponse(
+                    session_id=callback_session_id,
+                    status="callback_received",
+                    message="Session not found yet",
+                ),
+                0,
             )
 
         # Once a session is canceled, ignore subsequent callbacks so we don't keep
         # persisting new messages/tool executions for a task that the user asked to stop.
         if db_session.status == "canceled":
-            return CallbackResponse(
-                session_id=str(db_session.id),
-                status=db_session.status,
-                callback_status=callback.status,
-            )
-
-        derived_sdk_session_id = callback.sdk_session_id
-        if (
-            not derived_sdk_session_id
-            and callback.new_message
-            and isinstance(callback.new_message, dict)
-        ):
-            derived_sdk_session_id = self._extract_sdk_session_id_from_message(
-                callback.new_message
+            return (
+                CallbackResponse(
+                    session_id=str(db_session.id),
+                    status=db_session.status,
+                    callback_status=callbacks[-1].status,
+                ),
+                0,
             )
 
-        update_data: dict[str, Any] = {}
-
-        if (
-            derived_sdk_session_id
-            and derived_sdk_session_id != db_session.sdk_session_id
-        ):
-            update_data["sdk_session_id"] = derived_sdk_session_id
-
-        # Do not override a user-canceled session back to completed/failed.
-        if db_session.status != "canceled" and callback.status in [
-            CallbackStatus.COMPLETED,
-            CallbackStatus.FAILED,
-        ]:
-            update_data["status"] = callback.status.value
-
-        if callback.state_patch is not None:
-            update_data["state_patch"] = callback.state_patch.model_dump(mode="json")
-
-        if callback.workspace_files_prefix is not None:
-            update_data["workspace_files_prefix"] = callback.workspace_files_prefix
-        if callback.workspace_manifest_key is not None:
-            update_data["workspace_manifest_key"] = callback.workspace_manifest_key
-        if callback.workspace_archive_key is not None:
-            update_data["workspace_archive_key"] = callback.workspace_archive_key
-        if callback.workspace_export_status is not None:
-            update_data["workspace_export_status"] = callback.workspace_export_status
-
+        update_data = self._build_session_update(db_session, callbacks)
         if update_data:
             db_session = session_service.update_session(
-                db, db_session.id, SessionUpdateRequest(**update_data)
+                db, db_session.id, SessionUpdateRequest(**update_data), commit=False
             )
             if "sdk_session_id" in update_data:
                 logger.info(
                     "session_sdk_session_id_updated",
                     extra={
                         "session_id": str(db_session.id),
-                        "sdk_session_id": derived_sdk_session_id,
+                        "sdk_session_id": update_data["sdk_session_id"],
                     },
                 )
             if "status" in update_data:
@@ -350,47 +462,167 @@ class CallbackService:
                     "session_status_updated_via_callback",
                     extra={
                         "session_id": str(db_session.id),
-                        "status": callback.status.value,
-                        "callback_session_id": callback.session_id,
+                        "status": update_data["status"],
+                        "callback_session_id": callback_session_id,
                     },
                 )
 
-        if callback.new_message:
-            self._persist_message_and_tools(db, db_session.id, callback.new_message)
-            # Extract and persist usage data if this is a ResultMessage
-            self._extract_and_persist_usage(db, db_session.id, callback.new_message)
+        # Insert all messages first so a single flush assigns their ids.
+        messages: list[tuple[AgentCallbackRequest, AgentMessage]] = []
+        for callback in callbacks:
+            if not callback.new_message:
+                continue
+            messages.append(
+                (
+                    callback,
+                    MessageRepository.create(
+                        session_db=db,
+                        session_id=db_session.id,
+                        role=self._extract_role_from_message(callback.new_message),
+                        content=callback.new_message,
+                        text_preview=self._text_preview(callback.new_message),
+                    ),
+                )
+            )
+        if messages:
+            db.flush()
 
-        db_run = (
-            db.query(AgentRun)
-            .filter(AgentRun.session_id == db_session.id)
-            .filter(AgentRun.status.in_(["claimed", "running"]))
-            .order_by(AgentRun.created_at.desc())
-            .first()
+        tool_use_ids = self._collect_tool_use_ids(
+            [callback.new_message for callback, _ in messages]
         )
+        tool_executions = {
+            item.tool_use_id: item
+            for item in ToolExecutionRepository.list_by_session_and_tool_use_ids(
+                db, db_session.id, tool_use_ids
+            )
+            if item.tool_use_id
+        }
+        seen_at: dict[str, datetime] = {}
+
+        db_run = self._get_active_run(db, db_session.id)
+        touched_run = db_run
+        message_by_callback = {id(callback): row for callback, row in messages}
+        for callback in callbacks:
+            db_message = message_by_callback.get(id(callback))
+            if db_message is not None:
+                self._extract_tool_executions(
+                    db,
+                    callback.new_message,
+                    db_session.id,
+                    db_message.id,
+                    tool_executions,
+                    seen_at,
+                )
+                # Extract and persist usage data if this is a ResultMessage
+                self._persist_usage(db, db_session.id, callback.new_message, db_run)
+                logger.debug(
+                    "message_persisted",
+                    extra={
+                        "session_id": str(db_session.id),
+                        "message_id": db_message.id,
+                        "role": db_message.role,
+                    },
+                )
 
-        if db_run:
-            db_run.progress = int(callback.progress or 0)
+            if db_run:
+                self._apply_run_progress(db_run, callback)
+                if db_run.status not in ("claimed", "running"):
+                    # Later callbacks no longer see a finished run as active.
+                    db_run = None
 
-            if callback.status == CallbackStatus.RUNNING and db_run.status == "claimed":
-                db_run.status = "running"
-                if db_run.started_at is None:
-                    db_run.started_at = datetime.now(timezone.utc)
+        if touched_run:
+            self._sync_scheduled_task_last_status(db, touched_run)
 
-            if callback.status in [CallbackStatus.COMPLETED, CallbackStatus.FAILED]:
-                db_run.status = callback.status.value
-                db_run.finished_at = datetime.now(timezone.utc)
-                if callback.status == CallbackStatus.COMPLETED:
-                    db_run.progress = 100
-                    db_run.last_error = None
-                elif callback.status == CallbackStatus.FAILED:
-                    if callback.error_message:
-                        db_run.last_error = callback.error_message
-
-            self._sync_scheduled_task_last_status(db, db_run)
-            db.commit()
+        return (
+            CallbackResponse(
+                session_id=str(db_session.id),
+                status=db_session.status,
+                callback_status=callbacks[-1].status,
+            ),
+            len(messages),
+        )
+
+    def process_agent_callbacks(
+        self, db: Session, callbacks: list[AgentCallbackRequest]
+    ) -> list[CallbackResponse]:
+        """Apply a batch of callbacks with a single commit.
 
-        return CallbackResponse(
-            session_id=str(db_session.id),
-            status=db_session.status,
-            callback_status=callback.status,
+        Callbacks are grouped per session and applied in their original order, so the
+        result matches applying them one by one. If the batch fails, each callback is
+        retried in its own transaction so one bad payload does not drop the rest.
+        """
+        if not callbacks:
+            return []
+
+        started = time.perf_counter()
+        groups: dict[str, list[int]] = {}
+        for index, callback in enumerate(callbacks):
+            groups.setdefault(callback.session_id, []).append(index)
+
+        responses: list[CallbackResponse | None] = [None] * len(callbacks)
+        messages_persisted = 0
+        try:
+            for callback_session_id, indexes in groups.items():
+                response, persisted = self._ingest_session_callbacks(
+                    db, callback_session_id, [callbacks[i] for i in indexes]
+                )
+                messages_persisted += persisted
+                for i in indexes:
+                    responses[i] = response.model_copy(
+                        update={"callback_status": callbacks[i].status}
+                    )
+            db.commit()
+        except Exception:
+            db.rollback()
+            if len(callbacks) == 1:
+                raise
+            logger.exception(
+                "callback_batch_failed_retrying_individually",
+                extra={"batch_size": len(callbacks)},
+            )
+            return [self._process_single_safely(db, callback) for callback in callbacks]
+
+        now = datetime.now(timezone.utc)
+        lags_ms = [
+            max(0, int((now - callback.time).total_seconds() * 1000))
+            for callback in callbacks
+            if callback.time.tzinfo is not None
+        ]
+        logger.info(
+            "timing",
+            extra={
+                "step": "callback_ingest_batch",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                "batch_size": len(callbacks),
+                "sessions": len(groups),
+                "messages_persisted": messages_persisted,
+                "ingest_lag_ms_max": max(lags_ms) if lags_ms else None,
+                "ingest_lag_ms_avg": (
+                    int(sum(lags_ms) / len(lags_ms)) if lags_ms else None
+                ),
+            },
         )
+        return [response for response in responses if response is not None]
+
+    def _process_single_safely(
+        self, db: Session, callback: AgentCallbackRequest
+    ) -> CallbackResponse:
+        try:
+            return self.process_agent_callbacks(db, [callback])[0]
+        except Exception as exc:
+            db.rollback()
+            logger.exception(
+                "callback_ingest_failed",
+                extra={"callback_session_id": callback.session_id},
+            )
+            return CallbackResponse(
+                session_id=callback.session_id,
+                status="error",
+                callback_status=callback.status,
+                message=str(exc),
+            )
+
+    def process_agent_callback(
+        self, db: Session, callback: AgentCallbackRequest
+    ) -> CallbackResponse:
+        return self.process_agent_callbacks(db, [callback])[0]
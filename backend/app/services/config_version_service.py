@@ -0,0 +1,68 @@
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.env_var import UserEnvVar
+from app.models.mcp_server import McpServer
+from app.models.plugin import Plugin
+from app.models.skill import Skill
+from app.models.slash_command import SlashCommand
+from app.models.sub_agent import SubAgent
+from app.models.user_mcp_install import UserMcpInstall
+from app.models.user_plugin_install import UserPluginInstall
+from app.models.user_skill_install import UserSkillInstall
+from app.repositories.config_version_repository import ConfigVersionRepository
+from app.services.env_var_service import SYSTEM_USER_ID
+
+
+class ConfigVersionService:
+    """Version stamps for the per-user configuration resolved at execution time.
+
+    Executor Manager caches resolved configs and compares these stamps to decide
+    whether a cached entry is still valid. A stamp changes whenever any row that can
+    affect the resolved value is inserted, updated or deleted.
+    """
+
+    def get_versions(self, db: Session, user_id: str) -> dict[str, str]:
+        stamp = ConfigVersionRepository.get_stamp
+        return {
+            "env_vars": stamp(
+                db,
+                UserEnvVar,
+                UserEnvVar.user_id.in_([user_id, SYSTEM_USER_ID]),
+            ),
+            "mcp": "|".join(
+                [
+                    stamp(
+                        db,
+                        McpServer,
+                        or_(
+                            McpServer.owner_user_id == user_id,
+                            McpServer.scope == "system",
+                        ),
+                    ),
+                    stamp(db, UserMcpInstall, UserMcpInstall.user_id == user_id),
+                ]
+            ),
+            "skills": "|".join(
+                [
+                    stamp(
+                        db,
+                        Skill,
+                        or_(Skill.owner_user_id == user_id, Skill.scope == "system"),
+                    ),
+                    stamp(db, UserSkillInstall, UserSkillInstall.user_id == user_id),
+                ]
+            ),
+            "plugins": "|".join(
+                [
+                    stamp(
+                        db,
+                        Plugin,
+                        or_(Plugin.owner_user_id == user_id, Plugin.scope == "system"),
+                    ),
+                    stamp(db, UserPluginInstall, UserPluginInstall.user_id == user_id),
+                ]
+            ),
+            "slash_commands": stamp(db, SlashCommand, SlashCommand.user_id == user_id),
+            "subagents": stamp(db, SubAgent, SubAgent.user_id == user_id),
+        }
@@ -7,12 +7,14 @@ from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
 from app.models.agent_message import AgentMessage
 from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
 from app.schemas.input_file import InputFile
 from app.schemas.message import (
     InputFileWithUrl,
+    MessagePageResponse,
     MessageResponse,
     MessageWithFilesResponse,
 )
@@ -24,6 +26,9 @@ logger = logging.getLogger(__name__)
 class MessageService:
     """Service layer for message queries."""
 
+    def __init__(self) -> None:
+        self.settings = get_settings()
+
     def get_messages(self, db: Session, session_id: uuid.UUID) -> list[AgentMessage]:
         """Gets all messages for a session.
 
@@ -38,6 +43,46 @@ class MessageService:
         logger.debug(f"Retrieved {len(messages)} messages for session {session_id}")
         return messages
 
+    def get_messages_page(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_id: int | None,
+        limit: int,
+        include_total: bool = False,
+    ) -> MessagePageResponse:
+        """Gets messages after a cursor (keyset pagination by message id).
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            after_id: Return messages with a greater id; None starts from the beginning
+            limit: Maximum number of messages to return
+            include_total: Also count the session's messages (capped at
+                MESSAGE_COUNT_CAP); pollers paging by cursor leave it off
+
+        Returns:
+            Page with the next cursor, and the capped count when requested
+        """
+        rows = MessageRepository.list_by_session_after(
+            db, session_id, after_id=after_id, limit=limit + 1
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        page = MessagePageResponse(
+            items=[MessageResponse.model_validate(m) for m in rows],
+            next_cursor=rows[-1].id if rows else after_id,
+            has_more=has_more,
+        )
+        if include_total:
+            cap = self.settings.message_count_cap
+            total = MessageRepository.count_by_session_capped(db, session_id, cap)
+            page.approximate_total = total
+            page.total_is_capped = total >= cap
+        return page
+
     def get_message(self, db: Session, message_id: int) -> AgentMessage:
         """Gets a message by ID.
 
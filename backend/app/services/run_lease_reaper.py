@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.repositories.run_repository import RunRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RunLeaseReaper:
+    """Periodically requeues claimed runs whose lease expired.
+
+    Claims used to sweep expired leases themselves, so every poll of every executor
+    manager ran an UPDATE over all claimed runs. Sweeping once per
+    `RUN_LEASE_SWEEP_INTERVAL_SECONDS` keeps that write off the claim path; requeued
+    runs wake long-polling claimers through the run queue notification trigger.
+    """
+
+    def __init__(self) -> None:
+        self.interval_seconds = float(get_settings().run_lease_sweep_interval_seconds)
+        self._task: asyncio.Task[None] | None = None
+        self.sweeps = 0
+        self.failures = 0
+        self.runs_reclaimed = 0
+        self.last_sweep_ms = 0
+        self.max_sweep_ms = 0
+
+    async def start(self) -> None:
+        if self.interval_seconds <= 0:
+            logger.info("run_lease_reaper_disabled")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await run_in_threadpool(self.sweep)
+            except Exception as exc:
+                self.failures += 1
+                logger.warning(f"Run lease sweep failed: {exc}")
+
+    def sweep(self) -> int:
+        """Requeue expired claims once. Returns the number of runs reclaimed."""
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            released = RunRepository.release_expired_claims(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        self.sweeps += 1
+        self.runs_reclaimed += released
+        self.last_sweep_ms = duration_ms
+        self.max_sweep_ms = max(self.max_sweep_ms, duration_ms)
+        if released:
+            logger.info(
+                "timing",
+                extra={
+                    "step": "run_lease_sweep",
+                    "duration_ms": duration_ms,
+                    "runs_reclaimed": released,
+                },
+            )
+        return released
+
+    def get_stats(self) -> dict[str, int | float | bool]:
+        return {
+            "enabled": self.interval_seconds > 0,
+            "interval_seconds": self.interval_seconds,
+            "sweeps": self.sweeps,
+            "failures": self.failures,
+            "runs_reclaimed": self.runs_reclaimed,
+            "last_sweep_ms": self.last_sweep_ms,
+            "max_sweep_ms": self.max_sweep_ms,
+        }
+
+
+run_lease_reaper = RunLeaseReaper()
@@ -1,25 +1,38 @@
+import time
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import TypeVar
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.pg_notify import RUN_QUEUE_CHANNEL, pg_notify_listener
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
 from app.repositories.session_repository import SessionRepository
 from app.schemas.run import (
+    RunBatchClaimRequest,
+    RunBatchClaimResponse,
     RunClaimRequest,
     RunClaimResponse,
     RunFailRequest,
+    RunHeartbeatRequest,
+    RunHeartbeatResponse,
     RunResponse,
     RunStartRequest,
+    RunWaitRequest,
+    RunWaitResponse,
 )
 from app.services.usage_service import UsageService
 
 usage_service = UsageService()
 
+T = TypeVar("T")
+
 
 class RunService:
     """Service layer for run queue operations."""
@@ -157,6 +170,220 @@ class RunService:
             sdk_session_id=db_session.sdk_session_id,
         )
 
+    def claim_run_batch(
+        self, db: Session, request: RunBatchClaimRequest
+    ) -> RunBatchClaimResponse:
+        worker_id = request.worker_id.strip()
+        if not worker_id:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="worker_id cannot be empty",
+            )
+
+        schedule_modes = (
+            [
+                m.strip()
+                for m in request.schedule_modes
+                if isinstance(m, str) and m.strip()
+            ]
+            if request.schedule_modes
+            else None
+        )
+
+        db_runs = RunRepository.claim_batch(
+            session_db=db,
+            worker_id=worker_id,
+            max_runs=request.max_runs,
+            lease_seconds=request.lease_seconds,
+            schedule_modes=schedule_modes,
+        )
+        if not db_runs:
+            db.commit()
+            return RunBatchClaimResponse()
+
+        sessions_by_id = {
+            s.id: s
+            for s in SessionRepository.list_by_ids(
+                db, list({r.session_id for r in db_runs})
+            )
+        }
+        messages_by_id = {
+            m.id: m
+            for m in MessageRepository.list_by_ids(
+                db, list({r.user_message_id for r in db_runs})
+            )
+        }
+
+        # Unlike a single claim, one broken run must not fail (and requeue) the whole
+        # batch: mark it failed so it does not keep getting claimed.
+        now = datetime.now(timezone.utc)
+        claimed: list[dict] = []
+        for db_run in db_runs:
+            db_session = sessions_by_id.get(db_run.session_id)
+            db_message = messages_by_id.get(db_run.user_message_id)
+            prompt = None
+            if db_message is not None:
+                prompt = (
+                    self._extract_prompt_from_message(db_message.content)
+                    or db_message.text_preview
+                )
+
+            error = None
+            if db_session is None:
+                error = f"Session not found: {db_run.session_id}"
+            elif db_message is None:
+                error = f"Message not found: {db_run.user_message_id}"
+            elif not prompt:
+                error = "Unable to extract prompt from message"
+
+            if error:
+                db_run.status = "failed"
+                db_run.last_error = error
+                db_run.finished_at = now
+                db_run.lease_expires_at = None
+                self._sync_scheduled_task_last_status(db, db_run.id)
+                continue
+            claimed.append(
+                {
+                    "run_id": db_run.id,
+                    "user_id": db_session.user_id,
+                    "prompt": prompt,
+                    "config_snapshot": db_run.config_snapshot
+                    or db_session.config_snapshot,
+                    "sdk_session_id": db_session.sdk_session_id,
+                }
+            )
+
+        db.commit()
+
+        # Reload all claimed runs in one query instead of refreshing them one by one.
+        runs_by_id = {
+            r.id: r
+            for r in RunRepository.list_by_ids(db, [c["run_id"] for c in claimed])
+        }
+        return RunBatchClaimResponse(
+            runs=[
+                RunClaimResponse(
+                    run=RunResponse.model_validate(runs_by_id[item["run_id"]]),
+                    user_id=item["user_id"],
+                    prompt=item["prompt"],
+                    config_snapshot=item["config_snapshot"],
+                    sdk_session_id=item["sdk_session_id"],
+                )
+                for item in claimed
+                if item["run_id"] in runs_by_id
+            ]
+        )
+
+    async def claim_run_batch_wait(
+        self, db: Session, request: RunBatchClaimRequest
+    ) -> RunBatchClaimResponse:
+        """Claim a batch, long-polling up to `request.wait_seconds` while the queue is empty."""
+        return await self._wait_for_queue(
+            db,
+            lambda: self.claim_run_batch(db, request),
+            lambda result: bool(result.runs),
+            request.wait_seconds,
+            request.schedule_modes or None,
+        )
+
+    async def wait_for_runs(
+        self, db: Session, request: RunWaitRequest
+    ) -> RunWaitResponse:
+        """Long-poll up to `request.wait_seconds` until a run is claimable.
+
+        Nothing is claimed: workers call this while they have free capacity and claim with
+        claim-batch once it returns, so no dispatch slot sits idle on the wait.
+        """
+        schedule_modes = (
+            [
+                m.strip()
+                for m in request.schedule_modes
+                if isinstance(m, str) and m.strip()
+            ]
+            if request.schedule_modes
+            else None
+        )
+        available = await self._wait_for_queue(
+            db,
+            lambda: self._has_claimable(db, schedule_modes),
+            bool,
+            request.wait_seconds,
+            schedule_modes,
+        )
+        return RunWaitResponse(available=available)
+
+    async def _wait_for_queue(
+        self,
+        db: Session,
+        attempt: Callable[[], T],
+        is_ready: Callable[[T], bool],
+        wait_seconds: float,
+        schedule_modes: list[str] | None,
+    ) -> T:
+        """Retry `attempt` until `is_ready` or `wait_seconds` runs out.
+
+        The wait is woken by run queue notifications and capped by the next scheduled_at, so
+        a run is seen as soon as it is enqueued or becomes due. No transaction (and no
+        pooled connection) is held while waiting.
+        """
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            # Subscribe before the attempt so a run enqueued in between still wakes us.
+            with pg_notify_listener.subscribe(RUN_QUEUE_CHANNEL) as wakeup:
+                # Database work stays off the event loop; only the wait itself is async.
+                result = await run_in_threadpool(attempt)
+                remaining = deadline - time.monotonic()
+                if is_ready(result) or remaining <= 0:
+                    return result
+
+                next_due = await run_in_threadpool(
+                    self._get_next_due, db, schedule_modes
+                )
+                if next_due is not None:
+                    until_due = (next_due - datetime.now(timezone.utc)).total_seconds()
+                    remaining = min(remaining, max(0.05, until_due))
+
+                await pg_notify_listener.wait(wakeup, remaining)
+
+    @staticmethod
+    def _has_claimable(db: Session, schedule_modes: list[str] | None) -> bool:
+        available = RunRepository.has_claimable(db, schedule_modes)
+        db.rollback()
+        return available
+
+    @staticmethod
+    def _get_next_due(db: Session, schedule_modes: list[str] | None) -> datetime | None:
+        next_due = RunRepository.get_next_scheduled_at(db, schedule_modes)
+        db.rollback()
+        return next_due
+
+    def heartbeat_runs(
+        self, db: Session, request: RunHeartbeatRequest
+    ) -> RunHeartbeatResponse:
+        """Renew the claim leases of runs the worker is still dispatching.
+
+        Runs that were reclaimed, canceled or already started are reported as `lost`
+        (started runs hold no lease, so workers stop heartbeating them after start_run).
+        """
+        worker_id = request.worker_id.strip()
+        if not worker_id:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="worker_id cannot be empty",
+            )
+        lease_seconds = request.lease_seconds if request.lease_seconds > 0 else 30
+
+        run_ids = list(dict.fromkeys(request.run_ids))
+        renewed = RunRepository.renew_leases(db, worker_id, run_ids, lease_seconds)
+        db.commit()
+
+        renewed_set = set(renewed)
+        return RunHeartbeatResponse(
+            renewed=renewed,
+            lost=[run_id for run_id in run_ids if run_id not in renewed_set],
+        )
+
     def start_run(
         self, db: Session, run_id: uuid.UUID, request: RunStartRequest
     ) -> RunResponse:
@@ -429,6 +429,7 @@ class ScheduledTaskService:
 
         # Clear previous execution state so the UI doesn't show stale file changes.
         db_session.state_patch = {}
+        db_session.state_version = None
         db_session.status = "pending"
 
         user_message_content = self._build_user_message_content(prompt)
@@ -64,9 +64,18 @@ class SessionService:
         return db_session
 
     def update_session(
-        self, db: Session, session_id: uuid.UUID, request: SessionUpdateRequest
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        request: SessionUpdateRequest,
+        *,
+        commit: bool = True,
     ) -> AgentSession:
-        """Updates session fields."""
+        """Updates session fields.
+
+        With `commit=False` the changes are only flushed so callers can batch them into
+        a larger transaction.
+        """
         db_session = self.get_session(db, session_id)
         if "project_id" in request.model_fields_set:
             project_id = request.project_id
@@ -106,6 +115,7 @@ class SessionService:
             db_session.workspace_archive_url = request.workspace_archive_url
         if request.state_patch is not None:
             db_session.state_patch = request.state_patch
+            db_session.state_version = request.state_version
         if request.workspace_files_prefix is not None:
             db_session.workspace_files_prefix = request.workspace_files_prefix
         if request.workspace_manifest_key is not None:
@@ -115,6 +125,10 @@ class SessionService:
         if request.workspace_export_status is not None:
             db_session.workspace_export_status = request.workspace_export_status
 
+        if not commit:
+            db.flush()
+            return db_session
+
         db.commit()
         db.refresh(db_session)
 
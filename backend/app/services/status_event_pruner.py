@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.repositories.status_event_repository import StatusEventRepository
+
+logger = logging.getLogger(__name__)
+
+
+class StatusEventPruner:
+    """Periodically deletes status change feed events past their retention.
+
+    The feed is written by triggers on every session/run status change and consumers
+    only read recent events, so older rows are deleted in bounded batches every
+    `STATUS_EVENT_PRUNE_INTERVAL_SECONDS`.
+    """
+
+    batch_size = 10000
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.retention_hours = float(settings.status_event_retention_hours)
+        self.interval_seconds = float(settings.status_event_prune_interval_seconds)
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self.retention_hours <= 0 or self.interval_seconds <= 0:
+            logger.info("status_event_pruner_disabled")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(self.prune)
+            except Exception as exc:
+                logger.warning(f"Status event prune failed: {exc}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def prune(self) -> int:
+        """Delete expired events in batches. Returns the number of deleted events."""
+        started = time.perf_counter()
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.retention_hours)
+        deleted = 0
+        db = SessionLocal()
+        try:
+            while True:
+                count = StatusEventRepository.delete_older_than(
+                    db, cutoff, self.batch_size
+                )
+                db.commit()
+                deleted += count
+                if count < self.batch_size:
+                    break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if deleted:
+            logger.info(
+                "timing",
+                extra={
+                    "step": "status_event_prune",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "deleted": deleted,
+                },
+            )
+        return deleted
+
+
+status_event_pruner = StatusEventPruner()
@@ -0,0 +1,78 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.repositories.status_event_repository import StatusEventRepository
+from app.schemas.status_event import StatusEventPageResponse, StatusEventResponse
+
+logger = logging.getLogger(__name__)
+
+
+class StatusEventService:
+    """Service layer for the session/run status change feed."""
+
+    def list_changes(
+        self,
+        db: Session,
+        user_id: str,
+        *,
+        since: int | None,
+        limit: int,
+        kind: str | None = None,
+        lookback_seconds: int = 0,
+    ) -> StatusEventPageResponse:
+        """Gets status transitions after a cursor.
+
+        Args:
+            db: Database session
+            user_id: Owner of the sessions
+            since: Cursor from a previous page; None returns the current head only
+            limit: Maximum number of events
+            kind: Optional session kind filter
+            lookback_seconds: Only list events written in the last this many seconds
+
+        Returns:
+            Page of events with the cursor to resume from
+        """
+        if since is None:
+            return StatusEventPageResponse(
+                items=[],
+                next_cursor=StatusEventRepository.get_head_id(db),
+                has_more=False,
+            )
+
+        created_after = None
+        if lookback_seconds > 0:
+            created_after = datetime.now(timezone.utc) - timedelta(
+                seconds=lookback_seconds
+            )
+        rows = StatusEventRepository.list_since(
+            db,
+            user_id,
+            since=since,
+            limit=limit + 1,
+            kind=kind,
+            created_after=created_after,
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = [
+            StatusEventResponse(
+                event_id=event.id,
+                session_id=event.session_id,
+                run_id=event.run_id,
+                entity=event.entity,
+                status=event.status,
+                session_status=session_status,
+                title=title,
+                last_error=last_error,
+                created_at=event.created_at,
+            )
+            for event, title, session_status, last_error in rows
+        ]
+        return StatusEventPageResponse(
+            items=items,
+            next_cursor=items[-1].event_id if items else since,
+            has_more=has_more,
+        )
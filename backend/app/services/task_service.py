@@ -208,6 +208,7 @@ class TaskService:
             # Clear previous execution state so the UI doesn't show stale file changes
             # while a new run is queued/starting.
             db_session.state_patch = {}
+            db_session.state_version = None
             if project_id is not None and db_session.project_id != project_id:
                 raise AppException(
                     error_code=ErrorCode.BAD_REQUEST,
@@ -1,10 +1,13 @@
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.pg_notify import USER_INPUT_CHANNEL, pg_notify_listener
 from app.models.user_input_request import UserInputRequest
 from app.repositories.session_repository import SessionRepository
 from app.repositories.user_input_request_repository import UserInputRequestRepository
@@ -63,6 +66,41 @@ class UserInputRequestService:
 
         return UserInputRequestResponse.model_validate(entry)
 
+    async def wait_for_request(
+        self, db: Session, request_id: str, wait_seconds: float
+    ) -> UserInputRequestResponse:
+        """Get a request, long-polling up to `wait_seconds` while it is still pending.
+
+        The wait is woken by the notification for this request and capped by its
+        expires_at, so it returns as soon as the request is answered or expires. No
+        transaction is held while waiting.
+        """
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            # Subscribe before the check so an answer committed in between still wakes us.
+            with pg_notify_listener.subscribe(
+                USER_INPUT_CHANNEL, key=request_id
+            ) as answered:
+                result = await run_in_threadpool(
+                    self._get_request_released, db, request_id
+                )
+                remaining = deadline - time.monotonic()
+                if result.status != "pending" or remaining <= 0:
+                    return result
+
+                until_expiry = (
+                    result.expires_at - datetime.now(timezone.utc)
+                ).total_seconds()
+                remaining = min(remaining, max(0.05, until_expiry))
+                await pg_notify_listener.wait(answered, remaining)
+
+    def _get_request_released(
+        self, db: Session, request_id: str
+    ) -> UserInputRequestResponse:
+        result = self.get_request(db, request_id)
+        db.rollback()
+        return result
+
     def list_pending_for_user(
         self, db: Session, user_id: str, session_id: uuid.UUID | None = None
     ) -> list[UserInputRequestResponse]:
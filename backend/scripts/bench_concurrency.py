@@ -0,0 +1,121 @@
+"""Concurrent request throughput benchmark for the Backend API.
+
+Runs N concurrent clients against one or more endpoints for a fixed duration and
+reports throughput and latency percentiles. Run it against the same database before
+and after a change to compare, e.g.:
+
+    python scripts/bench_concurrency.py --url http://localhost:8000 \\
+        --path /api/v1/sessions --path /api/v1/projects --concurrency 32 --duration 30
+
+`--background-path` keeps a few clients hammering a slow endpoint at the same time,
+which shows whether slow requests stall unrelated ones (event loop blocking).
+Only uses the standard library so it can run from any environment.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _worker(
+    base_url: str,
+    paths: list[str],
+    headers: dict[str, str],
+    stop_at: float,
+    latencies: list[float],
+    errors: list[int],
+    lock: threading.Lock,
+) -> None:
+    index = 0
+    while time.monotonic() < stop_at:
+        path = paths[index % len(paths)]
+        index += 1
+        request = urllib.request.Request(f"{base_url}{path}", headers=headers)
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+            ok = True
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            ok = False
+        elapsed = time.perf_counter() - started
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors.append(1)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--background-path", action="append", default=[])
+    parser.add_argument("--background-concurrency", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--user-id", default="default")
+    args = parser.parse_args()
+
+    paths = args.paths or ["/api/v1/sessions"]
+    headers = {"X-User-Id": args.user_id}
+    latencies: list[float] = []
+    errors: list[int] = []
+    background_latencies: list[float] = []
+    background_errors: list[int] = []
+    lock = threading.Lock()
+    stop_at = time.monotonic() + args.duration
+
+    workers = args.concurrency + (
+        args.background_concurrency if args.background_path else 0
+    )
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in range(args.concurrency):
+            pool.submit(
+                _worker, args.url, paths, headers, stop_at, latencies, errors, lock
+            )
+        if args.background_path:
+            for _ in range(args.background_concurrency):
+                pool.submit(
+                    _worker,
+                    args.url,
+                    args.background_path,
+                    headers,
+                    stop_at,
+                    background_latencies,
+                    background_errors,
+                    lock,
+                )
+    elapsed = time.perf_counter() - started
+
+    def report(label: str, values: list[float], failed: list[int]) -> None:
+        print(
+            f"{label}: {len(values)} ok, {len(failed)} errors, "
+            f"{len(values) / elapsed:.1f} req/s, "
+            f"p50={_percentile(values, 50) * 1000:.1f}ms "
+            f"p95={_percentile(values, 95) * 1000:.1f}ms "
+            f"p99={_percentile(values, 99) * 1000:.1f}ms "
+            f"mean={(statistics.mean(values) if values else 0) * 1000:.1f}ms"
+        )
+
+    print(f"duration={elapsed:.1f}s concurrency={args.concurrency} paths={paths}")
+    report("foreground", latencies, errors)
+    if args.background_path:
+        report("background", background_latencies, background_errors)
+
+
+if __name__ == "__main__":
+    main()
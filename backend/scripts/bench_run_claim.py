@@ -0,0 +1,246 @@
+"""Run claim latency benchmark under concurrent pollers.
+
+Seeds sessions with queued runs (and optionally claimed runs holding live leases),
+then runs N pollers that call `RunService.claim_run_batch` in a loop for a fixed
+duration against `DATABASE_URL`, marking each claimed run completed. Reports claim
+latency percentiles, e.g.:
+
+    cd backend && python scripts/bench_run_claim.py --pollers 32 --duration 30 \\
+        --queued 2000 --claimed 500
+
+`--history N` first bulk-loads N completed runs (sessions of `--history-per-session`
+runs each) so claims run against a run table the size of a long-lived deployment, e.g.
+`--history 2000000`; compare with the claim indexes dropped (`alembic downgrade -1`).
+`--sweep` also runs the expired-lease sweep before every claim, which is what the
+claim path did before the sweep moved to the background reaper. Use Postgres: SQLite
+ignores FOR UPDATE SKIP LOCKED. Seeded rows are deleted afterwards unless `--keep`.
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import delete, insert, text  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.agent_message import AgentMessage  # noqa: E402
+from app.models.agent_run import AgentRun  # noqa: E402
+from app.models.agent_session import AgentSession  # noqa: E402
+from app.repositories.run_repository import RunRepository  # noqa: E402
+from app.schemas.run import RunBatchClaimRequest  # noqa: E402
+from app.services.run_service import RunService  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(user_id: str, *, queued: int, claimed: int) -> None:
+    """Create one session per run: `queued` claimable runs, `claimed` leased ones."""
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        for index in range(queued + claimed):
+            session = AgentSession(user_id=user_id, status="pending")
+            db.add(session)
+            db.flush()
+            message = AgentMessage(
+                session_id=session.id,
+                role="user",
+                content={"type": "text", "text": "bench"},
+                text_preview="bench",
+            )
+            db.add(message)
+            db.flush()
+            run = RunRepository.create(db, session.id, message.id, scheduled_at=now)
+            if index >= queued:
+                run.status = "claimed"
+                run.claimed_by = "bench-holder"
+                run.lease_expires_at = now + timedelta(hours=1)
+            if index % 500 == 0:
+                db.commit()
+        db.commit()
+    finally:
+        db.close()
+
+
+def seed_history(user_id: str, *, runs: int, per_session: int) -> None:
+    """Bulk-insert `runs` completed runs, `per_session` per session."""
+    now = datetime.now(timezone.utc)
+    per_session = max(1, per_session)
+    db = SessionLocal()
+    try:
+        remaining = runs
+        while remaining > 0:
+            count = min(per_session, remaining)
+            session = AgentSession(user_id=user_id, status="completed")
+            db.add(session)
+            db.flush()
+            message = AgentMessage(
+                session_id=session.id,
+                role="user",
+                content={"type": "text", "text": "bench"},
+                text_preview="bench",
+            )
+            db.add(message)
+            db.flush()
+            db.execute(
+                insert(AgentRun),
+                [
+                    {
+                        "session_id": session.id,
+                        "user_message_id": message.id,
+                        "status": "completed",
+                        "scheduled_at": now - timedelta(minutes=remaining - offset),
+                        "finished_at": now,
+                        "progress": 100,
+                    }
+                    for offset in range(count)
+                ],
+            )
+            remaining -= count
+            db.commit()
+    finally:
+        db.close()
+
+
+def analyze() -> None:
+    """Refresh planner statistics so the seeded table is planned like a real one."""
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("ANALYZE agent_runs"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def cleanup(user_id: str) -> None:
+    db = SessionLocal()
+    try:
+        session_ids = [
+            s.id for s in db.query(AgentSession.id).filter_by(user_id=user_id).all()
+        ]
+        for start in range(0, len(session_ids), 1000):
+            chunk = session_ids[start : start + 1000]
+            db.execute(delete(AgentRun).where(AgentRun.session_id.in_(chunk)))
+            db.execute(delete(AgentMessage).where(AgentMessage.session_id.in_(chunk)))
+            db.execute(delete(AgentSession).where(AgentSession.id.in_(chunk)))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _poller(
+    worker_id: str,
+    max_runs: int,
+    sweep: bool,
+    stop_at: float,
+    latencies: list[float],
+    claimed: list[int],
+    lock: threading.Lock,
+) -> None:
+    service = RunService()
+    request = RunBatchClaimRequest(worker_id=worker_id, max_runs=max_runs)
+    local_latencies: list[float] = []
+    local_claimed = 0
+    while time.monotonic() < stop_at:
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            if sweep:
+                RunRepository.release_expired_claims(db)
+            result = service.claim_run_batch(db, request)
+            local_latencies.append(time.perf_counter() - started)
+            local_claimed += len(result.runs)
+            # Finish the claimed runs so their sessions do not stay blocked.
+            run_ids = [claim.run.run_id for claim in result.runs]
+            for run in RunRepository.list_by_ids(db, run_ids):
+                run.status = "completed"
+                run.lease_expires_at = None
+            db.commit()
+        finally:
+            db.close()
+    with lock:
+        latencies.extend(local_latencies)
+        claimed.append(local_claimed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pollers", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--max-runs", type=int, default=4)
+    parser.add_argument("--queued", type=int, default=1000)
+    parser.add_argument("--claimed", type=int, default=0)
+    parser.add_argument("--history", type=int, default=0)
+    parser.add_argument("--history-per-session", type=int, default=1000)
+    parser.add_argument("--sweep", action="store_true")
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    user_id = f"bench-{uuid.uuid4().hex[:8]}"
+    started = time.perf_counter()
+    if args.history:
+        seed_history(user_id, runs=args.history, per_session=args.history_per_session)
+    seed(user_id, queued=args.queued, claimed=args.claimed)
+    analyze()
+    print(
+        f"seeded user={user_id} history={args.history} queued={args.queued} "
+        f"claimed={args.claimed} in {time.perf_counter() - started:.1f}s"
+    )
+
+    latencies: list[float] = []
+    claimed: list[int] = []
+    lock = threading.Lock()
+    stop_at = time.monotonic() + args.duration
+    threads = [
+        threading.Thread(
+            target=_poller,
+            args=(
+                f"bench-{index}",
+                args.max_runs,
+                args.sweep,
+                stop_at,
+                latencies,
+                claimed,
+                lock,
+            ),
+        )
+        for index in range(args.pollers)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if not args.keep:
+            cleanup(user_id)
+
+    if not latencies:
+        print("no claims completed")
+        return
+    print(
+        f"pollers={args.pollers} sweep={args.sweep} history={args.history} "
+        f"claims={len(latencies)} "
+        f"runs_claimed={sum(claimed)} "
+        f"throughput={len(latencies) / args.duration:.1f}/s\n"
+        f"latency p50={_percentile(latencies, 50) * 1000:.2f}ms "
+        f"p95={_percentile(latencies, 95) * 1000:.2f}ms "
+        f"p99={_percentile(latencies, 99) * 1000:.2f}ms "
+        f"mean={statistics.mean(latencies) * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
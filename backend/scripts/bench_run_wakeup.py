@@ -0,0 +1,240 @@
+"""Run enqueue-to-claim latency benchmark: interval polling vs long-poll wakeups.
+
+Enqueues `--runs` runs (one session each) at random gaps averaging `--gap` seconds
+against `DATABASE_URL` and claims them with a single claimer, measuring the time from
+the enqueue commit to the claim, e.g.:
+
+    cd backend && python scripts/bench_run_wakeup.py --runs 50 --gap 0.5 \\
+        --interval 2 --wait-seconds 20
+
+`interval` claims with `RunService.claim_run_batch` every `--interval` seconds, like
+the executor manager's interval pull rules; `wait` long-polls `RunService.wait_for_runs`
+(TASK_PULL_WAIT_SECONDS) and claims as soon as it returns. `--mode both` (default)
+runs them one after the other. Runs use their own schedule mode, so other queued runs
+are not claimed. Use Postgres migrated to head: the wakeups come from the run queue
+NOTIFY trigger. Seeded rows are deleted afterwards unless `--keep`.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import delete  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.pg_notify import pg_notify_listener  # noqa: E402
+from app.models.agent_message import AgentMessage  # noqa: E402
+from app.models.agent_run import AgentRun  # noqa: E402
+from app.models.agent_session import AgentSession  # noqa: E402
+from app.repositories.run_repository import RunRepository  # noqa: E402
+from app.schemas.run import RunBatchClaimRequest, RunWaitRequest  # noqa: E402
+from app.services.run_service import RunService  # noqa: E402
+
+BENCH_SCHEDULE_MODE = "bench-wakeup"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def enqueue_one(user_id: str) -> tuple[uuid.UUID, float]:
+    """Create a session with one due run; returns the run id and its commit time."""
+    db = SessionLocal()
+    try:
+        session = AgentSession(user_id=user_id, status="pending")
+        db.add(session)
+        db.flush()
+        message = AgentMessage(
+            session_id=session.id,
+            role="user",
+            content={"type": "text", "text": "bench"},
+            text_preview="bench",
+        )
+        db.add(message)
+        db.flush()
+        run = RunRepository.create(
+            db,
+            session.id,
+            message.id,
+            schedule_mode=BENCH_SCHEDULE_MODE,
+            scheduled_at=datetime.now(timezone.utc),
+        )
+        db.flush()
+        run_id = run.id
+        enqueued_at = time.monotonic()
+        db.commit()
+        return run_id, enqueued_at
+    finally:
+        db.close()
+
+
+def claim_and_complete(
+    service: RunService, request: RunBatchClaimRequest
+) -> tuple[list[uuid.UUID], float]:
+    """Claim a batch and mark it completed; returns the run ids and the claim time."""
+    db = SessionLocal()
+    try:
+        result = service.claim_run_batch(db, request)
+        claimed_at = time.monotonic()
+        run_ids = [claim.run.run_id for claim in result.runs]
+        for run in RunRepository.list_by_ids(db, run_ids):
+            run.status = "completed"
+            run.lease_expires_at = None
+        db.commit()
+        return run_ids, claimed_at
+    finally:
+        db.close()
+
+
+def cleanup(user_id: str) -> None:
+    db = SessionLocal()
+    try:
+        session_ids = [
+            s.id for s in db.query(AgentSession.id).filter_by(user_id=user_id).all()
+        ]
+        for start in range(0, len(session_ids), 1000):
+            chunk = session_ids[start : start + 1000]
+            db.execute(delete(AgentRun).where(AgentRun.session_id.in_(chunk)))
+            db.execute(delete(AgentMessage).where(AgentMessage.session_id.in_(chunk)))
+            db.execute(delete(AgentSession).where(AgentSession.id.in_(chunk)))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _enqueuer(
+    user_id: str,
+    runs: int,
+    gap: float,
+    rng: random.Random,
+    enqueued_at: dict[uuid.UUID, float],
+) -> None:
+    for _ in range(runs):
+        await asyncio.sleep(rng.uniform(0, 2 * gap))
+        run_id, at = await asyncio.to_thread(enqueue_one, user_id)
+        enqueued_at[run_id] = at
+
+
+async def _interval_claimer(
+    service: RunService,
+    request: RunBatchClaimRequest,
+    interval: float,
+    done: Callable[[], bool],
+    claimed_at: dict[uuid.UUID, float],
+) -> None:
+    while not done():
+        run_ids, at = await asyncio.to_thread(claim_and_complete, service, request)
+        for run_id in run_ids:
+            claimed_at[run_id] = at
+        await asyncio.sleep(interval)
+
+
+async def _wait_claimer(
+    service: RunService,
+    request: RunBatchClaimRequest,
+    wait_seconds: float,
+    done: Callable[[], bool],
+    claimed_at: dict[uuid.UUID, float],
+) -> None:
+    wait_request = RunWaitRequest(
+        schedule_modes=request.schedule_modes, wait_seconds=wait_seconds
+    )
+    while not done():
+        db = SessionLocal()
+        try:
+            result = await service.wait_for_runs(db, wait_request)
+        finally:
+            db.close()
+        if not result.available:
+            continue
+        run_ids, at = await asyncio.to_thread(claim_and_complete, service, request)
+        for run_id in run_ids:
+            claimed_at[run_id] = at
+
+
+async def run_mode(mode: str, user_id: str, args: argparse.Namespace) -> list[float]:
+    """Enqueue `args.runs` runs while one claimer drains them; returns the latencies."""
+    service = RunService()
+    request = RunBatchClaimRequest(
+        worker_id=f"bench-{mode}",
+        max_runs=args.max_runs,
+        schedule_modes=[BENCH_SCHEDULE_MODE],
+    )
+    enqueued_at: dict[uuid.UUID, float] = {}
+    claimed_at: dict[uuid.UUID, float] = {}
+
+    def done() -> bool:
+        return len(claimed_at) >= args.runs
+
+    if mode == "interval":
+        claimer = _interval_claimer(service, request, args.interval, done, claimed_at)
+    else:
+        claimer = _wait_claimer(service, request, args.wait_seconds, done, claimed_at)
+    rng = random.Random(args.seed)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                _enqueuer(user_id, args.runs, args.gap, rng, enqueued_at), claimer
+            ),
+            timeout=args.runs * args.gap * 2 + args.wait_seconds + 60,
+        )
+    except asyncio.TimeoutError:
+        print(f"{mode}: timed out with {len(claimed_at)}/{args.runs} runs claimed")
+
+    return [
+        max(0.0, claimed_at[run_id] - at)
+        for run_id, at in enqueued_at.items()
+        if run_id in claimed_at
+    ]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    modes = ["interval", "wait"] if args.mode == "both" else [args.mode]
+    user_id = f"bench-{uuid.uuid4().hex[:8]}"
+    await pg_notify_listener.start()
+    try:
+        for mode in modes:
+            latencies = await run_mode(mode, user_id, args)
+            if not latencies:
+                print(f"{mode}: no runs claimed")
+                continue
+            print(
+                f"mode={mode} interval={args.interval}s wait={args.wait_seconds}s "
+                f"runs={len(latencies)}\n"
+                f"enqueue-to-claim p50={_percentile(latencies, 50) * 1000:.1f}ms "
+                f"p95={_percentile(latencies, 95) * 1000:.1f}ms "
+                f"max={max(latencies) * 1000:.1f}ms "
+                f"mean={statistics.mean(latencies) * 1000:.1f}ms"
+            )
+    finally:
+        await pg_notify_listener.stop()
+        if not args.keep:
+            cleanup(user_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["interval", "wait", "both"], default="both")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--gap", type=float, default=0.5)
+    parser.add_argument("--interval", type=float, default=2.0)
+    parser.add_argument("--wait-seconds", type=float, default=20.0)
+    parser.add_argument("--max-runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
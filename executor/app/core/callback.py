@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from typing import Any
+
 import httpx
 
 from app.schemas.callback import AgentCallbackRequest
@@ -8,23 +12,125 @@ from app.core.observability.request_context import (
     get_trace_id,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CallbackClient:
-    def __init__(self, callback_url: str, timeout: float = 30.0):
-        self.callback_url = callback_url
+    """Posts callbacks to the Executor Manager over one persistent connection.
+
+    Reports passed to `enqueue` are coalesced for `flush_interval` seconds and posted
+    together to `<callback_url>/batch`. `send` drains the queue before posting its own
+    report, so the Executor Manager always receives reports in order.
+    """
+
+    def __init__(
+        self,
+        callback_url: str,
+        timeout: float = 30.0,
+        flush_interval: float = 0.05,
+        max_batch_size: int = 50,
+    ):
+        self.callback_url = callback_url.rstrip("/")
         self.timeout = timeout
+        self.flush_interval = flush_interval
+        self.max_batch_size = max(1, max_batch_size)
+        self.failures = 0
+        self._client: httpx.AsyncClient | None = None
+        self._pending: list[dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._batch_supported = True
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    @staticmethod
+    def _headers() -> dict[str, str]:
+        return {
+            "X-Request-ID": get_request_id() or generate_request_id(),
+            "X-Trace-ID": get_trace_id() or generate_trace_id(),
+        }
+
+    def enqueue(self, report: AgentCallbackRequest) -> None:
+        """Queue a report for the next batch without waiting for delivery."""
+        # Serialise now: the live state objects keep changing while the report waits.
+        self._pending.append(report.model_dump(mode="json"))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        if len(self._pending) < self.max_batch_size:
+            await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> bool:
+        """Deliver every queued report. Returns False if any of them failed."""
+        async with self._lock:
+            return await self._drain_locked()
 
     async def send(self, report: AgentCallbackRequest) -> bool:
+        """Deliver queued reports, then `report`, waiting for the result."""
+        payload = report.model_dump(mode="json")
+        async with self._lock:
+            await self._drain_locked()
+            return await self._post_one(payload)
+
+    async def _drain_locked(self) -> bool:
+        ok = True
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: len(batch)]
+            if not await self._post_batch(batch):
+                ok = False
+        return ok
+
+    async def _post_batch(self, batch: list[dict[str, Any]]) -> bool:
+        if len(batch) == 1 or not self._batch_supported:
+            results = [await self._post_one(payload) for payload in batch]
+            return all(results)
+
+        try:
+            response = await self._get_client().post(
+                f"{self.callback_url}/batch",
+                json={"callbacks": batch},
+                headers=self._headers(),
+            )
+        except httpx.RequestError as exc:
+            logger.warning(f"Failed to send callback batch: {exc}")
+            self.failures += 1
+            return False
+
+        if response.status_code in (404, 405):
+            # Older Executor Manager without the batch endpoint.
+            self._batch_supported = False
+            return await self._post_batch(batch)
+        if not response.is_success:
+            self.failures += 1
+        return response.is_success
+
+    async def _post_one(self, payload: dict[str, Any]) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.callback_url,
-                    json=report.model_dump(mode="json"),
-                    headers={
-                        "X-Request-ID": get_request_id() or generate_request_id(),
-                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                    },
-                )
-                return response.is_success
-        except httpx.RequestError:
+            response = await self._get_client().post(
+                self.callback_url,
+                json=payload,
+                headers=self._headers(),
+            )
+        except httpx.RequestError as exc:
+            logger.warning(f"Failed to send callback: {exc}")
+            self.failures += 1
             return False
+        if not response.is_success:
+            self.failures += 1
+        return response.is_success
+
+    async def aclose(self) -> None:
+        """Deliver queued reports and close the connection."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
@@ -6,7 +6,6 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeAgentOptions
-from claude_agent_sdk.client import ClaudeSDKClient
 from claude_agent_sdk.types import (
     AgentDefinition as SdkAgentDefinition,
     HookContext,
@@ -19,6 +18,12 @@ from claude_agent_sdk.types import (
 )
 from dotenv import load_dotenv
 
+from app.core.sdk_session_pool import (
+    ToolPermissionRouter,
+    WarmSession,
+    config_fingerprint,
+    sdk_session_pool,
+)
 from app.core.workspace import WorkspaceManager
 from app.core.user_input import UserInputClient
 from app.hooks.base import ExecutionContext
@@ -84,9 +89,23 @@ class AgentExecutor:
             },
         )
 
+        fingerprint = config_fingerprint(config)
+        warm: WarmSession | None = await sdk_session_pool.checkout(
+            self.session_id, fingerprint, self.sdk_session_id
+        )
+        logger.info(
+            "sdk_session_checkout",
+            extra={"session_id": self.session_id, "warm": warm is not None},
+        )
+
         try:
-            await self.workspace.prepare(config)
-            ctx.cwd = str(self.workspace.work_path)
+            if warm is not None:
+                # The warm client was started against this workspace; keep it as is.
+                self.workspace = warm.workspace
+                ctx.cwd = warm.cwd
+            else:
+                await self.workspace.prepare(config)
+                ctx.cwd = str(self.workspace.work_path)
             await self.hooks.run_on_setup(ctx)
 
             # Slash commands must be sent as-is (no prefix text), otherwise the SDK may not
@@ -99,11 +118,6 @@ class AgentExecutor:
 
                 prompt = f"{prompt}\n\nCurrent working directory: {ctx.cwd}"
 
-            async def dummy_hook(
-                input_data: HookInput, tool_use_id: str | None, context: HookContext
-            ) -> SyncHookJSONOutput:
-                return {"continue_": True}
-
             normalized_permission_mode = (permission_mode or "default").strip()
             if normalized_permission_mode not in {
                 "default",
@@ -231,75 +245,22 @@ class AgentExecutor:
 
                 return PermissionResultAllow(updated_input=input_data)
 
-            mcp_servers = dict(config.mcp_config or {})
-            if config.browser_enabled:
-                mcp_servers = self._inject_playwright_mcp(mcp_servers)
-
-            agents: dict[str, SdkAgentDefinition] | None = None
-            if config.agents:
-                resolved: dict[str, SdkAgentDefinition] = {}
-                for name, definition in (config.agents or {}).items():
-                    if not isinstance(name, str):
-                        continue
-                    clean_name = name.strip()
-                    if (
-                        not clean_name
-                        or clean_name in {".", ".."}
-                        or not _SUBAGENT_NAME_PATTERN.fullmatch(clean_name)
-                    ):
-                        continue
-                    description = (definition.description or "").strip()
-                    prompt_text = (definition.prompt or "").strip()
-                    if not description or not prompt_text:
-                        continue
-                    resolved[clean_name] = SdkAgentDefinition(
-                        description=description,
-                        prompt=definition.prompt,
-                        tools=definition.tools,
-                        # Subagent model overrides are intentionally unsupported.
-                        model=None,
-                    )
-                agents = resolved or None
-
-            plugins = self._discover_plugins()
-
-            selected_model = (config.model or "").strip()
-            if not selected_model:
-                selected_model = os.environ["DEFAULT_MODEL"]
-
-            options = ClaudeAgentOptions(
-                cwd=ctx.cwd,
-                resume=self.sdk_session_id,
-                # Load both user-level (~/.claude) and project-level (.claude) settings.
-                # Skills are staged into user-level ~/.claude/skills (symlinked to /workspace/.claude_data).
-                setting_sources=["user", "project"],
-                allowed_tools=[
-                    "Skill",
-                    "Read",
-                    "Edit",
-                    "Write",
-                    "Bash",
-                    "TodoWrite",
-                    "Grep",
-                    "Glob",
-                    "Task",
-                ],
-                mcp_servers=mcp_servers,
-                permission_mode=normalized_permission_mode,
-                model=selected_model,
-                can_use_tool=can_use_tool,
-                hooks={"PreToolUse": [HookMatcher(matcher=None, hooks=[dummy_hook])]},
-                agents=agents,
-                plugins=plugins,
-            )
+            if warm is None:
+                warm = await self._start_session(
+                    config,
+                    cwd=ctx.cwd,
+                    fingerprint=fingerprint,
+                    permission_mode=normalized_permission_mode,
+                )
 
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-                async for msg in client.receive_response():
-                    await self.hooks.run_on_response(ctx, msg)
+            warm.router.handler = can_use_tool
+            async for msg in warm.run_turn(prompt, normalized_permission_mode):
+                await self.hooks.run_on_response(ctx, msg)
 
         except Exception as e:
             status = "failed"
+            if warm is not None:
+                warm.broken = True
             logger.exception(
                 "task_failed",
                 extra={
@@ -311,7 +272,10 @@ class AgentExecutor:
 
         finally:
             await self.hooks.run_on_teardown(ctx)
-            await self.workspace.cleanup()
+            if warm is not None:
+                await sdk_session_pool.checkin(warm)
+            else:
+                await self.workspace.cleanup()
             logger.info(
                 "task_finished",
                 extra={
@@ -324,6 +288,106 @@ class AgentExecutor:
             reset_request_id(request_id_token)
             reset_trace_id(trace_id_token)
 
+    async def _start_session(
+        self,
+        config: TaskConfig,
+        *,
+        cwd: str,
+        fingerprint: str,
+        permission_mode: str,
+    ) -> WarmSession:
+        """Connect a new SDK client (CLI, MCP servers, plugins) for this session."""
+        started = time.perf_counter()
+
+        async def dummy_hook(
+            input_data: HookInput, tool_use_id: str | None, context: HookContext
+        ) -> SyncHookJSONOutput:
+            return {"continue_": True}
+
+        mcp_servers = dict(config.mcp_config or {})
+        if config.browser_enabled:
+            mcp_servers = self._inject_playwright_mcp(mcp_servers)
+
+        agents: dict[str, SdkAgentDefinition] | None = None
+        if config.agents:
+            resolved: dict[str, SdkAgentDefinition] = {}
+            for name, definition in (config.agents or {}).items():
+                if not isinstance(name, str):
+                    continue
+                clean_name = name.strip()
+                if (
+                    not clean_name
+                    or clean_name in {".", ".."}
+                    or not _SUBAGENT_NAME_PATTERN.fullmatch(clean_name)
+                ):
+                    continue
+                description = (definition.description or "").strip()
+                prompt_text = (definition.prompt or "").strip()
+                if not description or not prompt_text:
+                    continue
+                resolved[clean_name] = SdkAgentDefinition(
+                    description=description,
+                    prompt=definition.prompt,
+                    tools=definition.tools,
+                    # Subagent model overrides are intentionally unsupported.
+                    model=None,
+                )
+            agents = resolved or None
+
+        plugins = self._discover_plugins()
+
+        selected_model = (config.model or "").strip()
+        if not selected_model:
+            selected_model = os.environ["DEFAULT_MODEL"]
+
+        router = ToolPermissionRouter()
+        options = ClaudeAgentOptions(
+            cwd=cwd,
+            resume=self.sdk_session_id,
+            # Load both user-level (~/.claude) and project-level (.claude) settings.
+            # Skills are staged into user-level ~/.claude/skills (symlinked to /workspace/.claude_data).
+            setting_sources=["user", "project"],
+            allowed_tools=[
+                "Skill",
+                "Read",
+                "Edit",
+                "Write",
+                "Bash",
+                "TodoWrite",
+                "Grep",
+                "Glob",
+                "Task",
+            ],
+            mcp_servers=mcp_servers,
+            permission_mode=permission_mode,
+            model=selected_model,
+            can_use_tool=router,
+            hooks={"PreToolUse": [HookMatcher(matcher=None, hooks=[dummy_hook])]},
+            agents=agents,
+            plugins=plugins,
+        )
+
+        warm = WarmSession(
+            self.session_id,
+            fingerprint,
+            options,
+            self.workspace,
+            cwd,
+            router,
+            sdk_session_id=self.sdk_session_id,
+            permission_mode=permission_mode,
+        )
+        await warm.start()
+        logger.info(
+            "timing",
+            extra={
+                "step": "sdk_session_start",
+                "session_id": self.session_id,
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+            },
+        )
+        return warm
+
     def _build_input_hint(self, config: TaskConfig) -> str | None:
         inputs = config.input_files or []
         if not inputs:
@@ -0,0 +1,289 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+
+from claude_agent_sdk.client import ClaudeSDKClient
+from claude_agent_sdk.types import PermissionResultDeny, ResultMessage
+
+from app.core.workspace import WorkspaceManager
+from app.schemas.request import TaskConfig
+
+logger = logging.getLogger(__name__)
+
+ToolPermissionHandler = Callable[[str, dict[str, Any], Any], Awaitable[Any]]
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.environ.get(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def config_fingerprint(config: TaskConfig) -> str:
+    """Hash of everything that is baked into a running SDK client.
+
+    Per-turn inputs (prompt, input files, permission mode) and secrets are left out;
+    changing anything else starts a fresh client.
+    """
+    payload = config.model_dump(
+        mode="json",
+        include={
+            "repo_url",
+            "git_branch",
+            "model",
+            "browser_enabled",
+            "mcp_config",
+            "skill_files",
+            "plugin_files",
+            "agents",
+        },
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ToolPermissionRouter:
+    """`can_use_tool` callback that forwards to the handler of the current turn.
+
+    The SDK client keeps the callback it was connected with, while plan-mode state
+    and the user input client belong to each turn.
+    """
+
+    def __init__(self) -> None:
+        self.handler: ToolPermissionHandler | None = None
+
+    async def __call__(self, tool_name: str, input_data: dict[str, Any], context: Any):
+        if self.handler is None:
+            return PermissionResultDeny(message="No active turn for this session")
+        return await self.handler(tool_name, input_data, context)
+
+
+_TURN_END = object()
+
+
+class WarmSession:
+    """A connected SDK client (CLI + MCP servers) kept between turns of a session.
+
+    The SDK client must be used from the task that connected it, so one long-lived
+    task owns it and runs the turns submitted through `run_turn`.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        fingerprint: str,
+        options: Any,
+        workspace: WorkspaceManager,
+        cwd: str,
+        router: ToolPermissionRouter,
+        *,
+        sdk_session_id: str | None = None,
+        permission_mode: str = "default",
+    ) -> None:
+        self.session_id = session_id
+        self.fingerprint = fingerprint
+        self.options = options
+        self.workspace = workspace
+        self.cwd = cwd
+        self.router = router
+        self.sdk_session_id = sdk_session_id
+        self.permission_mode = permission_mode
+        self.turns = 0
+        self.broken = False
+        self.last_used = time.monotonic()
+        self._requests: asyncio.Queue[tuple[str, str, asyncio.Queue] | None] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the CLI and MCP servers; raises if the client cannot connect."""
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        await ready
+
+    async def _run(self, ready: asyncio.Future[None]) -> None:
+        client = ClaudeSDKClient(options=self.options)
+        try:
+            await client.connect()
+        except Exception as exc:
+            ready.set_exception(exc)
+            return
+        except BaseException:
+            ready.cancel()
+            raise
+        ready.set_result(None)
+
+        current_mode = self.permission_mode
+        try:
+            while True:
+                request = await self._requests.get()
+                if request is None:
+                    return
+                prompt, permission_mode, output = request
+                try:
+                    if permission_mode != current_mode:
+                        await client.set_permission_mode(permission_mode)
+                        current_mode = permission_mode
+                    await client.query(prompt)
+                    async for message in client.receive_response():
+                        await output.put(message)
+                except Exception as exc:
+                    self.broken = True
+                    await output.put(exc)
+                    return
+                await output.put(_TURN_END)
+        finally:
+            try:
+                await client.disconnect()
+            except Exception:
+                logger.exception(
+                    "sdk_session_disconnect_failed",
+                    extra={"session_id": self.session_id},
+                )
+
+    async def run_turn(self, prompt: str, permission_mode: str) -> AsyncIterator[Any]:
+        """Send a prompt and yield the response messages of this turn."""
+        if self.broken or self._task is None or self._task.done():
+            raise RuntimeError("SDK session is not running")
+        output: asyncio.Queue[Any] = asyncio.Queue()
+        await self._requests.put((prompt, permission_mode, output))
+        finished = False
+        try:
+            while True:
+                item = await output.get()
+                if item is _TURN_END:
+                    finished = True
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                if isinstance(item, ResultMessage):
+                    self.sdk_session_id = item.session_id
+                yield item
+        finally:
+            # An abandoned turn leaves the conversation in an unknown state.
+            if not finished:
+                self.broken = True
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        await self._requests.put(None)
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=10)
+        except Exception:
+            task.cancel()
+            with suppress(BaseException):
+                await task
+
+
+class SdkSessionPool:
+    """Keeps warm SDK clients per session for persistent executor containers.
+
+    A session checks its client out for a turn and checks it back in afterwards. The
+    client is reused only when the config fingerprint and the SDK session id still
+    match; otherwise, after a failed turn, or once idle for
+    `EXECUTOR_WARM_SESSION_IDLE_SECONDS`, it is disconnected and its workspace cleaned
+    up. `EXECUTOR_WARM_SESSION_IDLE_SECONDS=0` disables reuse.
+    """
+
+    def __init__(self) -> None:
+        self.idle_seconds = _env_int("EXECUTOR_WARM_SESSION_IDLE_SECONDS", 1800)
+        self.max_sessions = max(1, _env_int("EXECUTOR_WARM_SESSION_MAX", 4))
+        self._idle: dict[str, WarmSession] = {}
+        self._reaper_task: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.idle_seconds > 0
+
+    async def checkout(
+        self, session_id: str, fingerprint: str, sdk_session_id: str | None
+    ) -> WarmSession | None:
+        """Take the warm client of a session if it can serve this turn."""
+        warm = self._idle.pop(session_id, None)
+        if warm is None:
+            return None
+
+        reason = None
+        if warm.broken:
+            reason = "broken"
+        elif warm.fingerprint != fingerprint:
+            reason = "config_changed"
+        elif warm.sdk_session_id != sdk_session_id:
+            reason = "sdk_session_changed"
+        elif time.monotonic() - warm.last_used > self.idle_seconds:
+            reason = "idle_expired"
+        if reason:
+            await self.close(warm, reason=reason)
+            return None
+
+        return warm
+
+    async def checkin(self, warm: WarmSession) -> None:
+        """Keep a client warm for the next turn of its session."""
+        warm.turns += 1
+        if not self.enabled or warm.broken:
+            await self.close(warm, reason="disabled" if not self.enabled else "broken")
+            return
+        warm.last_used = time.monotonic()
+        warm.router.handler = None
+        previous = self._idle.pop(warm.session_id, None)
+        if previous is not None and previous is not warm:
+            await self.close(previous, reason="replaced")
+        self._idle[warm.session_id] = warm
+
+        while len(self._idle) > self.max_sessions:
+            oldest = min(self._idle.values(), key=lambda item: item.last_used)
+            self._idle.pop(oldest.session_id, None)
+            await self.close(oldest, reason="capacity")
+        self._ensure_reaper()
+
+    async def close(self, warm: WarmSession, *, reason: str) -> None:
+        logger.info(
+            "sdk_session_closed",
+            extra={
+                "session_id": warm.session_id,
+                "reason": reason,
+                "turns": warm.turns,
+            },
+        )
+        await warm.stop()
+        await warm.workspace.cleanup()
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper_task is not None and not self._reaper_task.done():
+            return
+        self._reaper_task = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        interval = max(1.0, min(60.0, self.idle_seconds / 2))
+        while self._idle:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for session_id, warm in list(self._idle.items()):
+                if now - warm.last_used > self.idle_seconds:
+                    self._idle.pop(session_id, None)
+                    await self.close(warm, reason="idle_expired")
+
+    async def shutdown(self) -> None:
+        task, self._reaper_task = self._reaper_task, None
+        if task is not None:
+            task.cancel()
+        idle, self._idle = self._idle, {}
+        for warm in idle.values():
+            await self.close(warm, reason="shutdown")
+
+
+sdk_session_pool = SdkSessionPool()
@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timezone
+import time
 from typing import Any
 
 import httpx
@@ -18,10 +18,12 @@ class UserInputClient:
         base_url: str,
         timeout: float = 10.0,
         poll_interval: float = 0.5,
+        long_poll_seconds: float = 25.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.poll_interval = poll_interval
+        self.long_poll_seconds = long_poll_seconds
 
     @staticmethod
     def resolve_base_url(callback_url: str, callback_base_url: str | None) -> str:
@@ -45,29 +47,53 @@ class UserInputClient:
             data = response.json()
             return data.get("data", {})
 
-    async def get_request(self, request_id: str) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/user-input-requests/{request_id}",
-                headers={
-                    "X-Request-ID": get_request_id() or generate_request_id(),
-                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+    async def get_request(
+        self,
+        request_id: str,
+        wait_seconds: float = 0,
+        client: httpx.AsyncClient | None = None,
+    ) -> dict[str, Any]:
+        """Get a request; with `wait_seconds > 0` the server holds it while pending."""
+        if client is None:
+            async with httpx.AsyncClient(timeout=self.timeout) as owned:
+                return await self.get_request(request_id, wait_seconds, owned)
+
+        params = {"wait_seconds": wait_seconds} if wait_seconds > 0 else None
+        response = await client.get(
+            f"{self.base_url}/api/v1/user-input-requests/{request_id}",
+            params=params,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+            timeout=self.timeout + wait_seconds,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
 
     async def wait_for_answer(
         self, request_id: str, timeout_seconds: float = 60
     ) -> dict[str, Any] | None:
-        deadline = datetime.now(timezone.utc).timestamp() + timeout_seconds
-        while datetime.now(timezone.utc).timestamp() < deadline:
-            payload = await self.get_request(request_id)
-            status = payload.get("status")
-            if status == "answered":
-                return payload
-            if status == "expired":
-                return None
-            await asyncio.sleep(self.poll_interval)
-        return None
+        """Wait until the request is answered (payload) or expires/times out (None).
+
+        Long-polls in chunks of at most `long_poll_seconds` over one connection. A
+        server that answers a pending request straight away (no long-poll support) is
+        polled every `poll_interval` instead.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait_seconds = min(remaining, self.long_poll_seconds)
+                started = time.monotonic()
+                payload = await self.get_request(request_id, wait_seconds, client)
+                status = payload.get("status")
+                if status == "answered":
+                    return payload
+                if status == "expired":
+                    return None
+                if time.monotonic() - started < min(wait_seconds, self.poll_interval):
+                    await asyncio.sleep(self.poll_interval)
@@ -6,14 +6,98 @@ from app.core.callback import CallbackClient
 from app.hooks.base import AgentHook, ExecutionContext
 from app.schemas.callback import AgentCallbackRequest
 from app.schemas.enums import CallbackStatus, TodoStatus
+from app.schemas.state import AgentStateDelta, WorkspaceStateDelta
 from app.utils.serializer import serialize_message
 
 
 class CallbackHook(AgentHook):
-    def __init__(self, client: CallbackClient):
+    """Reports agent progress, sending state as versioned deltas.
+
+    Every state change bumps `state_version`. A report carries either the full state
+    (`state_patch`) or the changes since the previous version (`state_delta`). Full
+    snapshots go out first, every `snapshot_interval` versions, after a failed
+    delivery and on teardown, so a receiver that missed a delta catches up quickly.
+    """
+
+    def __init__(self, client: CallbackClient, snapshot_interval: int = 20):
         self.client = client
+        self.snapshot_interval = max(1, snapshot_interval)
         self.execution_error: Optional[Exception] = None
         self.sdk_session_id: Optional[str] = None
+        self._state_version = 0
+        self._snapshot_version = 0
+        self._sent_state: dict[str, Any] | None = None
+        self._seen_failures = client.failures
+
+    def _build_state_update(
+        self, context: ExecutionContext, *, full: bool = False
+    ) -> dict[str, Any]:
+        state = context.current_state
+        current = state.model_dump(mode="json")
+        if self.client.failures != self._seen_failures:
+            self._seen_failures = self.client.failures
+            full = True
+        previous = self._sent_state
+        if not full and current == previous:
+            return {}
+
+        base_version = self._state_version
+        self._state_version += 1
+        self._sent_state = current
+        if (
+            full
+            or previous is None
+            or self._state_version - self._snapshot_version >= self.snapshot_interval
+        ):
+            self._snapshot_version = self._state_version
+            return {"state_patch": state, "state_version": self._state_version}
+
+        changed = [
+            name
+            for name, value in current.items()
+            if name != "workspace_state" and value != previous.get(name)
+        ]
+        delta = AgentStateDelta(
+            base_version=base_version,
+            changed=changed,
+            **{name: getattr(state, name) for name in changed},
+        )
+        if current.get("workspace_state") != previous.get("workspace_state"):
+            delta.changed.append("workspace_state")
+            delta.workspace_state = self._build_workspace_delta(
+                context, current, previous
+            )
+        return {"state_delta": delta, "state_version": self._state_version}
+
+    @staticmethod
+    def _build_workspace_delta(
+        context: ExecutionContext, current: dict[str, Any], previous: dict[str, Any]
+    ) -> WorkspaceStateDelta | None:
+        workspace = context.current_state.workspace_state
+        if workspace is None:
+            return None
+        # A file can appear more than once (e.g. staged and modified), so entries are
+        # compared and replaced per path.
+        previous_files: dict[str, list[dict[str, Any]]] = {}
+        for item in (previous.get("workspace_state") or {}).get("file_changes", []):
+            previous_files.setdefault(item["path"], []).append(item)
+        current_files: dict[str, list[dict[str, Any]]] = {}
+        for item in current["workspace_state"]["file_changes"]:
+            current_files.setdefault(item["path"], []).append(item)
+        upsert = [
+            change
+            for change in workspace.file_changes
+            if previous_files.get(change.path) != current_files[change.path]
+        ]
+        return WorkspaceStateDelta(
+            repository=workspace.repository,
+            branch=workspace.branch,
+            last_change=workspace.last_change,
+            file_changes_upsert=upsert,
+            file_changes_removed=[
+                path for path in previous_files if path not in current_files
+            ],
+        )
 
     def _build_report(
         self,
@@ -22,6 +106,7 @@ class CallbackHook(AgentHook):
         progress: int,
         new_message: Optional[Any] = None,
         error_message: str | None = None,
+        full_state: bool = False,
     ) -> AgentCallbackRequest:
         return AgentCallbackRequest(
             session_id=context.session_id,
@@ -29,8 +114,8 @@ class CallbackHook(AgentHook):
             progress=progress,
             error_message=error_message,
             new_message=serialize_message(new_message),
-            state_patch=context.current_state,
             sdk_session_id=self.sdk_session_id,
+            **self._build_state_update(context, full=full_state),
         )
 
     def _calculate_progress(self, todos) -> int:
@@ -47,7 +132,7 @@ class CallbackHook(AgentHook):
         elif isinstance(message, ResultMessage):
             self.sdk_session_id = message.session_id
 
-        await self.client.send(
+        self.client.enqueue(
             self._build_report(
                 context=context,
                 status=CallbackStatus.RUNNING,
@@ -77,8 +162,10 @@ class CallbackHook(AgentHook):
                 status=status,
                 progress=progress,
                 error_message=error_message,
+                full_state=True,
             )
         )
+        await self.client.aclose()
 
     async def on_error(self, context: ExecutionContext, error: Exception):
         self.execution_error = error
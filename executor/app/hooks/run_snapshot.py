@@ -4,15 +4,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from app.hooks.base import AgentHook, ExecutionContext
+from app.utils.git.backend import get_git_backend
 from app.utils.git.operations import (
     GitError,
     GitNotRepositoryError,
     add_files,
     commit,
-    has_commits,
     init_repository,
-    is_repository,
-    set_config,
     tag_ref,
 )
 
@@ -63,13 +61,15 @@ class RunSnapshotHook(AgentHook):
     def _ensure_git_ready(cwd: Path) -> None:
         """Ensure a git repository exists and is commit-ready."""
 
-        if not is_repository(cwd):
+        git = get_git_backend()
+        if not git.is_repository(cwd):
             init_repository(cwd)
 
-        # Make commits work reliably inside containers.
-        set_config("user.name", "poco", cwd=cwd)
-        set_config("user.email", "poco@local", cwd=cwd)
-        set_config("commit.gpgsign", "false", cwd=cwd)
+        # Make commits work reliably inside containers. Only written when they differ,
+        # so a ready repository costs no git processes here.
+        git.ensure_config("user.name", "poco", cwd)
+        git.ensure_config("user.email", "poco@local", cwd)
+        git.ensure_config("commit.gpgsign", "false", cwd)
 
     async def on_setup(self, context: ExecutionContext) -> None:
         run_id = self._resolve_run_id(context)
@@ -90,7 +90,7 @@ class RunSnapshotHook(AgentHook):
 
         # Ensure HEAD exists so subsequent status/diff are relative to a concrete baseline.
         try:
-            if not has_commits(cwd):
+            if not get_git_backend().has_commits(cwd):
                 add_files(".", cwd=cwd, all_files=True)
                 commit(
                     message="poco:init",
@@ -1,54 +1,138 @@
+import asyncio
+import logging
+import os
+import time
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
 from app.hooks.base import AgentHook, ExecutionContext
 from app.schemas.enums import FileStatus
 from app.schemas.state import FileChange, WorkspaceState
+from app.utils.git.backend import get_git_backend
 from app.utils.git.operations import (
+    GitFileDiff,
     GitNotRepositoryError,
-    diff,
-    get_numstat,
+    get_file_diffs,
     get_status,
-    is_repository,
-    list_remotes,
-    remote_url,
 )
 
+logger = logging.getLogger(__name__)
+
+# Tools that can change files in the workspace. Anything else (Read, Grep, WebFetch,
+# TodoWrite, ...) leaves the last scan valid.
+MUTATING_TOOLS = frozenset({"Write", "Edit", "MultiEdit", "NotebookEdit", "Bash"})
+
+DEFAULT_DIFF_MAX_CHARS = 100_000
+
+
+def _diff_max_chars() -> int | None:
+    raw = (os.environ.get("WORKSPACE_DIFF_MAX_CHARS") or "").strip()
+    if not raw:
+        return DEFAULT_DIFF_MAX_CHARS
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_DIFF_MAX_CHARS
+    return value if value > 0 else None
+
 
 class WorkspaceHook(AgentHook):
-    """Hook that monitors workspace file changes and updates state."""
+    """Hook that monitors workspace file changes and updates state.
+
+    The workspace is scanned once at the first response, then again only after a
+    file-mutating tool call (see `MUTATING_TOOLS`) has returned its result, and at the
+    final result. A scan costs a fixed number of git calls regardless of how many
+    files changed.
+    """
+
+    def __init__(self) -> None:
+        self.git = get_git_backend()
+        self.diff_max_chars = _diff_max_chars()
+        self._scanned = False
+        self._pending_tool_use_ids: set[str] = set()
+        self._remote_cache: tuple[Path, float, str | None] | None = None
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
-        """Capture Git-tracked file changes after each agent response.
+        """Rescan Git-tracked file changes when the agent may have modified files.
 
         Args:
             context: The execution context containing workspace state.
-            message: The agent response message (unused).
+            message: The agent response message.
         """
+        if not self._needs_scan(message):
+            return
+        self._scanned = True
+        context.current_state.workspace_state = await asyncio.to_thread(
+            self._scan, context.cwd
+        )
+
+    def _needs_scan(self, message: Any) -> bool:
+        if isinstance(message, AssistantMessage):
+            for block in message.content:
+                if isinstance(block, ToolUseBlock) and block.name in MUTATING_TOOLS:
+                    self._pending_tool_use_ids.add(block.id)
+            return not self._scanned
+
+        if isinstance(message, UserMessage) and isinstance(message.content, list):
+            finished = {
+                block.tool_use_id
+                for block in message.content
+                if isinstance(block, ToolResultBlock)
+                and block.tool_use_id in self._pending_tool_use_ids
+            }
+            if finished:
+                self._pending_tool_use_ids -= finished
+                return True
+            return not self._scanned
+
+        if isinstance(message, ResultMessage):
+            self._pending_tool_use_ids.clear()
+            return True
+
+        return not self._scanned
+
+    def _scan(self, cwd: str) -> WorkspaceState:
+        started = time.perf_counter()
+        file_count = 0
         try:
-            if not is_repository(context.cwd):
-                context.current_state.workspace_state = WorkspaceState()
-                return
-
-            git_status = get_status(context.cwd)
-            repository = self._get_repository_url(context.cwd)
-            file_changes = self._collect_file_changes(git_status, context.cwd)
+            if not self.git.is_repository(cwd):
+                return WorkspaceState()
 
-            total_added = sum(fc.added_lines for fc in file_changes)
-            total_deleted = sum(fc.deleted_lines for fc in file_changes)
+            git_status = get_status(cwd, branch=self.git.get_current_branch(cwd))
+            file_changes = self._collect_file_changes(git_status, cwd)
+            file_count = len(file_changes)
 
-            context.current_state.workspace_state = WorkspaceState(
-                repository=repository,
+            return WorkspaceState(
+                repository=self._get_repository_url(cwd),
                 branch=git_status.branch,
-                total_added_lines=total_added,
-                total_deleted_lines=total_deleted,
+                total_added_lines=sum(fc.added_lines for fc in file_changes),
+                total_deleted_lines=sum(fc.deleted_lines for fc in file_changes),
                 file_changes=file_changes,
                 last_change=datetime.now(timezone.utc),
             )
         except GitNotRepositoryError:
-            context.current_state.workspace_state = WorkspaceState()
+            return WorkspaceState()
         except Exception:
-            context.current_state.workspace_state = WorkspaceState()
+            logger.exception("workspace_scan_failed", extra={"cwd": cwd})
+            return WorkspaceState()
+        finally:
+            logger.info(
+                "timing",
+                extra={
+                    "step": "workspace_scan",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "file_change_count": file_count,
+                },
+            )
 
     def _collect_file_changes(self, git_status, cwd: str) -> list[FileChange]:
         """Collect file changes with diff information.
@@ -62,32 +146,34 @@ class WorkspaceHook(AgentHook):
         """
         file_changes = []
 
-        unstaged_numstat = get_numstat(cwd, cached=False)
-        staged_numstat = get_numstat(cwd, cached=True)
+        unstaged_diffs = get_file_diffs(
+            cwd, cached=False, max_patch_chars=self.diff_max_chars
+        )
+        staged_diffs = get_file_diffs(
+            cwd, cached=True, max_patch_chars=self.diff_max_chars
+        )
 
         for file in git_status.modified:
-            added, deleted = unstaged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=False)
+            file_diff = unstaged_diffs.get(file) or GitFileDiff(path=file)
             file_changes.append(
                 FileChange(
                     path=file,
                     status=FileStatus.MODIFIED,
-                    added_lines=added,
-                    deleted_lines=deleted,
-                    diff=diff_content or None,
+                    added_lines=file_diff.added_lines,
+                    deleted_lines=file_diff.deleted_lines,
+                    diff=file_diff.patch or None,
                 )
             )
 
         for file in git_status.staged:
-            added, deleted = staged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=True)
+            file_diff = staged_diffs.get(file) or GitFileDiff(path=file)
             file_changes.append(
                 FileChange(
                     path=file,
                     status=FileStatus.STAGED,
-                    added_lines=added,
-                    deleted_lines=deleted,
-                    diff=diff_content or None,
+                    added_lines=file_diff.added_lines,
+                    deleted_lines=file_diff.deleted_lines,
+                    diff=file_diff.patch or None,
                 )
             )
 
@@ -122,7 +208,7 @@ class WorkspaceHook(AgentHook):
         return file_changes
 
     def _get_repository_url(self, cwd: str) -> str | None:
-        """Get repository URL from Git remotes.
+        """Get repository URL from Git remotes, cached until `.git/config` changes.
 
         Tries 'origin', then 'upstream', then the first available remote.
 
@@ -132,14 +218,31 @@ class WorkspaceHook(AgentHook):
         Returns:
             Repository URL or None if not found.
         """
+        try:
+            config_path = (
+                self._remote_cache[0]
+                if self._remote_cache
+                else self.git.get_git_dir(cwd) / "config"
+            )
+            mtime = config_path.stat().st_mtime
+        except Exception:
+            return self._resolve_repository_url(cwd)
+
+        if self._remote_cache and self._remote_cache[1] == mtime:
+            return self._remote_cache[2]
+        url = self._resolve_repository_url(cwd)
+        self._remote_cache = (config_path, mtime, url)
+        return url
+
+    def _resolve_repository_url(self, cwd: str) -> str | None:
         try:
             for remote_name in ["origin", "upstream"]:
                 try:
-                    return remote_url(remote_name, cwd)
+                    return self.git.remote_url(remote_name, cwd)
                 except Exception:
                     continue
 
-            remotes = list_remotes(cwd)
+            remotes = self.git.list_remotes(cwd)
             if remotes:
                 return remotes[0].fetch_url
         except Exception:
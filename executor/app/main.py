@@ -1,10 +1,12 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 from app.api import task_router
 from app.core.middleware import setup_middleware
+from app.core.sdk_session_pool import sdk_session_pool
 from app.core.observability.logging import configure_logging
 
 configure_logging(
@@ -12,7 +14,14 @@ configure_logging(
     service_name="executor",
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await sdk_session_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 setup_middleware(app)
 app.include_router(task_router)
@@ -58,3 +58,33 @@ class AgentCurrentState(BaseModel):
     browser: BrowserState | None = None
     workspace_state: WorkspaceState | None = None
     current_step: str | None = None
+
+
+class WorkspaceStateDelta(BaseModel):
+    """Workspace changes since the previous state version.
+
+    `file_changes_upsert` replaces every entry of the paths it mentions and
+    `file_changes_removed` drops paths entirely; totals are recomputed by the receiver.
+    """
+
+    repository: str | None = None
+    branch: str | None = None
+    last_change: datetime
+    file_changes_upsert: list[FileChange] = Field(default_factory=list)
+    file_changes_removed: list[str] = Field(default_factory=list)
+
+
+class AgentStateDelta(BaseModel):
+    """Changes to AgentCurrentState relative to state version `base_version`.
+
+    `changed` names the top-level fields that differ; each is replaced by the value
+    below, except `workspace_state`, which is merged (or cleared when None).
+    """
+
+    base_version: int
+    changed: list[str] = Field(default_factory=list)
+    todos: list[TodoItem] | None = None
+    mcp_status: list[McpStatus] | None = None
+    browser: BrowserState | None = None
+    workspace_state: WorkspaceStateDelta | None = None
+    current_step: str | None = None
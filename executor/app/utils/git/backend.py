@@ -0,0 +1,385 @@
+"""
+Pluggable backends for read-heavy git queries.
+
+`CliGitBackend` runs the git CLI through `app.utils.git.operations`, one process per
+call. `FileGitBackend` answers the same queries in-process by reading the repository
+files (HEAD, refs, packed-refs, config) directly and raises `GitBackendUnsupported`
+for layouts it does not understand; `FallbackGitBackend` then retries on the CLI.
+Writes (add, commit, tag, config changes) always go through the CLI.
+"""
+
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from app.utils.git import operations
+from app.utils.git.operations import GitError, GitNotRepositoryError, GitRemote
+
+logger = logging.getLogger(__name__)
+
+
+class GitBackendUnsupported(GitError):
+    """Raised when a backend cannot answer a query for this repository."""
+
+    pass
+
+
+class GitBackend(ABC):
+    """Read-only git queries used on hot paths."""
+
+    name: str
+
+    @abstractmethod
+    def is_repository(self, cwd: str | Path) -> bool:
+        """Check whether `cwd` is inside a git repository."""
+
+    @abstractmethod
+    def get_git_dir(self, cwd: str | Path) -> Path:
+        """Get the absolute path of the repository's git directory."""
+
+    @abstractmethod
+    def get_current_branch(self, cwd: str | Path) -> str:
+        """Get the current branch name, or the commit hash when HEAD is detached."""
+
+    @abstractmethod
+    def has_commits(self, cwd: str | Path) -> bool:
+        """Check whether HEAD resolves to a commit."""
+
+    @abstractmethod
+    def get_config(self, key: str, cwd: str | Path) -> str | None:
+        """Get a repository-local config value, or None when unset."""
+
+    @abstractmethod
+    def list_remotes(self, cwd: str | Path) -> list[GitRemote]:
+        """List the repository's remotes."""
+
+    def remote_url(self, name: str, cwd: str | Path) -> str:
+        """Get the fetch URL of remote `name`.
+
+        Raises:
+            GitError: If the remote does not exist
+        """
+        for remote in self.list_remotes(cwd):
+            if remote.name == name:
+                return remote.fetch_url
+        raise GitError(f"Remote '{name}' not found")
+
+    def ensure_config(self, key: str, value: str, cwd: str | Path) -> bool:
+        """Set a repository-local config value unless it already matches.
+
+        Returns:
+            True if the config was written
+        """
+        if self.get_config(key, cwd) == value:
+            return False
+        operations.set_config(key, value, cwd=cwd)
+        return True
+
+
+class CliGitBackend(GitBackend):
+    """Backend that runs one git process per query."""
+
+    name = "cli"
+
+    def is_repository(self, cwd: str | Path) -> bool:
+        return operations.is_repository(cwd)
+
+    def get_git_dir(self, cwd: str | Path) -> Path:
+        return operations.get_git_dir(cwd)
+
+    def get_current_branch(self, cwd: str | Path) -> str:
+        return operations.get_current_branch(cwd)
+
+    def has_commits(self, cwd: str | Path) -> bool:
+        return operations.has_commits(cwd)
+
+    def get_config(self, key: str, cwd: str | Path) -> str | None:
+        try:
+            return operations.get_config(key, cwd=cwd)
+        except GitNotRepositoryError:
+            raise
+        except GitError:
+            return None
+
+    def list_remotes(self, cwd: str | Path) -> list[GitRemote]:
+        return operations.list_remotes(cwd)
+
+    def remote_url(self, name: str, cwd: str | Path) -> str:
+        return operations.remote_url(name, cwd)
+
+
+_SECTION_RE = re.compile(
+    r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]\s*(.*)$'
+)
+_KEY_RE = re.compile(r"^([A-Za-z][A-Za-z0-9-]*)\s*(?:=\s*(.*))?$")
+
+
+def _parse_config_value(raw: str) -> str:
+    value: list[str] = []
+    in_quotes = False
+    i = 0
+    while i < len(raw):
+        ch = raw[i]
+        if ch == "\\":
+            if i + 1 >= len(raw):
+                raise GitBackendUnsupported("Config line continuation")
+            nxt = raw[i + 1]
+            value.append({"n": "\n", "t": "\t", "b": "\b"}.get(nxt, nxt))
+            i += 2
+            continue
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch in "#;" and not in_quotes:
+            break
+        else:
+            value.append(ch)
+        i += 1
+    if in_quotes:
+        raise GitBackendUnsupported("Unterminated quote in config")
+    return "".join(value).strip()
+
+
+def _parse_config(text: str) -> dict[str, str]:
+    """Parse a git config file into `section[.subsection].key -> last value`."""
+    values: dict[str, str] = {}
+    section: str | None = None
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            match = _SECTION_RE.match(line)
+            if not match:
+                raise GitBackendUnsupported(f"Unsupported config section: {line}")
+            name, subsection, rest = match.groups()
+            name = name.lower()
+            if name in ("include", "includeif"):
+                raise GitBackendUnsupported("Config includes are not supported")
+            if subsection is not None:
+                subsection = re.sub(r"\\(.)", r"\1", subsection)
+                section = f"{name}.{subsection}"
+            else:
+                section = name
+            line = rest.strip()
+            if not line or line[0] in "#;":
+                continue
+        if section is None:
+            raise GitBackendUnsupported("Config key outside of a section")
+        match = _KEY_RE.match(line)
+        if not match:
+            raise GitBackendUnsupported(f"Unsupported config line: {line}")
+        key, raw_value = match.groups()
+        # A bare key is boolean true.
+        value = "true" if raw_value is None else _parse_config_value(raw_value)
+        values[f"{section}.{key.lower()}"] = value
+    return values
+
+
+class FileGitBackend(GitBackend):
+    """Backend that reads repository files in-process, without forking git.
+
+    Handles the common layouts (a `.git` directory or `gitdir:` file, loose refs,
+    packed-refs, plain config files) and raises `GitBackendUnsupported` otherwise,
+    e.g. for reftable repositories, config includes or when GIT_DIR is set. Only the
+    repository config is read, so global `url.<base>.insteadOf` rewrites are not
+    applied to remote URLs.
+    """
+
+    name = "file"
+
+    def __init__(self) -> None:
+        self._config_cache: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def _find_git_dir(self, cwd: str | Path) -> Path | None:
+        if os.environ.get("GIT_DIR") or os.environ.get("GIT_WORK_TREE"):
+            raise GitBackendUnsupported("GIT_DIR/GIT_WORK_TREE is set")
+        current = Path(cwd).resolve()
+        for directory in (current, *current.parents):
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                return dot_git
+            if dot_git.is_file():
+                content = dot_git.read_text(encoding="utf-8").strip()
+                if not content.startswith("gitdir:"):
+                    raise GitBackendUnsupported(f"Unexpected .git file in {directory}")
+                target = Path(content[len("gitdir:") :].strip())
+                if not target.is_absolute():
+                    target = directory / target
+                return target.resolve()
+        return None
+
+    def _require_git_dir(self, cwd: str | Path) -> Path:
+        git_dir = self._find_git_dir(cwd)
+        if git_dir is None:
+            # Bare repositories, ceiling directories etc. are left to the CLI.
+            raise GitBackendUnsupported(f"No .git found above {cwd}")
+        return git_dir
+
+    @staticmethod
+    def _common_dir(git_dir: Path) -> Path:
+        commondir = git_dir / "commondir"
+        if commondir.is_file():
+            target = Path(commondir.read_text(encoding="utf-8").strip())
+            return (target if target.is_absolute() else git_dir / target).resolve()
+        return git_dir
+
+    def _read_head(self, git_dir: Path) -> str:
+        if (self._common_dir(git_dir) / "reftable").exists():
+            raise GitBackendUnsupported("reftable repositories are not supported")
+        try:
+            return (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except FileNotFoundError as exc:
+            raise GitBackendUnsupported(f"Missing HEAD in {git_dir}") from exc
+
+    def _resolve_ref(self, git_dir: Path, ref: str) -> str | None:
+        common_dir = self._common_dir(git_dir)
+        for base in (git_dir, common_dir):
+            path = base / ref
+            if path.is_file():
+                value = path.read_text(encoding="utf-8").strip()
+                if value.startswith("ref:"):
+                    return self._resolve_ref(git_dir, value[4:].strip())
+                return value or None
+        packed = common_dir / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text(encoding="utf-8").splitlines():
+                if not line or line[0] in "#^":
+                    continue
+                sha, _, name = line.partition(" ")
+                if name.strip() == ref:
+                    return sha
+        return None
+
+    def _read_config(self, git_dir: Path) -> dict[str, str]:
+        path = self._common_dir(git_dir) / "config"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._config_cache.get(path)
+            if cached and cached[0] == stamp:
+                return cached[1]
+        values = _parse_config(path.read_text(encoding="utf-8"))
+        with self._lock:
+            self._config_cache[path] = (stamp, values)
+        return values
+
+    def is_repository(self, cwd: str | Path) -> bool:
+        return self._find_git_dir(cwd) is not None or operations.is_repository(cwd)
+
+    def get_git_dir(self, cwd: str | Path) -> Path:
+        return self._require_git_dir(cwd)
+
+    def get_current_branch(self, cwd: str | Path) -> str:
+        git_dir = self._require_git_dir(cwd)
+        head = self._read_head(git_dir)
+        if head.startswith("ref:"):
+            ref = head[4:].strip()
+            return ref.removeprefix("refs/heads/")
+        return head
+
+    def has_commits(self, cwd: str | Path) -> bool:
+        git_dir = self._require_git_dir(cwd)
+        head = self._read_head(git_dir)
+        if head.startswith("ref:"):
+            return self._resolve_ref(git_dir, head[4:].strip()) is not None
+        return bool(head)
+
+    def get_config(self, key: str, cwd: str | Path) -> str | None:
+        section, _, name = key.rpartition(".")
+        head, dot, subsection = section.partition(".")
+        normalized = f"{head.lower()}{dot}{subsection}.{name.lower()}"
+        return self._read_config(self._require_git_dir(cwd)).get(normalized)
+
+    def list_remotes(self, cwd: str | Path) -> list[GitRemote]:
+        config = self._read_config(self._require_git_dir(cwd))
+        if any(
+            key.endswith(".insteadof") or key.endswith(".pushinsteadof")
+            for key in config
+        ):
+            raise GitBackendUnsupported("URL rewrites are not supported")
+        remotes: dict[str, GitRemote] = {}
+        for key, value in config.items():
+            if not key.startswith("remote.") or not key.endswith(".url"):
+                continue
+            name = key[len("remote.") : -len(".url")]
+            push_url = config.get(f"remote.{name}.pushurl", value)
+            remotes[name] = GitRemote(name=name, fetch_url=value, push_url=push_url)
+        return list(remotes.values())
+
+
+class FallbackGitBackend(GitBackend):
+    """Try `primary` first and fall back to `fallback` when it cannot answer."""
+
+    def __init__(self, primary: GitBackend, fallback: GitBackend) -> None:
+        self.primary = primary
+        self.fallback = fallback
+        self.name = f"{primary.name}+{fallback.name}"
+        self.fallbacks = 0
+
+    def _call(self, method: str, *args):
+        try:
+            return getattr(self.primary, method)(*args)
+        except GitBackendUnsupported as exc:
+            self.fallbacks += 1
+            logger.debug(
+                f"git backend {self.primary.name} fell back for {method}: {exc}"
+            )
+        except (OSError, UnicodeDecodeError) as exc:
+            self.fallbacks += 1
+            logger.debug(f"git backend {self.primary.name} failed {method}: {exc}")
+        return getattr(self.fallback, method)(*args)
+
+    def is_repository(self, cwd: str | Path) -> bool:
+        return self._call("is_repository", cwd)
+
+    def get_git_dir(self, cwd: str | Path) -> Path:
+        return self._call("get_git_dir", cwd)
+
+    def get_current_branch(self, cwd: str | Path) -> str:
+        return self._call("get_current_branch", cwd)
+
+    def has_commits(self, cwd: str | Path) -> bool:
+        return self._call("has_commits", cwd)
+
+    def get_config(self, key: str, cwd: str | Path) -> str | None:
+        return self._call("get_config", key, cwd)
+
+    def list_remotes(self, cwd: str | Path) -> list[GitRemote]:
+        return self._call("list_remotes", cwd)
+
+    def remote_url(self, name: str, cwd: str | Path) -> str:
+        return self._call("remote_url", name, cwd)
+
+
+_backend: GitBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def create_git_backend(kind: str) -> GitBackend:
+    """Create a backend by name: "cli" or "file" (in-process with CLI fallback)."""
+    if kind == "cli":
+        return CliGitBackend()
+    if kind == "file":
+        return FallbackGitBackend(FileGitBackend(), CliGitBackend())
+    raise ValueError(f"Unknown git backend: {kind}")
+
+
+def get_git_backend() -> GitBackend:
+    """Get the process-wide backend selected by the GIT_BACKEND env var."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            kind = (os.environ.get("GIT_BACKEND") or "file").strip().lower()
+            try:
+                _backend = create_git_backend(kind)
+            except ValueError:
+                logger.warning(f"Unknown GIT_BACKEND {kind!r}, using the git CLI")
+                _backend = CliGitBackend()
+        return _backend
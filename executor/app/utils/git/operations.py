@@ -106,6 +106,18 @@ class GitRemote:
     push_url: str
 
 
+@dataclass
+class GitFileDiff:
+    """Line counts and patch text for one changed file."""
+
+    path: str
+    added_lines: int = 0
+    deleted_lines: int = 0
+    patch: str = ""
+    old_path: str | None = None
+    truncated: bool = False
+
+
 def _run_git_command(
     command: list[str],
     cwd: str | Path | None = None,
@@ -413,12 +425,13 @@ def _parse_status_porcelain_v1_z(
     return staged, modified, untracked, deleted, renamed
 
 
-def get_status(cwd: str | Path | None = None) -> GitStatus:
+def get_status(cwd: str | Path | None = None, branch: str | None = None) -> GitStatus:
     """
     Get the current git status.
 
     Args:
         cwd: Working directory
+        branch: Current branch if already known (skips looking it up)
 
     Returns:
         GitStatus: Status object with information about changed files
@@ -426,7 +439,8 @@ def get_status(cwd: str | Path | None = None) -> GitStatus:
     Raises:
         GitNotRepositoryError: If not a git repository
     """
-    branch = get_current_branch(cwd)
+    if branch is None:
+        branch = get_current_branch(cwd)
 
     result = _run_git_command(
         ["status", "--porcelain=v1", "--untracked-files=all", "-z"],
@@ -708,6 +722,105 @@ def get_numstat(
     return numstat
 
 
+def _parse_numstat_z(output: str) -> list[tuple[int, int, str, str | None]]:
+    entries: list[tuple[int, int, str, str | None]] = []
+    fields = output.split("\x00")
+    i = 0
+    while i < len(fields):
+        parts = fields[i].split("\t")
+        i += 1
+        if len(parts) < 3:
+            continue
+        try:
+            added = int(parts[0]) if parts[0] != "-" else 0
+            deleted = int(parts[1]) if parts[1] != "-" else 0
+        except ValueError:
+            continue
+        if parts[2]:
+            entries.append((added, deleted, parts[2], None))
+            continue
+        # Renames/copies: the old and new paths follow as separate fields.
+        if i + 1 < len(fields):
+            entries.append((added, deleted, fields[i + 1], fields[i]))
+        i += 2
+    return entries
+
+
+def get_file_diffs(
+    cwd: str | Path | None = None,
+    cached: bool = False,
+    max_patch_chars: int | None = None,
+) -> dict[str, GitFileDiff]:
+    """
+    Get line counts and patch text for every changed file with a single git diff.
+
+    Args:
+        cwd: Working directory
+        cached: If True, diff staged changes
+        max_patch_chars: Truncate each file's patch to this many characters
+
+    Returns:
+        dict: Mapping of file path to GitFileDiff
+
+    Raises:
+        GitNotRepositoryError: If not a git repository
+    """
+    args = [
+        "diff",
+        "--numstat",
+        "--patch",
+        "-z",
+        "--no-color",
+        "--no-ext-diff",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+    ]
+    if cached:
+        args.append("--cached")
+
+    result = _run_git_command(args, cwd=cwd, check=True)
+    output = result.stdout
+    if not output:
+        return {}
+
+    separator = output.find("\x00\x00diff --git ")
+    if separator < 0:
+        numstat_part, patch_part = output, ""
+    else:
+        numstat_part, patch_part = output[: separator + 1], output[separator + 2 :]
+
+    entries = _parse_numstat_z(numstat_part)
+    patches = [
+        chunk if index == 0 else "diff --git " + chunk
+        for index, chunk in enumerate(patch_part.split("\ndiff --git "))
+        if chunk
+    ]
+    # Both sections list files in the same order; if they somehow disagree, keep the
+    # line counts rather than attach a patch to the wrong file.
+    if len(patches) != len(entries):
+        patches = [""] * len(entries)
+
+    diffs: dict[str, GitFileDiff] = {}
+    for (added, deleted, path, old_path), patch in zip(entries, patches):
+        patch = patch.rstrip("\n") + "\n" if patch else ""
+        truncated = False
+        if max_patch_chars is not None and len(patch) > max_patch_chars:
+            omitted = len(patch) - max_patch_chars
+            patch = (
+                patch[:max_patch_chars] + f"\n... diff truncated ({omitted} chars)\n"
+            )
+            truncated = True
+        diffs[path] = GitFileDiff(
+            path=path,
+            added_lines=added,
+            deleted_lines=deleted,
+            patch=patch,
+            old_path=old_path,
+            truncated=truncated,
+        )
+    return diffs
+
+
 def create_branch(
     name: str,
     start_point: str | None = None,
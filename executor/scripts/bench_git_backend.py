@@ -0,0 +1,78 @@
+"""Per-call latency benchmark for the executor git backends.
+
+Runs each read query of `app.utils.git.backend` against a repository with every
+backend and reports latency percentiles, e.g.:
+
+    cd executor && python scripts/bench_git_backend.py --repo /workspace --iterations 200
+
+Use a repository that looks like the ones agents work in (remote configured, some
+packed refs); queries a backend cannot answer fall back to the CLI and show up as
+`fallbacks`.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.git.backend import FallbackGitBackend, GitBackend, create_git_backend  # noqa: E402
+
+QUERIES = {
+    "is_repository": lambda git, repo: git.is_repository(repo),
+    "get_git_dir": lambda git, repo: git.get_git_dir(repo),
+    "get_current_branch": lambda git, repo: git.get_current_branch(repo),
+    "has_commits": lambda git, repo: git.has_commits(repo),
+    "get_config": lambda git, repo: git.get_config("user.name", repo),
+    "list_remotes": lambda git, repo: git.list_remotes(repo),
+}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _bench(git: GitBackend, repo: str, query: str, iterations: int) -> list[float]:
+    func = QUERIES[query]
+    func(git, repo)  # warm up caches
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(git, repo)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", default=".")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--backend", action="append", dest="backends")
+    args = parser.parse_args()
+
+    backends = args.backends or ["cli", "file"]
+    print(f"repo={Path(args.repo).resolve()} iterations={args.iterations}")
+    for kind in backends:
+        git = create_git_backend(kind)
+        for query in QUERIES:
+            try:
+                latencies = _bench(git, args.repo, query, args.iterations)
+            except Exception as exc:
+                print(f"{git.name:>8} {query:<20} error: {exc}")
+                continue
+            print(
+                f"{git.name:>8} {query:<20} "
+                f"p50={_percentile(latencies, 50) * 1e6:8.1f}us "
+                f"p95={_percentile(latencies, 95) * 1e6:8.1f}us "
+                f"mean={statistics.mean(latencies) * 1e6:8.1f}us"
+            )
+        if isinstance(git, FallbackGitBackend):
+            print(f"{git.name:>8} fallbacks={git.fallbacks}")
+
+
+if __name__ == "__main__":
+    main()
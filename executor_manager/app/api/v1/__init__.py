@@ -9,8 +9,11 @@ from app.api.v1 import (
     user_input_requests,
     workspace,
 )
+from app.core.http_client import get_http_client_stats
 from app.core.settings import get_settings
 from app.schemas.response import Response
+from app.services.blob_cache import get_blob_cache_stats
+from app.services.callback_forwarder import callback_forwarder
 from app.scheduler.scheduler_config import scheduler
 
 api_v1_router = APIRouter()
@@ -48,3 +51,21 @@ async def health():
             "scheduler_running": scheduler.running,
         }
     )
+
+
+@api_v1_router.get("/http-client/stats")
+async def http_client_stats():
+    """Shared outbound HTTP connection pool statistics."""
+    return Response.success(data=get_http_client_stats())
+
+
+@api_v1_router.get("/blob-cache/stats")
+async def blob_cache_stats():
+    """Host blob cache hit ratio and bytes saved for staged skills/plugins/attachments."""
+    return Response.success(data=get_blob_cache_stats())
+
+
+@api_v1_router.get("/callback-forwarder/stats")
+async def callback_forwarder_stats():
+    """Callback batching statistics (batches sent, callbacks forwarded, largest batch)."""
+    return Response.success(data=callback_forwarder.get_stats())
@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse
 
 from app.schemas.response import Response, ResponseSchema
@@ -22,6 +22,12 @@ async def create_user_input_request(
 
 
 @router.get("/{request_id}", response_model=ResponseSchema[UserInputRequestResponse])
-async def get_user_input_request(request_id: str) -> JSONResponse:
-    result = await backend_client.get_user_input_request(request_id)
+async def get_user_input_request(
+    request_id: str,
+    wait_seconds: float = Query(default=0, ge=0, le=60),
+) -> JSONResponse:
+    """Get a user input request, long-polling up to `wait_seconds` while pending."""
+    result = await backend_client.get_user_input_request(
+        request_id, wait_seconds=wait_seconds
+    )
     return Response.success(data=result, message="User input request retrieved")
@@ -0,0 +1,236 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Request extension for long-polls (run waits, user input waits). They hold a request
+# open for tens of seconds while idle on the server, so they bypass the per-host cap and
+# use their own connection pool instead of starving the short requests (callbacks,
+# heartbeats) of connections.
+LONG_POLL_EXTENSIONS = {"long_poll": True}
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    long_polls: int = 0
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that releases the per-host slot once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Pooled transport that caps concurrent requests per host and tracks stats.
+
+    httpx only limits connections for the whole pool; executor containers and the backend
+    share one client here, so a per-host cap keeps a burst against one host from starving
+    the others. Requests sent with `LONG_POLL_EXTENSIONS` are not counted against it and
+    go through a separate pool (`long_poll_limits`).
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits,
+        long_poll_limits: httpx.Limits,
+        http2: bool,
+        max_connections_per_host: int | None,
+    ) -> None:
+        self._transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        self._long_poll_transport = httpx.AsyncHTTPTransport(
+            limits=long_poll_limits, http2=http2
+        )
+        self._max_per_host = max_connections_per_host
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self.host_stats: dict[str, HostStats] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = f"{request.url.host}:{request.url.port or ''}".rstrip(":")
+        stats = self.host_stats.setdefault(host, HostStats())
+        stats.requests += 1
+
+        long_poll = bool(request.extensions.get("long_poll"))
+        semaphore = None
+        if self._max_per_host and not long_poll:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self._max_per_host)
+                self._semaphores[host] = semaphore
+            stats.waiting += 1
+            try:
+                await semaphore.acquire()
+            finally:
+                stats.waiting -= 1
+
+        stats.in_flight += 1
+        if long_poll:
+            stats.long_polls += 1
+
+        def release() -> None:
+            stats.in_flight -= 1
+            if long_poll:
+                stats.long_polls -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+        transport = self._long_poll_transport if long_poll else self._transport
+        try:
+            response = await transport.handle_async_request(request)
+        except BaseException:
+            stats.errors += 1
+            release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),  # type: ignore[arg-type]
+            extensions=response.extensions,
+        )
+
+    def pool_stats(self) -> dict[str, object]:
+        return {
+            **_connection_stats(self._transport),
+            "long_poll": _connection_stats(self._long_poll_transport),
+        }
+
+    async def aclose(self) -> None:
+        try:
+            await self._transport.aclose()
+        finally:
+            await self._long_poll_transport.aclose()
+
+
+def _connection_stats(transport: httpx.AsyncHTTPTransport) -> dict[str, int]:
+    # httpcore does not expose pool metrics publicly; read them best-effort.
+    pool = getattr(transport, "_pool", None)
+    connections = list(getattr(pool, "connections", None) or [])
+    idle = 0
+    for conn in connections:
+        try:
+            if conn.is_idle():
+                idle += 1
+        except Exception:
+            continue
+    return {
+        "connections": len(connections),
+        "idle_connections": idle,
+        "active_connections": len(connections) - idle,
+    }
+
+
+_client: httpx.AsyncClient | None = None
+_transport: HostLimitedTransport | None = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client (created lazily, closed on shutdown)."""
+    global _client, _transport
+    if _client is not None and not _client.is_closed:
+        return _client
+
+    settings = get_settings()
+    http2 = bool(settings.http_client_http2)
+    if http2 and not _http2_available():
+        logger.warning("http_client_http2_unavailable_falling_back_to_http1")
+        http2 = False
+
+    per_host = int(settings.http_client_max_connections_per_host)
+    _transport = HostLimitedTransport(
+        limits=httpx.Limits(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+        ),
+        long_poll_limits=httpx.Limits(
+            max_connections=settings.http_client_max_long_poll_connections,
+            max_keepalive_connections=settings.http_client_max_long_poll_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+        ),
+        http2=http2,
+        max_connections_per_host=per_host if per_host > 0 else None,
+    )
+    _client = httpx.AsyncClient(
+        transport=_transport,
+        timeout=httpx.Timeout(
+            settings.http_client_timeout_seconds,
+            connect=settings.http_client_connect_timeout_seconds,
+        ),
+    )
+    logger.info(
+        "http_client_created",
+        extra={
+            "http2": http2,
+            "max_connections": settings.http_client_max_connections,
+            "max_connections_per_host": per_host,
+            "max_long_poll_connections": settings.http_client_max_long_poll_connections,
+        },
+    )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connection pool."""
+    global _client, _transport
+    client, _client, _transport = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def get_http_client_stats() -> dict[str, object]:
+    """Get connection pool and per-host request statistics for sizing the pool."""
+    settings = get_settings()
+    transport = _transport
+    return {
+        "initialized": transport is not None,
+        "max_connections": settings.http_client_max_connections,
+        "max_keepalive_connections": settings.http_client_max_keepalive_connections,
+        "max_connections_per_host": settings.http_client_max_connections_per_host,
+        "max_long_poll_connections": settings.http_client_max_long_poll_connections,
+        "pool": transport.pool_stats() if transport else {},
+        "hosts": {
+            host: {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "in_flight": stats.in_flight,
+                "waiting": stats.waiting,
+                "long_polls": stats.long_polls,
+            }
+            for host, stats in (transport.host_stats.items() if transport else [])
+        },
+    }
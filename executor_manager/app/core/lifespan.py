@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
+from app.core.http_client import close_http_client
 from app.core.settings import get_settings
 from app.scheduler.scheduler_config import scheduler
 
@@ -25,6 +26,7 @@ async def lifespan(app: FastAPI):
             unregister_pull_jobs,
         )
         from app.scheduler.pull_schedule_config import (
+            IntervalPullRule,
             default_pull_schedule_config_from_settings,
             load_pull_schedule_config,
         )
@@ -37,8 +39,37 @@ async def lifespan(app: FastAPI):
             schedule_config = default_pull_schedule_config_from_settings(settings)
 
         pull_job_ids = register_pull_jobs(scheduler, pull_service, schedule_config)
+        if schedule_config.enabled:
+            pull_service.start_wakeup_loops(
+                [
+                    rule.schedule_modes
+                    for rule in schedule_config.rules
+                    if isinstance(rule, IntervalPullRule) and rule.enabled
+                ]
+            )
         logger.info(f"Run pull service started (jobs={pull_job_ids})")
 
+    container_pool = None
+    if settings.warm_pool_enabled:
+        from app.scheduler.task_dispatcher import TaskDispatcher
+
+        logger.info("Starting warm executor pool...")
+        container_pool = TaskDispatcher.get_container_pool()
+        interval = max(1, int(settings.warm_pool_refill_interval_seconds))
+        scheduler.add_job(
+            container_pool.start_warm_pool,
+            id="refill-warm-pool-bootstrap",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            container_pool.refill_warm_pool,
+            trigger="interval",
+            seconds=interval,
+            id="refill-warm-pool",
+            replace_existing=True,
+        )
+        logger.info("Warm executor pool started", extra={"interval_seconds": interval})
+
     if settings.workspace_cleanup_enabled:
         from app.services.cleanup_service import CleanupService
 
@@ -77,6 +108,19 @@ async def lifespan(app: FastAPI):
         await pull_service.shutdown()
         logger.info("Run pull service stopped")
 
+    if container_pool:
+        logger.info("Stopping warm executor pool...")
+        with suppress(Exception):
+            scheduler.remove_job("refill-warm-pool")
+        await container_pool.shutdown_warm_pool()
+        logger.info("Warm executor pool stopped")
+
     logger.info("Shutting down APScheduler...")
     scheduler.shutdown()
     logger.info("APScheduler shut down")
+
+    from app.services.callback_forwarder import callback_forwarder
+
+    await callback_forwarder.shutdown()
+    await close_http_client()
+    logger.info("HTTP client closed")
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,54 @@ class Settings(BaseSettings):
     executor_url: str = Field(default="http://localhost:8080")
     callback_base_url: str = Field(default="http://localhost:8001")
 
+    # Shared outbound HTTP client (Backend + Executor calls reuse one keep-alive pool).
+    # HTTP/2 requires the optional `h2` package (httpx[http2]); falls back to HTTP/1.1.
+    http_client_http2: bool = Field(default=False, alias="HTTP_CLIENT_HTTP2")
+    http_client_max_connections: int = Field(
+        default=100, alias="HTTP_CLIENT_MAX_CONNECTIONS"
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=20, alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    # 0 disables the per-host cap. Long-polls to the backend are not counted against it.
+    http_client_max_connections_per_host: int = Field(
+        default=50, alias="HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST"
+    )
+    # Long-polls (run wakeups, user input waits) use their own pool with this many
+    # connections, so idle waits never take connections from regular requests.
+    http_client_max_long_poll_connections: int = Field(
+        default=50, alias="HTTP_CLIENT_MAX_LONG_POLL_CONNECTIONS"
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=30.0, alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    http_client_timeout_seconds: float = Field(
+        default=30.0, alias="HTTP_CLIENT_TIMEOUT_SECONDS"
+    )
+    http_client_connect_timeout_seconds: float = Field(
+        default=5.0, alias="HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS"
+    )
+
+    # Executor callbacks are forwarded to the Backend in batches: callbacks arriving while
+    # a batch is in flight (optionally waiting CALLBACK_BATCH_WINDOW_MS) are sent together
+    # and stored in one transaction. CALLBACK_BATCH_MAX_SIZE<=1 forwards one at a time.
+    callback_batch_max_size: int = Field(default=200, alias="CALLBACK_BATCH_MAX_SIZE")
+    callback_batch_window_ms: int = Field(default=0, alias="CALLBACK_BATCH_WINDOW_MS")
+
+    # Resolved config cache (env map, MCP/skill/plugin configs, slash commands, subagents).
+    # Entries are revalidated against backend version stamps on every lookup; the TTL only
+    # bounds how long an unchanged entry is reused. Stamps are reused for a short window so
+    # one dispatch fetches them once. Set CONFIG_CACHE_TTL_SECONDS=0 to disable caching.
+    config_cache_ttl_seconds: float = Field(
+        default=60.0, alias="CONFIG_CACHE_TTL_SECONDS"
+    )
+    config_cache_version_ttl_seconds: float = Field(
+        default=2.0, alias="CONFIG_CACHE_VERSION_TTL_SECONDS"
+    )
+    config_cache_max_entries: int = Field(
+        default=1024, alias="CONFIG_CACHE_MAX_ENTRIES"
+    )
+
     # Scheduler configuration
     max_concurrent_tasks: int = Field(default=5)
     task_timeout_seconds: int = Field(default=3600)
@@ -34,10 +83,14 @@ class Settings(BaseSettings):
     task_pull_interval_seconds: int = Field(
         default=2, alias="TASK_PULL_INTERVAL_SECONDS"
     )
-    # NOTE: This lease must cover "claim -> start_run" time on the manager side. That path can
-    # include staging skills/attachments + spawning the executor container, which may take
-    # longer than 30s on slow networks or large repos.
-    task_claim_lease_seconds: int = Field(default=180, alias="TASK_CLAIM_LEASE_SECONDS")
+    # Lease of a claimed run until start_run. The manager renews it with a batched heartbeat
+    # every lease/3 while staging and container start are in progress, so it can stay short:
+    # a crashed worker's runs are requeued after one lease.
+    task_claim_lease_seconds: int = Field(default=30, alias="TASK_CLAIM_LEASE_SECONDS")
+    # Long-poll wakeups: interval pull rules also keep a wait request open on the backend,
+    # which returns as soon as a run is enqueued/becomes due, then poll. Interval polling
+    # remains the fallback. Set to 0 to disable.
+    task_pull_wait_seconds: int = Field(default=20, alias="TASK_PULL_WAIT_SECONDS")
 
     # Optional schedule config file (TOML/JSON). When provided, it becomes the source of truth.
     schedule_config_path: str | None = Field(default=None, alias="SCHEDULE_CONFIG_PATH")
@@ -101,10 +154,30 @@ class Settings(BaseSettings):
     executor_browser_image: str | None = Field(
         default="ghcr.io/poco-ai/poco-executor:full", alias="EXECUTOR_BROWSER_IMAGE"
     )
+    # The docker SDK is blocking: Docker API calls run on a bounded thread pool of this size
+    # so container starts/stops never stall the event loop and proceed concurrently.
+    docker_api_max_workers: int = Field(default=16, alias="DOCKER_API_MAX_WORKERS")
     # Default desktop viewport used by the Playwright MCP inside executor containers.
     poco_browser_viewport_size: str = Field(
         default="1366x768", alias="POCO_BROWSER_VIEWPORT_SIZE"
     )
+    # Warm executor pool: pre-started, unbound containers that new sessions claim and bind to
+    # their workspace instead of paying a cold `docker run` + readiness wait. Sized per image.
+    warm_pool_enabled: bool = Field(default=False, alias="WARM_POOL_ENABLED")
+    warm_pool_min_size: int = Field(default=1, alias="WARM_POOL_MIN_SIZE")
+    warm_pool_max_size: int = Field(default=3, alias="WARM_POOL_MAX_SIZE")
+    warm_pool_browser_min_size: int = Field(
+        default=0, alias="WARM_POOL_BROWSER_MIN_SIZE"
+    )
+    warm_pool_browser_max_size: int = Field(
+        default=1, alias="WARM_POOL_BROWSER_MAX_SIZE"
+    )
+    warm_pool_idle_ttl_seconds: int = Field(
+        default=1800, alias="WARM_POOL_IDLE_TTL_SECONDS"
+    )
+    warm_pool_refill_interval_seconds: int = Field(
+        default=10, alias="WARM_POOL_REFILL_INTERVAL_SECONDS"
+    )
     # When the manager spawns executor containers via the Docker daemon, it maps the executor
     # service to a host port and then calls back into it. This host must be reachable from the
     # manager process itself (e.g. "localhost" on bare-metal, or "host.docker.internal" when
@@ -129,6 +202,19 @@ class Settings(BaseSettings):
     workspace_ignore_dot_files: bool = Field(
         default=True, alias="WORKSPACE_IGNORE_DOT_FILES"
     )
+    # Workspace export hashes and uploads changed files on this many threads.
+    workspace_export_concurrency: int = Field(
+        default=8, alias="WORKSPACE_EXPORT_CONCURRENCY"
+    )
+    # Host-level cache of downloaded skill/plugin/attachment objects keyed by S3 key+ETag.
+    # Defaults to WORKSPACE_ROOT/temp/blob-cache. Link modes: auto (reflink, else copy),
+    # hardlink (shares the inode; only for read-only staging), copy.
+    blob_cache_enabled: bool = Field(default=True, alias="BLOB_CACHE_ENABLED")
+    blob_cache_dir: str | None = Field(default=None, alias="BLOB_CACHE_DIR")
+    blob_cache_max_bytes: int = Field(default=5 * 1024**3, alias="BLOB_CACHE_MAX_BYTES")
+    blob_cache_link_mode: Literal["auto", "hardlink", "copy"] = Field(
+        default="auto", alias="BLOB_CACHE_LINK_MODE"
+    )
     s3_endpoint: str | None = Field(default=None, alias="S3_ENDPOINT")
     s3_access_key: str | None = Field(default=None, alias="S3_ACCESS_KEY")
     s3_secret_key: str | None = Field(default=None, alias="S3_SECRET_KEY")
@@ -140,6 +226,11 @@ class Settings(BaseSettings):
     )
     s3_read_timeout_seconds: int = Field(default=60, alias="S3_READ_TIMEOUT_SECONDS")
     s3_max_attempts: int = Field(default=3, alias="S3_MAX_ATTEMPTS")
+    # Parallel object downloads when staging a prefix (skills/plugins) or many inputs.
+    s3_download_concurrency: int = Field(default=8, alias="S3_DOWNLOAD_CONCURRENCY")
+    # Threads running the blocking stagers (S3 downloads, git clone, file writes). The
+    # stages of one dispatch run concurrently and overlap with container acquisition.
+    staging_max_workers: int = Field(default=16, alias="STAGING_MAX_WORKERS")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 
@@ -16,11 +17,7 @@ from app.services.backend_client import BackendClient
 from app.services.container_pool import ContainerPool
 from app.services.executor_client import ExecutorClient
 from app.services.config_resolver import ConfigResolver
-from app.services.skill_stager import SkillStager
-from app.services.plugin_stager import PluginStager
-from app.services.attachment_stager import AttachmentStager
-from app.services.slash_command_stager import SlashCommandStager
-from app.services.sub_agent_stager import SubAgentStager
+from app.services.staging_pipeline import StagingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +62,7 @@ class TaskDispatcher:
         backend_client = BackendClient()
         container_pool = TaskDispatcher.get_container_pool()
         config_resolver = ConfigResolver(backend_client)
-        skill_stager = SkillStager()
-        plugin_stager = PluginStager()
-        attachment_stager = AttachmentStager()
-        slash_command_stager = SlashCommandStager()
-        subagent_stager = SubAgentStager()
+        staging_pipeline = StagingPipeline(backend_client, config_resolver)
 
         user_id = config.get("user_id", "")
         container_mode = config.get("container_mode", "ephemeral")
@@ -119,131 +112,45 @@ class TaskDispatcher:
                 },
             )
 
-            step_started = time.perf_counter()
-            staged_skills = skill_stager.stage_skills(
-                user_id=user_id,
-                session_id=session_id,
-                skills=resolved_config.get("skill_files") or {},
-            )
-            resolved_config["skill_files"] = staged_skills
-            logger.info(
-                "timing",
-                extra={
-                    "step": "task_dispatch_stage_skills",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "task_id": task_id,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "skills_staged": len(staged_skills),
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_plugins = plugin_stager.stage_plugins(
-                user_id=user_id,
-                session_id=session_id,
-                plugins=resolved_config.get("plugin_files") or {},
-            )
-            resolved_config["plugin_files"] = staged_plugins
-            logger.info(
-                "timing",
-                extra={
-                    "step": "task_dispatch_stage_plugins",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "task_id": task_id,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "plugins_staged": len(staged_plugins),
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_inputs = attachment_stager.stage_inputs(
-                user_id=user_id,
-                session_id=session_id,
-                inputs=resolved_config.get("input_files") or [],
-            )
-            resolved_config["input_files"] = staged_inputs
-            logger.info(
-                "timing",
-                extra={
-                    "step": "task_dispatch_stage_inputs",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "task_id": task_id,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "inputs_staged": len(staged_inputs),
-                },
-            )
-
-            step_started = time.perf_counter()
-            resolved_commands = await backend_client.resolve_slash_commands(
-                user_id=user_id
-            )
-            staged_commands = slash_command_stager.stage_commands(
-                user_id=user_id,
-                session_id=session_id,
-                commands=resolved_commands,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "task_dispatch_stage_slash_commands",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "task_id": task_id,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "commands_staged": len(staged_commands),
-                },
-            )
-
-            step_started = time.perf_counter()
-            raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
-            raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
-            try:
-                staged_agents = subagent_stager.stage_raw_agents(
-                    user_id=user_id,
+            browser_enabled = bool(resolved_config.get("browser_enabled"))
+            log_context = {
+                "task_id": task_id,
+                "session_id": session_id,
+                "user_id": user_id,
+            }
+
+            async def acquire_container(
+                workspace_ready: asyncio.Future[None],
+            ) -> tuple[str, str]:
+                step_started = time.perf_counter()
+                result = await container_pool.get_or_create_container(
                     session_id=session_id,
-                    raw_agents=raw_agents,
+                    user_id=user_id,
+                    browser_enabled=browser_enabled,
+                    container_mode=container_mode,
+                    container_id=container_id,
+                    workspace_ready=workspace_ready,
                 )
                 logger.info(
                     "timing",
                     extra={
-                        "step": "task_dispatch_stage_subagents",
+                        "step": "task_dispatch_get_or_create_container",
                         "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "task_id": task_id,
-                        "session_id": session_id,
-                        "user_id": user_id,
-                        "subagents_requested": len(raw_agents),
-                        "subagents_staged": len(staged_agents),
+                        **log_context,
+                        "container_id": result[1],
+                        "container_mode": container_mode,
+                        "browser_enabled": browser_enabled,
                     },
                 )
-            except Exception as exc:
-                logger.warning(
-                    f"Failed to stage subagents for session {session_id}: {exc}"
-                )
+                return result
 
-            step_started = time.perf_counter()
-            browser_enabled = bool(resolved_config.get("browser_enabled"))
-            executor_url, container_id = await container_pool.get_or_create_container(
-                session_id=session_id,
+            executor_url, container_id = await staging_pipeline.stage_and_acquire(
+                acquire_container,
                 user_id=user_id,
-                browser_enabled=browser_enabled,
-                container_mode=container_mode,
-                container_id=container_id,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "task_dispatch_get_or_create_container",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "task_id": task_id,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "container_id": container_id,
-                    "container_mode": container_mode,
-                    "browser_enabled": browser_enabled,
-                },
+                session_id=session_id,
+                resolved_config=resolved_config,
+                step_prefix="task_dispatch",
+                log_context=log_context,
             )
 
             step_started = time.perf_counter()
@@ -67,6 +67,28 @@ class AgentCurrentState(BaseModel):
     current_step: str | None = None
 
 
+class WorkspaceStateDelta(BaseModel):
+    """Workspace changes since the previous state version."""
+
+    repository: str | None = None
+    branch: str | None = None
+    last_change: datetime
+    file_changes_upsert: list[FileChange] = Field(default_factory=list)
+    file_changes_removed: list[str] = Field(default_factory=list)
+
+
+class AgentStateDelta(BaseModel):
+    """Changes to AgentCurrentState relative to state version `base_version`."""
+
+    base_version: int
+    changed: list[str] = Field(default_factory=list)
+    todos: list[TodoItem] | None = None
+    mcp_status: list[McpStatus] | None = None
+    browser: BrowserState | None = None
+    workspace_state: WorkspaceStateDelta | None = None
+    current_step: str | None = None
+
+
 class AgentCallbackRequest(BaseModel):
     """Agent execution callback request."""
 
@@ -77,6 +99,8 @@ class AgentCallbackRequest(BaseModel):
     error_message: str | None = None
     new_message: object | None = None
     state_patch: AgentCurrentState | None = None
+    state_delta: AgentStateDelta | None = None
+    state_version: int | None = None
     sdk_session_id: str | None = None
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
@@ -84,6 +108,12 @@ class AgentCallbackRequest(BaseModel):
     workspace_export_status: str | None = None
 
 
+class AgentCallbackBatchRequest(BaseModel):
+    """Batch of executor callbacks, in the order they were produced."""
+
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list, max_length=500)
+
+
 class CallbackReceiveResponse(BaseModel):
     """Callback receive response."""
 
@@ -97,3 +97,4 @@ class ContainerStatsResponse(BaseModel):
     persistent_containers: int
     ephemeral_containers: int
     containers: list[dict]
+    warm_pool: dict = Field(default_factory=dict)
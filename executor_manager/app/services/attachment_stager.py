@@ -9,7 +9,7 @@ from urllib.parse import urlparse
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.services.storage_service import S3StorageService
+from app.services.storage_service import DownloadItem, S3StorageService
 from app.services.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
@@ -45,6 +45,7 @@ class AttachmentStager:
         inputs_root.mkdir(parents=True, exist_ok=True)
 
         staged: list[dict[str, Any]] = []
+        downloads: list[tuple[DownloadItem, str, str]] = []
         for item in inputs:
             if not isinstance(item, dict):
                 continue
@@ -68,22 +69,13 @@ class AttachmentStager:
                     )
                 destination = inputs_root / rel_path
                 destination.parent.mkdir(parents=True, exist_ok=True)
-                step_started = time.perf_counter()
-                self.storage_service.download_file(
-                    key=str(s3_key), destination=destination
-                )
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "input_stage_file_download",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "user_id": user_id,
-                        "session_id": session_id,
-                        # "name" is reserved in LogRecord (logger name).
-                        "input_name": name or destination.name,
-                        "rel_path": rel_path,
-                        "s3_key": str(s3_key),
-                    },
+                # Files are downloaded together after the loop; keep input order.
+                downloads.append(
+                    (
+                        DownloadItem(key=str(s3_key), destination=destination),
+                        name or destination.name,
+                        rel_path,
+                    )
                 )
                 staged.append(
                     self._build_staged(item, rel_path, name or destination.name)
@@ -117,6 +109,27 @@ class AttachmentStager:
                 staged.append(self._build_staged(item, rel_path, name or repo_name))
                 continue
 
+        if downloads:
+            results = self.storage_service.download_files(
+                [download for download, _, _ in downloads]
+            )
+            for (download, input_name, rel_path), result in zip(downloads, results):
+                logger.info(
+                    "timing",
+                    extra={
+                        "step": "input_stage_file_download",
+                        "duration_ms": result.duration_ms,
+                        "user_id": user_id,
+                        "session_id": session_id,
+                        # "name" is reserved in LogRecord (logger name).
+                        "input_name": input_name,
+                        "rel_path": rel_path,
+                        "s3_key": download.key,
+                        "cache_hit": result.cache_hit,
+                        "bytes": result.size,
+                    },
+                )
+
         logger.info(
             "timing",
             extra={
@@ -1,5 +1,6 @@
 import httpx
 
+from app.core.http_client import LONG_POLL_EXTENSIONS, get_http_client
 from app.core.settings import get_settings
 from app.core.observability.request_context import (
     generate_request_id,
@@ -26,35 +27,47 @@ class BackendClient:
 
     async def create_session(self, user_id: str, config: dict) -> dict:
         """Create a session, returns session info dict with session_id and sdk_session_id."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/sessions",
-                json={"user_id": user_id, "config": config},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/sessions",
+            json={"user_id": user_id, "config": config},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def update_session_status(self, session_id: str, status: str) -> None:
         """Update session status."""
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/api/v1/sessions/{session_id}",
-                json={"status": status},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.patch(
+            f"{self.base_url}/api/v1/sessions/{session_id}",
+            json={"status": status},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
 
     async def forward_callback(self, callback_data: dict) -> None:
         """Forward Executor callback to Backend."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/callback",
-                json=callback_data,
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/callback",
+            json=callback_data,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+
+    async def forward_callbacks(self, callbacks: list[dict]) -> list[dict]:
+        """Forward a batch of Executor callbacks to Backend in one request."""
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/callback/batch",
+            json={"callbacks": callbacks},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data") or []
 
     async def claim_run(
         self,
@@ -67,103 +80,194 @@ class BackendClient:
         if schedule_modes:
             payload["schedule_modes"] = schedule_modes
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/claim",
-                json=payload,
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data")
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/claim",
+            json=payload,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data")
+
+    async def claim_run_batch(
+        self,
+        worker_id: str,
+        max_runs: int,
+        lease_seconds: int = 30,
+        schedule_modes: list[str] | None = None,
+    ) -> list[dict]:
+        """Claim up to `max_runs` runs from backend queue in one round trip."""
+        payload: dict = {
+            "worker_id": worker_id,
+            "max_runs": max(1, int(max_runs)),
+            "lease_seconds": lease_seconds,
+        }
+        if schedule_modes:
+            payload["schedule_modes"] = schedule_modes
+
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/claim-batch",
+            json=payload,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data.get("data") or {}
+        runs = result.get("runs") if isinstance(result, dict) else None
+        return [r for r in runs or [] if isinstance(r, dict)]
+
+    async def wait_for_runs(
+        self,
+        schedule_modes: list[str] | None = None,
+        wait_seconds: float = 20,
+    ) -> bool:
+        """Long-poll until a run is claimable (nothing is claimed)."""
+        payload: dict = {"wait_seconds": wait_seconds}
+        if schedule_modes:
+            payload["schedule_modes"] = schedule_modes
+
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/wait",
+            json=payload,
+            headers=self._trace_headers(),
+            timeout=httpx.Timeout(wait_seconds + 15.0, connect=5.0),
+            extensions=LONG_POLL_EXTENSIONS,
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data.get("data") or {}
+        return bool(result.get("available")) if isinstance(result, dict) else False
 
     async def start_run(self, run_id: str, worker_id: str) -> dict:
         """Mark run as running."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/{run_id}/start",
-                json={"worker_id": worker_id},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/start",
+            json={"worker_id": worker_id},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
+
+    async def heartbeat_runs(
+        self, worker_id: str, run_ids: list[str], lease_seconds: int
+    ) -> dict:
+        """Renew the claim leases of runs in one request.
+
+        Returns:
+            {"renewed": [...], "lost": [...]} run ids.
+        """
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/heartbeat",
+            json={
+                "worker_id": worker_id,
+                "run_ids": run_ids,
+                "lease_seconds": lease_seconds,
+            },
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def fail_run(
         self, run_id: str, worker_id: str, error_message: str | None = None
     ) -> dict:
         """Mark run as failed."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/{run_id}/fail",
-                json={"worker_id": worker_id, "error_message": error_message},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/fail",
+            json={"worker_id": worker_id, "error_message": error_message},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def get_env_map(self, user_id: str) -> dict[str, str]:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/env-vars/map",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/env-vars/map",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
+
+    async def get_config_versions(self, user_id: str) -> dict[str, str]:
+        """Fetch version stamps for the user's resolvable config (used for caching)."""
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/config-versions",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        versions = data.get("data", {}) or {}
+        if not isinstance(versions, dict):
+            return {}
+        return {str(k): str(v) for k, v in versions.items()}
 
     async def resolve_mcp_config(self, user_id: str, server_ids: list[int]) -> dict:
         """Resolve effective MCP config for execution based on selected server ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/mcp-config/resolve",
-                json={"server_ids": server_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/mcp-config/resolve",
+            json={"server_ids": server_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_skill_config(self, user_id: str, skill_ids: list[int]) -> dict:
         """Resolve effective skill config for execution based on selected skill ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/skill-config/resolve",
-                json={"skill_ids": skill_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/skill-config/resolve",
+            json={"skill_ids": skill_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_plugin_config(self, user_id: str, plugin_ids: list[int]) -> dict:
         """Resolve effective plugin config for execution based on selected plugin ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/plugin-config/resolve",
-                json={"plugin_ids": plugin_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/plugin-config/resolve",
+            json={"plugin_ids": plugin_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_subagents(
         self, user_id: str, subagent_ids: list[int] | None
@@ -176,97 +280,110 @@ class BackendClient:
         payload: dict = {}
         if subagent_ids is not None:
             payload["subagent_ids"] = subagent_ids
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/subagents/resolve",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/subagents/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_slash_commands(
         self, user_id: str, names: list[str] | None = None
     ) -> dict[str, str]:
         """Resolve enabled slash commands for execution (rendered markdown)."""
         payload: dict = {"names": names or []}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/slash-commands/resolve",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            resolved = data.get("data", {}) or {}
-            if not isinstance(resolved, dict):
-                return {}
-            return {str(k): str(v) for k, v in resolved.items() if isinstance(v, str)}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/slash-commands/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        resolved = data.get("data", {}) or {}
+        if not isinstance(resolved, dict):
+            return {}
+        return {str(k): str(v) for k, v in resolved.items() if isinstance(v, str)}
 
     async def get_claude_md(self, user_id: str) -> dict:
         """Fetch user-level CLAUDE.md settings for execution staging."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/claude-md",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get("data", {}) or {}
-            return result if isinstance(result, dict) else {}
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/claude-md",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data.get("data", {}) or {}
+        return result if isinstance(result, dict) else {}
 
     async def dispatch_due_scheduled_tasks(self, limit: int = 50) -> dict:
         """Trigger backend to dispatch due scheduled tasks into the run queue."""
         payload = {"limit": max(1, int(limit))}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/scheduled-tasks/dispatch-due",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/scheduled-tasks/dispatch-due",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def create_user_input_request(self, payload: dict) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/user-input-requests",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
-
-    async def get_user_input_request(self, request_id: str) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/user-input-requests",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
+
+    async def get_user_input_request(
+        self, request_id: str, wait_seconds: float = 0
+    ) -> dict:
+        """Get a user input request.
+
+        With `wait_seconds > 0` the backend long-polls until it is answered or expires.
+        """
+        kwargs: dict = {}
+        if wait_seconds > 0:
+            kwargs["params"] = {"wait_seconds": wait_seconds}
+            kwargs["timeout"] = httpx.Timeout(wait_seconds + 15.0, connect=5.0)
+            kwargs["extensions"] = LONG_POLL_EXTENSIONS
+
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+            **kwargs,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
@@ -0,0 +1,244 @@
+import errno
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+
+class BlobCache:
+    """Host-level, content-addressed cache for objects downloaded from S3.
+
+    Blobs are keyed by (bucket, key, ETag), so a re-uploaded object gets a new entry
+    and stale ones age out through size-bounded LRU eviction. Cached blobs are placed
+    into workspaces by reflink (copy-on-write) when the filesystem supports it,
+    otherwise by copy; `hardlink` mode shares the inode instead, which is only safe
+    when staged files are never modified in place.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int,
+        link_mode: str = "auto",
+    ) -> None:
+        self.root = root
+        self.blobs_dir = root / "blobs"
+        self.tmp_dir = root / "tmp"
+        self.max_bytes = max_bytes
+        self.link_mode = link_mode
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.bytes_downloaded = 0
+        self.evictions = 0
+
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        found: list[tuple[float, str, int]] = []
+        for path in self.blobs_dir.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, path.name, stat.st_size))
+        for _, digest, size in sorted(found):
+            self._entries[digest] = size
+            self._total_bytes += size
+        self._evict_locked()
+
+    @staticmethod
+    def _digest(bucket: str, key: str, etag: str) -> str:
+        etag = etag.strip('"')
+        return hashlib.sha256(f"{bucket}\0{key}\0{etag}".encode()).hexdigest()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / digest
+
+    def fetch(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        etag: str,
+        destination: Path,
+        download: Callable[[Path], None],
+    ) -> tuple[int, bool]:
+        """Place the object at `destination`, calling `download` only on a cache miss.
+
+        Returns:
+            (size in bytes, whether the blob was served from the cache)
+        """
+        digest = self._digest(bucket, key, etag)
+        blob = self._blob_path(digest)
+
+        size = self._lookup(digest, blob)
+        if size is not None:
+            try:
+                self._place(blob, destination)
+            except FileNotFoundError:
+                # Evicted between lookup and placement; fall through to a download.
+                size = None
+        if size is not None:
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += size
+            return size, True
+
+        tmp = self.tmp_dir / f"{digest}.{uuid.uuid4().hex}"
+        try:
+            download(tmp)
+            size = tmp.stat().st_size
+            os.chmod(tmp, 0o444)
+            self._place(tmp, destination)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, blob)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        with self._lock:
+            self.misses += 1
+            self.bytes_downloaded += size
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._total_bytes -= previous
+            self._entries[digest] = size
+            self._total_bytes += size
+            self._evict_locked(keep=digest)
+        return size, False
+
+    def _lookup(self, digest: str, blob: Path) -> int | None:
+        with self._lock:
+            size = self._entries.get(digest)
+            if size is None:
+                return None
+            try:
+                stat = blob.stat()
+            except OSError:
+                stat = None
+            if stat is None or stat.st_size != size:
+                # Missing or modified through a hard link; drop it and refetch.
+                self._entries.pop(digest, None)
+                self._total_bytes -= size
+                if stat is not None:
+                    blob.unlink(missing_ok=True)
+                return None
+            self._entries.move_to_end(digest)
+        try:
+            os.utime(blob)
+        except OSError:
+            pass
+        return size
+
+    def _place(self, blob: Path, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if destination.exists() or destination.is_symlink():
+            destination.unlink()
+
+        if self.link_mode == "hardlink":
+            try:
+                os.link(blob, destination)
+                return
+            except OSError as exc:
+                if exc.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+        if self.link_mode in ("auto", "hardlink") and self._reflink(blob, destination):
+            return
+        shutil.copyfile(blob, destination)
+
+    @staticmethod
+    def _reflink(src: Path, dst: Path) -> bool:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            dst.unlink(missing_ok=True)
+            return False
+
+    def _evict_locked(self, keep: str | None = None) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            digest, size = next(iter(self._entries.items()))
+            if digest == keep:
+                if len(self._entries) == 1:
+                    break
+                self._entries.move_to_end(digest)
+                continue
+            self._entries.pop(digest)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._blob_path(digest).unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning(f"Failed to evict cached blob {digest}: {exc}")
+
+    def get_stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "link_mode": self.link_mode,
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "bytes_downloaded": self.bytes_downloaded,
+                "evictions": self.evictions,
+            }
+
+
+_blob_cache: BlobCache | None = None
+_blob_cache_lock = threading.Lock()
+
+
+def get_blob_cache() -> BlobCache | None:
+    """Get the process-wide blob cache, or None when it is disabled."""
+    global _blob_cache
+    settings = get_settings()
+    if not settings.blob_cache_enabled:
+        return None
+    with _blob_cache_lock:
+        if _blob_cache is None:
+            root = (
+                Path(settings.blob_cache_dir)
+                if settings.blob_cache_dir
+                else Path(settings.workspace_root) / "temp" / "blob-cache"
+            )
+            try:
+                _blob_cache = BlobCache(
+                    root,
+                    max_bytes=settings.blob_cache_max_bytes,
+                    link_mode=settings.blob_cache_link_mode,
+                )
+            except OSError as exc:
+                logger.warning(f"Blob cache disabled, cannot use {root}: {exc}")
+                return None
+        return _blob_cache
+
+
+def get_blob_cache_stats() -> dict[str, object]:
+    cache = get_blob_cache()
+    return cache.get_stats() if cache else {"enabled": False}
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+
+from app.core.settings import get_settings
+from app.services.backend_client import BackendClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Pending:
+    payload: dict
+    future: asyncio.Future[None] = field(repr=False)
+
+
+class CallbackForwarder:
+    """Coalesces callbacks forwarded to the Backend into batched requests (group commit).
+
+    Callers enqueue a payload and wait for the batch that carries it. A single drain task
+    sends everything that queued up while the previous batch was in flight as one
+    `POST /api/v1/callback/batch`, which the Backend applies in one transaction. Order is
+    preserved, and each caller still learns whether its own callback was stored.
+    """
+
+    def __init__(self, backend_client: BackendClient | None = None) -> None:
+        self.settings = get_settings()
+        self.backend_client = backend_client or BackendClient()
+        self._queue: list[_Pending] = []
+        self._wakeup: asyncio.Event | None = None
+        self._drain_task: asyncio.Task[None] | None = None
+        self.batches = 0
+        self.callbacks = 0
+        self.max_batch_size = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.callback_batch_max_size > 1
+
+    async def forward(self, payload: dict) -> None:
+        """Forward one callback payload, returning once the Backend has stored it."""
+        if not self.enabled:
+            await self.backend_client.forward_callback(payload)
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = _Pending(payload=payload, future=loop.create_future())
+        self._queue.append(pending)
+        self._ensure_drain_task()
+        assert self._wakeup is not None
+        self._wakeup.set()
+        await pending.future
+
+    def _ensure_drain_task(self) -> None:
+        if self._drain_task is not None and not self._drain_task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        assert self._wakeup is not None
+        window = max(0.0, self.settings.callback_batch_window_ms / 1000)
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if window and len(self._queue) < self.settings.callback_batch_max_size:
+                await asyncio.sleep(window)
+            while self._queue:
+                batch = self._queue[: self.settings.callback_batch_max_size]
+                del self._queue[: len(batch)]
+                await self._send(batch)
+
+    async def _send(self, batch: list[_Pending]) -> None:
+        started = time.perf_counter()
+        try:
+            results = await self.backend_client.forward_callbacks(
+                [item.payload for item in batch]
+            )
+        except Exception as exc:
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.callbacks += len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        logger.debug(
+            "timing",
+            extra={
+                "step": "callback_forward_batch",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                "batch_size": len(batch),
+            },
+        )
+
+        for index, item in enumerate(batch):
+            if item.future.done():
+                continue
+            result = results[index] if index < len(results) else None
+            if isinstance(result, dict) and result.get("status") == "error":
+                item.future.set_exception(
+                    RuntimeError(result.get("message") or "Backend rejected callback")
+                )
+            else:
+                item.future.set_result(None)
+
+    async def shutdown(self) -> None:
+        task, self._drain_task = self._drain_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        for item in self._queue:
+            if not item.future.done():
+                item.future.set_exception(RuntimeError("Callback forwarder stopped"))
+        self._queue.clear()
+
+    def get_stats(self) -> dict[str, int | bool]:
+        return {
+            "enabled": self.enabled,
+            "pending": len(self._queue),
+            "batches": self.batches,
+            "callbacks": self.callbacks,
+            "max_batch_size": self.max_batch_size,
+        }
+
+
+callback_forwarder = CallbackForwarder()
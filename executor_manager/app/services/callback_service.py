@@ -3,7 +3,7 @@ import logging
 from datetime import datetime, timezone
 
 from app.schemas.callback import AgentCallbackRequest, CallbackReceiveResponse
-from app.services.backend_client import BackendClient
+from app.services.callback_forwarder import callback_forwarder
 from app.services.workspace_export_service import (
     WorkspaceExportService,
     workspace_manager,
@@ -12,7 +12,6 @@ from app.services.workspace_export_service import (
 logger = logging.getLogger(__name__)
 
 
-backend_client = BackendClient()
 workspace_export_service = WorkspaceExportService()
 
 
@@ -114,6 +113,57 @@ class CallbackService:
         )
         return callback.model_copy(update={"state_patch": updated_state})
 
+    @classmethod
+    def _filter_state_delta(
+        cls, callback: AgentCallbackRequest
+    ) -> AgentCallbackRequest:
+        """Apply the state_patch filters to a state delta."""
+        delta = callback.state_delta
+        if not delta:
+            return callback
+
+        update: dict = {}
+        if delta.mcp_status:
+            filtered_mcp = [
+                m
+                for m in delta.mcp_status
+                if not cls._is_internal_mcp_server(m.server_name)
+            ]
+            if len(filtered_mcp) != len(delta.mcp_status):
+                update["mcp_status"] = filtered_mcp
+
+        workspace_delta = delta.workspace_state
+        if workspace_delta and workspace_delta.file_changes_upsert:
+            filtered_changes = [
+                fc
+                for fc in workspace_delta.file_changes_upsert
+                if not cls._is_ignored_workspace_path(fc.path)
+            ]
+            if len(filtered_changes) != len(workspace_delta.file_changes_upsert):
+                update["workspace_state"] = workspace_delta.model_copy(
+                    update={"file_changes_upsert": filtered_changes}
+                )
+
+        if not update:
+            return callback
+        return callback.model_copy(
+            update={"state_delta": delta.model_copy(update=update)}
+        )
+
+    async def process_callbacks(
+        self, callbacks: list[AgentCallbackRequest]
+    ) -> list[CallbackReceiveResponse]:
+        """Process a batch of executor callbacks in order."""
+        if not callback_forwarder.enabled:
+            return [await self.process_callback(callback) for callback in callbacks]
+        # Each callback reaches the forwarder queue before its task first yields, so
+        # they are still forwarded in order and share Backend batches.
+        return list(
+            await asyncio.gather(
+                *(self.process_callback(callback) for callback in callbacks)
+            )
+        )
+
     async def process_callback(
         self, callback: AgentCallbackRequest
     ) -> CallbackReceiveResponse:
@@ -148,7 +198,7 @@ class CallbackService:
             },
         )
 
-        callback = self._filter_state_patch(callback)
+        callback = self._filter_state_delta(self._filter_state_patch(callback))
 
         if callback.state_patch:
             state = callback.state_patch
@@ -175,8 +225,8 @@ class CallbackService:
                 )
             payload = payload_model.model_dump(mode="json")
 
-            # Forward callback to backend
-            await backend_client.forward_callback(payload)
+            # Forward callback to backend (batched with concurrent callbacks)
+            await callback_forwarder.forward(payload)
 
             if callback.status in ["completed", "failed"]:
                 from app.scheduler.task_dispatcher import TaskDispatcher
@@ -237,7 +287,7 @@ class CallbackService:
         payload = payload_model.model_dump(mode="json")
 
         try:
-            await backend_client.forward_callback(payload)
+            await callback_forwarder.forward(payload)
         except Exception:
             logger.exception(
                 "workspace_export_callback_forward_failed",
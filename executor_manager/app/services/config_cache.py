@@ -0,0 +1,114 @@
+import asyncio
+import copy
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.settings import get_settings
+from app.services.backend_client import BackendClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    version: str
+    expires_at: float
+
+
+class ConfigCache:
+    """Per-user cache of resolved config fetched from the backend.
+
+    Each entry remembers the backend version stamp of its kind (see
+    `/internal/config-versions`). A lookup is a hit only when the entry is within its
+    TTL and the stamp still matches, so edits made in the UI are picked up on the next
+    run. When stamps are unavailable the cache is bypassed.
+    """
+
+    def __init__(self) -> None:
+        self.settings = get_settings()
+        self._entries: OrderedDict[tuple[str, str, Hashable], _Entry] = OrderedDict()
+        self._versions: dict[str, tuple[dict[str, str], float]] = {}
+        self._version_locks: dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.config_cache_ttl_seconds > 0
+
+    async def get_versions(
+        self, backend_client: BackendClient, user_id: str
+    ) -> dict[str, str]:
+        """Get version stamps for a user, reusing a very recent fetch."""
+        if not self.enabled:
+            return {}
+        lock = self._version_locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            cached = self._versions.get(user_id)
+            now = time.monotonic()
+            if cached and cached[1] > now:
+                return cached[0]
+            try:
+                versions = await backend_client.get_config_versions(user_id=user_id)
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to fetch config versions for user {user_id}: {exc}"
+                )
+                self._versions.pop(user_id, None)
+                return {}
+            self._versions[user_id] = (
+                versions,
+                now + self.settings.config_cache_version_ttl_seconds,
+            )
+            return versions
+
+    async def get_or_fetch(
+        self,
+        user_id: str,
+        kind: str,
+        key: Hashable,
+        versions: dict[str, str],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """Return `(value, hit)` for a cached config, calling `fetch` on a miss.
+
+        Values are deep-copied on the way in and out so callers may mutate them.
+        """
+        version = versions.get(kind)
+        if not self.enabled or not version:
+            return await fetch(), False
+
+        cache_key = (user_id, kind, key)
+        entry = self._entries.get(cache_key)
+        now = time.monotonic()
+        if entry and entry.version == version and entry.expires_at > now:
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return copy.deepcopy(entry.value), True
+
+        self.misses += 1
+        value = await fetch()
+        self._entries[cache_key] = _Entry(
+            value=copy.deepcopy(value),
+            version=version,
+            expires_at=now + self.settings.config_cache_ttl_seconds,
+        )
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > max(1, self.settings.config_cache_max_entries):
+            self._entries.popitem(last=False)
+        return value, False
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+config_cache = ConfigCache()
@@ -1,12 +1,15 @@
+import asyncio
 import logging
 import re
 import time
+from collections.abc import Awaitable
 from typing import Any
 from urllib.parse import urlparse
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.services.backend_client import BackendClient
+from app.services.config_cache import config_cache
 
 
 _ENV_PATTERN = re.compile(r"\$\{([^}]+)\}")
@@ -48,6 +51,18 @@ def _resolve_env_value(value: Any, env_map: dict[str, str]) -> Any:
     return value
 
 
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """Like asyncio.gather, but cancels the remaining lookups when one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 class ConfigResolver:
     def __init__(self, backend_client: BackendClient | None = None) -> None:
         self.backend_client = backend_client or BackendClient()
@@ -70,65 +85,57 @@ class ConfigResolver:
         }
 
         step_started = time.perf_counter()
-        env_map = await self._get_env_map(user_id)
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_env_map",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                **ctx,
-            },
-        )
-
-        step_started = time.perf_counter()
-        mcp_config = await self._resolve_effective_mcp_config(user_id, config_snapshot)
+        versions = await config_cache.get_versions(self.backend_client, user_id)
         logger.info(
             "timing",
             extra={
-                "step": "config_resolve_mcp_config",
+                "step": "config_resolve_versions",
                 "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "mcp_servers": len(mcp_config) if isinstance(mcp_config, dict) else 0,
+                "cache_enabled": bool(versions),
                 **ctx,
             },
         )
 
-        step_started = time.perf_counter()
-        skill_files = await self._resolve_effective_skill_files(
-            user_id, config_snapshot
-        )
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_skill_files",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "skills": len(skill_files) if isinstance(skill_files, dict) else 0,
-                **ctx,
-            },
+        # The backend lookups are independent of each other; fetch them concurrently.
+        (
+            env_map,
+            mcp_config,
+            skill_files,
+            plugin_files,
+            resolved_subagents,
+        ) = await _gather_or_cancel(
+            self._timed(
+                "config_resolve_env_map",
+                self._get_env_map(user_id, versions),
+                ctx,
+            ),
+            self._timed(
+                "config_resolve_mcp_config",
+                self._resolve_effective_mcp_config(user_id, config_snapshot, versions),
+                ctx,
+                count_key="mcp_servers",
+            ),
+            self._timed(
+                "config_resolve_skill_files",
+                self._resolve_effective_skill_files(user_id, config_snapshot, versions),
+                ctx,
+                count_key="skills",
+            ),
+            self._timed(
+                "config_resolve_plugin_files",
+                self._resolve_effective_plugin_files(
+                    user_id, config_snapshot, versions
+                ),
+                ctx,
+                count_key="plugins",
+            ),
+            self._timed(
+                "config_resolve_subagents",
+                self._resolve_subagents_or_empty(user_id, config_snapshot, versions),
+                ctx,
+            ),
         )
         input_files = config_snapshot.get("input_files") or []
-
-        step_started = time.perf_counter()
-        plugin_files = await self._resolve_effective_plugin_files(
-            user_id, config_snapshot
-        )
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_plugin_files",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "plugins": len(plugin_files) if isinstance(plugin_files, dict) else 0,
-                **ctx,
-            },
-        )
-
-        step_started = time.perf_counter()
-        try:
-            resolved_subagents = await self._resolve_effective_subagents(
-                user_id, config_snapshot
-            )
-        except Exception as exc:
-            logger.warning(f"Failed to resolve subagents for user {user_id}: {exc}")
-            resolved_subagents = {}
         structured_agents = (
             resolved_subagents.get("structured_agents")
             if isinstance(resolved_subagents, dict)
@@ -139,20 +146,6 @@ class ConfigResolver:
             if isinstance(resolved_subagents, dict)
             else None
         )
-        structured_count = (
-            len(structured_agents) if isinstance(structured_agents, dict) else 0
-        )
-        raw_count = len(raw_agents) if isinstance(raw_agents, dict) else 0
-        logger.info(
-            "timing",
-            extra={
-                "step": "config_resolve_subagents",
-                "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                "subagents_structured": structured_count,
-                "subagents_raw": raw_count,
-                **ctx,
-            },
-        )
 
         step_started = time.perf_counter()
         resolved_mcp = self._resolve_mcp(mcp_config, env_map)
@@ -194,6 +187,39 @@ class ConfigResolver:
         )
         return resolved
 
+    async def resolve_slash_commands(self, user_id: str) -> dict[str, str]:
+        """Resolve the user's enabled slash commands (cached like the rest of config)."""
+        versions = await config_cache.get_versions(self.backend_client, user_id)
+        commands, _ = await config_cache.get_or_fetch(
+            user_id,
+            "slash_commands",
+            None,
+            versions,
+            lambda: self.backend_client.resolve_slash_commands(user_id=user_id),
+        )
+        return commands
+
+    @staticmethod
+    async def _timed(
+        step: str,
+        coro: Awaitable[tuple[Any, bool]],
+        ctx: dict,
+        *,
+        count_key: str | None = None,
+    ) -> Any:
+        step_started = time.perf_counter()
+        value, cache_hit = await coro
+        extra: dict[str, Any] = {
+            "step": step,
+            "duration_ms": int((time.perf_counter() - step_started) * 1000),
+            "cache_hit": cache_hit,
+            **ctx,
+        }
+        if count_key:
+            extra[count_key] = len(value) if isinstance(value, dict) else 0
+        logger.info("timing", extra=extra)
+        return value
+
     @staticmethod
     def _resolve_git_token(config_snapshot: dict, env_map: dict[str, str]) -> dict:
         """Resolve git token for private GitHub repos.
@@ -228,12 +254,20 @@ class ConfigResolver:
 
         return {"git_token": token}
 
-    async def _get_env_map(self, user_id: str) -> dict[str, str]:
-        return await self.backend_client.get_env_map(user_id=user_id)
+    async def _get_env_map(
+        self, user_id: str, versions: dict[str, str]
+    ) -> tuple[dict[str, str], bool]:
+        return await config_cache.get_or_fetch(
+            user_id,
+            "env_vars",
+            None,
+            versions,
+            lambda: self.backend_client.get_env_map(user_id=user_id),
+        )
 
     async def _resolve_effective_mcp_config(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
+        self, user_id: str, config_snapshot: dict, versions: dict[str, str]
+    ) -> tuple[dict, bool]:
         """Resolve MCP config for execution.
 
         Priority:
@@ -241,24 +275,26 @@ class ConfigResolver:
         2) config_snapshot.mcp_config toggles (server_id -> bool) -> fetch via backend internal API
         3) legacy config_snapshot.mcp_config already contains full server configs
         """
-        server_ids = self._normalize_ids(config_snapshot.get("mcp_server_ids"))
-        if server_ids:
-            return await self.backend_client.resolve_mcp_config(
-                user_id=user_id, server_ids=server_ids
-            )
-
         mcp_config = config_snapshot.get("mcp_config")
-        toggle_ids = self._extract_enabled_ids_from_toggles(mcp_config)
-        if toggle_ids is not None:
-            return await self.backend_client.resolve_mcp_config(
-                user_id=user_id, server_ids=toggle_ids
+        server_ids = self._normalize_ids(config_snapshot.get("mcp_server_ids"))
+        if not server_ids:
+            server_ids = self._extract_enabled_ids_from_toggles(mcp_config)
+        if server_ids is not None:
+            return await config_cache.get_or_fetch(
+                user_id,
+                "mcp",
+                tuple(server_ids),
+                versions,
+                lambda: self.backend_client.resolve_mcp_config(
+                    user_id=user_id, server_ids=server_ids
+                ),
             )
 
-        return mcp_config if isinstance(mcp_config, dict) else {}
+        return (mcp_config if isinstance(mcp_config, dict) else {}), False
 
     async def _resolve_effective_skill_files(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
+        self, user_id: str, config_snapshot: dict, versions: dict[str, str]
+    ) -> tuple[dict, bool]:
         """Resolve skills for execution.
 
         Priority:
@@ -267,16 +303,22 @@ class ConfigResolver:
         """
         skill_ids = self._normalize_ids(config_snapshot.get("skill_ids"))
         if skill_ids:
-            return await self.backend_client.resolve_skill_config(
-                user_id=user_id, skill_ids=skill_ids
+            return await config_cache.get_or_fetch(
+                user_id,
+                "skills",
+                tuple(skill_ids),
+                versions,
+                lambda: self.backend_client.resolve_skill_config(
+                    user_id=user_id, skill_ids=skill_ids
+                ),
             )
 
         legacy = config_snapshot.get("skill_files")
-        return legacy if isinstance(legacy, dict) else {}
+        return (legacy if isinstance(legacy, dict) else {}), False
 
     async def _resolve_effective_plugin_files(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
+        self, user_id: str, config_snapshot: dict, versions: dict[str, str]
+    ) -> tuple[dict, bool]:
         """Resolve plugins for execution.
 
         Priority:
@@ -285,25 +327,48 @@ class ConfigResolver:
         """
         plugin_ids = self._normalize_ids(config_snapshot.get("plugin_ids"))
         if plugin_ids:
-            return await self.backend_client.resolve_plugin_config(
-                user_id=user_id, plugin_ids=plugin_ids
+            return await config_cache.get_or_fetch(
+                user_id,
+                "plugins",
+                tuple(plugin_ids),
+                versions,
+                lambda: self.backend_client.resolve_plugin_config(
+                    user_id=user_id, plugin_ids=plugin_ids
+                ),
             )
 
         legacy = config_snapshot.get("plugin_files")
-        return legacy if isinstance(legacy, dict) else {}
+        return (legacy if isinstance(legacy, dict) else {}), False
 
     async def _resolve_effective_subagents(
-        self, user_id: str, config_snapshot: dict
-    ) -> dict:
+        self, user_id: str, config_snapshot: dict, versions: dict[str, str]
+    ) -> tuple[dict, bool]:
         subagent_ids: list[int] | None
         if "subagent_ids" not in config_snapshot:
             subagent_ids = None
         else:
             subagent_ids = self._normalize_ids(config_snapshot.get("subagent_ids"))
-        return await self.backend_client.resolve_subagents(
-            user_id=user_id, subagent_ids=subagent_ids
+        return await config_cache.get_or_fetch(
+            user_id,
+            "subagents",
+            None if subagent_ids is None else tuple(subagent_ids),
+            versions,
+            lambda: self.backend_client.resolve_subagents(
+                user_id=user_id, subagent_ids=subagent_ids
+            ),
         )
 
+    async def _resolve_subagents_or_empty(
+        self, user_id: str, config_snapshot: dict, versions: dict[str, str]
+    ) -> tuple[dict, bool]:
+        try:
+            return await self._resolve_effective_subagents(
+                user_id, config_snapshot, versions
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to resolve subagents for user {user_id}: {exc}")
+            return {}, False
+
     @staticmethod
     def _normalize_ids(value: Any) -> list[int]:
         if not isinstance(value, list):
@@ -1,6 +1,15 @@
+import asyncio
+import functools
 import logging
+import shutil
 import time
-from typing import TYPE_CHECKING
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import docker
 import docker.errors
@@ -8,6 +17,7 @@ import httpx
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 from app.services.workspace_manager import WorkspaceManager
 
@@ -16,17 +26,82 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Readiness probes start fast (a warm image is up in well under a second) and back off.
+READY_POLL_INITIAL_SECONDS = 0.05
+READY_POLL_MAX_SECONDS = 0.5
+
+# Unbound warm containers are named with this prefix until a session claims them.
+WARM_CONTAINER_NAME_PREFIX = "executor-warm-"
+
+
+@dataclass
+class WarmContainer:
+    """A pre-started executor container that is not yet bound to a session."""
+
+    container: "Container"
+    slot_dir: Path
+    executor_url: str
+    browser_enabled: bool
+    created_at: float
+
+
+@dataclass
+class WarmPoolStats:
+    hits: int = 0
+    misses: int = 0
+    started: int = 0
+    start_failures: int = 0
+    retired: int = 0
+
 
 class ContainerPool:
-    """Executor container pool with ephemeral and persistent modes."""
+    """Executor container pool with ephemeral and persistent modes.
+
+    The docker SDK is synchronous, so every Docker API call runs on a dedicated bounded
+    thread pool (`DOCKER_API_MAX_WORKERS`) and readiness waits are async. Container starts
+    never block the event loop, and concurrent starts proceed in parallel.
+    """
 
     def __init__(self):
         self.docker_client = docker.from_env()
         self.settings = get_settings()
         self.workspace_manager = WorkspaceManager()
+        self._docker_executor = ThreadPoolExecutor(
+            max_workers=max(1, int(self.settings.docker_api_max_workers)),
+            thread_name_prefix="docker-api",
+        )
 
         self.containers: dict[str, "Container"] = {}
         self.session_to_container: dict[str, str] = {}
+        # Docker labels are immutable, so containers claimed from the warm pool keep their
+        # session bindings (session_id/container_mode/...) here instead.
+        self.bound_labels: dict[str, dict[str, str]] = {}
+
+        # Warm pool state, keyed by browser_enabled (one pool per executor image).
+        self._warm_pools: dict[bool, deque[WarmContainer]] = {
+            False: deque(),
+            True: deque(),
+        }
+        self._warm_starting: dict[bool, int] = {False: 0, True: 0}
+        self._warm_targets: dict[bool, int] = {
+            False: self._warm_min_size(False),
+            True: self._warm_min_size(True),
+        }
+        self._warm_stats: dict[bool, WarmPoolStats] = {
+            False: WarmPoolStats(),
+            True: WarmPoolStats(),
+        }
+        self._warm_refill_lock = asyncio.Lock()
+        self._warm_dir = self.workspace_manager.temp_dir / "warm"
+
+    async def _docker(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking docker SDK call on the Docker API thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._docker_executor, functools.partial(func, *args, **kwargs)
+        )
 
     async def get_or_create_container(
         self,
@@ -36,6 +111,7 @@ class ContainerPool:
         browser_enabled: bool = False,
         container_mode: str = "ephemeral",
         container_id: str | None = None,
+        workspace_ready: Awaitable[None] | None = None,
     ) -> tuple[str, str]:
         """Get or create container.
 
@@ -45,6 +121,9 @@ class ContainerPool:
             browser_enabled: Whether this container needs the desktop/browser stack (noVNC/Chrome).
             container_mode: ephemeral | persistent
             container_id: Existing container ID to reuse
+            workspace_ready: Completes when workspace staging is done. Only binding a warm
+                container waits for it; new and reused containers mount the workspace
+                while it is still being staged.
 
         Returns:
             (executor_url, container_id)
@@ -62,7 +141,7 @@ class ContainerPool:
 
             # Best-effort refresh port mappings.
             try:
-                container.reload()
+                await self._docker(container.reload)
             except Exception:
                 pass
 
@@ -108,9 +187,11 @@ class ContainerPool:
         step_started = time.perf_counter()
         removed_stale = False
         try:
-            old_container = self.docker_client.containers.get(container_name)
+            old_container = await self._docker(
+                self.docker_client.containers.get, container_name
+            )
             logger.warning(f"Removing stale container {container_name}")
-            old_container.remove(force=True)
+            await self._docker(old_container.remove, force=True)
             removed_stale = True
         except docker.errors.NotFound:
             pass
@@ -127,6 +208,35 @@ class ContainerPool:
             },
         )
 
+        if self.settings.warm_pool_enabled:
+            if workspace_ready is not None and self._warm_pools[bool(browser_enabled)]:
+                # Binding moves the workspace directory, so staging must be finished.
+                await workspace_ready
+            executor_url = await self._bind_warm_container(
+                session_id=session_id,
+                user_id=user_id,
+                browser_enabled=browser_enabled,
+                container_mode=container_mode,
+                container_id=container_id,
+                container_name=container_name,
+            )
+            if executor_url:
+                logger.info(
+                    "timing",
+                    extra={
+                        "step": "container_warm_claim_total",
+                        "duration_ms": int(
+                            (time.perf_counter() - overall_started) * 1000
+                        ),
+                        "session_id": session_id,
+                        "user_id": user_id,
+                        "container_id": container_id,
+                        "container_mode": container_mode,
+                        "browser_enabled": bool(browser_enabled),
+                    },
+                )
+                return executor_url, container_id
+
         logger.info(f"Creating new container {container_id} (mode: {container_mode})")
 
         step_started = time.perf_counter()
@@ -171,7 +281,8 @@ class ContainerPool:
             environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
                 self.settings.poco_browser_viewport_size
             )
-        container = self.docker_client.containers.run(
+        container = await self._docker(
+            self.docker_client.containers.run,
             image=image,
             name=container_name,
             environment=environment,
@@ -199,10 +310,10 @@ class ContainerPool:
         self.containers[container_id] = container
         self.session_to_container[session_id] = container_id
 
-        self._wait_for_container_ready(container)
+        await self._wait_for_container_ready(container)
 
         step_started = time.perf_counter()
-        container.reload()
+        await self._docker(container.reload)
         port_info = container.ports.get("8000/tcp")
         if not port_info:
             raise AppException(
@@ -223,7 +334,7 @@ class ContainerPool:
         host_port = port_info[0]["HostPort"]
         executor_url = f"http://{published_host}:{host_port}"
 
-        self._wait_for_service_ready(executor_url)
+        await self._wait_for_service_ready(executor_url)
 
         logger.info(
             f"Container {container_id} started for session {session_id} on port {host_port}"
@@ -263,7 +374,326 @@ class ContainerPool:
         raw = str(labels.get("browser_enabled", "")).strip().lower()
         return raw in {"true", "1", "yes"}
 
-    def _wait_for_container_ready(
+    def _get_labels(self, container_id: str, container: "Container") -> dict[str, str]:
+        labels = dict(getattr(container, "labels", None) or {})
+        labels.update(self.bound_labels.get(container_id, {}))
+        return labels
+
+    def _warm_min_size(self, browser_enabled: bool) -> int:
+        if browser_enabled:
+            return max(0, int(self.settings.warm_pool_browser_min_size))
+        return max(0, int(self.settings.warm_pool_min_size))
+
+    def _warm_max_size(self, browser_enabled: bool) -> int:
+        if browser_enabled:
+            size = int(self.settings.warm_pool_browser_max_size)
+        else:
+            size = int(self.settings.warm_pool_max_size)
+        return max(self._warm_min_size(browser_enabled), size)
+
+    async def _take_warm_container(self, browser_enabled: bool) -> WarmContainer | None:
+        """Pop the oldest warm container that is still running."""
+        pool = self._warm_pools[browser_enabled]
+        while pool:
+            warm = pool.popleft()
+            try:
+                await self._docker(warm.container.reload)
+            except Exception:
+                await self._retire_warm_container(warm, reason="gone")
+                continue
+            if warm.container.status != "running":
+                await self._retire_warm_container(warm, reason="not_running")
+                continue
+            return warm
+        return None
+
+    async def _bind_warm_container(
+        self,
+        *,
+        session_id: str,
+        user_id: str,
+        browser_enabled: bool,
+        container_mode: str,
+        container_id: str,
+        container_name: str,
+    ) -> str | None:
+        """Claim a warm container and bind it to the session workspace.
+
+        The warm container already has its slot directory bind-mounted at /workspace. Binding
+        renames that slot directory into the session's workspace path (moving any staged files
+        into it), so the running container sees the session workspace without a restart. This
+        relies on the slot directory and the workspace living on the same filesystem.
+
+        Returns:
+            The executor URL, or None when no warm container could be used.
+        """
+        browser_enabled = bool(browser_enabled)
+        stats = self._warm_stats[browser_enabled]
+        warm = await self._take_warm_container(browser_enabled)
+        if warm is None:
+            stats.misses += 1
+            # Demand exceeded supply: grow the refill target towards the max size.
+            self._warm_targets[browser_enabled] = min(
+                self._warm_max_size(browser_enabled),
+                self._warm_targets[browser_enabled] + 1,
+            )
+            self._schedule_warm_refill()
+            return None
+
+        workspace_dir = Path(
+            self.workspace_manager.get_workspace_volume(
+                user_id=user_id, session_id=session_id
+            )
+        )
+        aside_dir = workspace_dir.with_name("workspace.warm-bind")
+        try:
+            workspace_dir.rename(aside_dir)
+            try:
+                warm.slot_dir.rename(workspace_dir)
+            except Exception:
+                aside_dir.rename(workspace_dir)
+                raise
+            for entry in aside_dir.iterdir():
+                target = workspace_dir / entry.name
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target, ignore_errors=True)
+                elif target.exists() or target.is_symlink():
+                    target.unlink()
+                entry.rename(target)
+            aside_dir.rmdir()
+            await self._docker(warm.container.rename, container_name)
+        except Exception as exc:
+            logger.warning(
+                "warm_container_bind_failed",
+                extra={
+                    "session_id": session_id,
+                    "container_name": warm.container.name,
+                    "error": str(exc),
+                },
+            )
+            stats.misses += 1
+            await self._retire_warm_container(warm, reason="bind_failed")
+            self._schedule_warm_refill()
+            return None
+
+        stats.hits += 1
+        self.containers[container_id] = warm.container
+        self.session_to_container[session_id] = container_id
+        self.bound_labels[container_id] = {
+            "session_id": session_id,
+            "container_id": container_id,
+            "user": user_id,
+            "container_mode": container_mode,
+        }
+        logger.info(
+            f"Claimed warm container {warm.container.name} as {container_id} "
+            f"for session {session_id}"
+        )
+        self._schedule_warm_refill()
+        return warm.executor_url
+
+    async def _start_warm_container(self, browser_enabled: bool) -> WarmContainer:
+        """Start one unbound executor container and wait until it serves requests."""
+        slot = uuid.uuid4().hex[:12]
+        slot_dir = self._warm_dir / slot
+        slot_dir.mkdir(parents=True, exist_ok=True)
+
+        image = self._resolve_executor_image(browser_enabled=browser_enabled)
+        environment = {
+            "ANTHROPIC_BASE_URL": self.settings.anthropic_base_url,
+            "DEFAULT_MODEL": self.settings.default_model,
+            "WORKSPACE_PATH": "/workspace",
+        }
+        anthropic_api_key = (self.settings.anthropic_api_key or "").strip()
+        if anthropic_api_key:
+            environment["ANTHROPIC_API_KEY"] = anthropic_api_key
+        if browser_enabled:
+            environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
+                self.settings.poco_browser_viewport_size
+            )
+
+        try:
+            container = await self._docker(
+                self.docker_client.containers.run,
+                image=image,
+                name=f"{WARM_CONTAINER_NAME_PREFIX}{slot}",
+                environment=environment,
+                volumes={str(slot_dir): {"bind": "/workspace", "mode": "rw"}},
+                ports={"8000/tcp": None},
+                detach=True,
+                auto_remove=True,
+                labels={
+                    "owner": "executor_manager",
+                    "pool": "warm",
+                    "browser_enabled": "true" if browser_enabled else "false",
+                },
+                extra_hosts={"host.docker.internal": "host-gateway"},
+            )
+        except Exception:
+            shutil.rmtree(slot_dir, ignore_errors=True)
+            raise
+
+        warm = WarmContainer(
+            container=container,
+            slot_dir=slot_dir,
+            executor_url="",
+            browser_enabled=browser_enabled,
+            created_at=time.monotonic(),
+        )
+        try:
+            await self._wait_for_container_ready(container)
+            await self._docker(container.reload)
+            port_info = container.ports.get("8000/tcp")
+            if not port_info:
+                raise AppException(
+                    error_code=ErrorCode.CONTAINER_START_FAILED,
+                    message=f"Container {container.name} has no port mapping",
+                )
+            published_host = (
+                self.settings.executor_published_host or ""
+            ).strip() or "localhost"
+            warm.executor_url = f"http://{published_host}:{port_info[0]['HostPort']}"
+            await self._wait_for_service_ready(warm.executor_url)
+        except BaseException:
+            await asyncio.shield(
+                self._retire_warm_container(warm, reason="start_failed")
+            )
+            raise
+        return warm
+
+    async def _retire_warm_container(self, warm: WarmContainer, *, reason: str) -> None:
+        self._warm_stats[warm.browser_enabled].retired += 1
+        logger.info(
+            "warm_container_retired",
+            extra={
+                "container_name": getattr(warm.container, "name", None),
+                "browser_enabled": warm.browser_enabled,
+                "reason": reason,
+            },
+        )
+        try:
+            await self._docker(warm.container.stop, timeout=10)
+        except Exception:
+            pass
+        await asyncio.to_thread(shutil.rmtree, warm.slot_dir, ignore_errors=True)
+
+    async def _retire_idle_warm_containers(self) -> None:
+        """Retire warm containers that sat unclaimed longer than the idle TTL."""
+        ttl = max(60, int(self.settings.warm_pool_idle_ttl_seconds))
+        now = time.monotonic()
+        for browser_enabled, pool in self._warm_pools.items():
+            idle = [w for w in pool if now - w.created_at >= ttl]
+            if not idle:
+                continue
+            for warm in idle:
+                pool.remove(warm)
+            await asyncio.gather(
+                *(self._retire_warm_container(w, reason="idle") for w in idle)
+            )
+            # Idle capacity means the target overshot demand: shrink back towards the min.
+            self._warm_targets[browser_enabled] = max(
+                self._warm_min_size(browser_enabled),
+                self._warm_targets[browser_enabled] - len(idle),
+            )
+
+    def _schedule_warm_refill(self) -> None:
+        try:
+            asyncio.get_running_loop().create_task(self.refill_warm_pool())
+        except RuntimeError:
+            # No running loop; the periodic refill job will catch up.
+            pass
+
+    async def refill_warm_pool(self) -> None:
+        """Retire idle warm containers and start new ones up to the current target."""
+        if not self.settings.warm_pool_enabled or self._warm_refill_lock.locked():
+            return
+        async with self._warm_refill_lock:
+            await self._retire_idle_warm_containers()
+            for browser_enabled, pool in self._warm_pools.items():
+                missing = (
+                    self._warm_targets[browser_enabled]
+                    - len(pool)
+                    - self._warm_starting[browser_enabled]
+                )
+                if missing <= 0:
+                    continue
+                self._warm_starting[browser_enabled] += missing
+                results = await asyncio.gather(
+                    *(
+                        self._start_warm_container(browser_enabled)
+                        for _ in range(missing)
+                    ),
+                    return_exceptions=True,
+                )
+                self._warm_starting[browser_enabled] -= missing
+                stats = self._warm_stats[browser_enabled]
+                for result in results:
+                    if isinstance(result, WarmContainer):
+                        stats.started += 1
+                        pool.append(result)
+                    else:
+                        stats.start_failures += 1
+                        logger.error(
+                            f"Failed to start warm executor container: {result}"
+                        )
+
+    async def start_warm_pool(self) -> None:
+        """Remove warm containers left behind by a previous process, then fill the pool."""
+        try:
+            warm = await self._docker(
+                self.docker_client.containers.list,
+                all=True,
+                filters={"label": ["owner=executor_manager", "pool=warm"]},
+            )
+        except Exception:
+            warm = []
+        # Bound containers keep the immutable `pool=warm` label but were renamed to
+        # their session container name, so only the still-unbound ones are stale.
+        stale = [
+            container
+            for container in warm
+            if str(getattr(container, "name", "")).startswith(
+                WARM_CONTAINER_NAME_PREFIX
+            )
+        ]
+        await asyncio.gather(
+            *(self._docker(container.remove, force=True) for container in stale),
+            return_exceptions=True,
+        )
+        await asyncio.to_thread(shutil.rmtree, self._warm_dir, ignore_errors=True)
+        await self.refill_warm_pool()
+
+    async def shutdown_warm_pool(self) -> None:
+        """Stop all unclaimed warm containers."""
+        warm = [w for pool in self._warm_pools.values() for w in pool]
+        for pool in self._warm_pools.values():
+            pool.clear()
+        await asyncio.gather(
+            *(self._retire_warm_container(w, reason="shutdown") for w in warm)
+        )
+
+    def get_warm_pool_stats(self) -> dict[str, dict[str, int | float]]:
+        """Get warm pool size and hit/miss counters per executor image."""
+        result: dict[str, dict[str, int | float]] = {}
+        for browser_enabled, pool in self._warm_pools.items():
+            stats = self._warm_stats[browser_enabled]
+            lookups = stats.hits + stats.misses
+            result["browser" if browser_enabled else "default"] = {
+                "idle": len(pool),
+                "starting": self._warm_starting[browser_enabled],
+                "target": self._warm_targets[browser_enabled],
+                "min_size": self._warm_min_size(browser_enabled),
+                "max_size": self._warm_max_size(browser_enabled),
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "hit_ratio": round(stats.hits / lookups, 4) if lookups else 0.0,
+                "started": stats.started,
+                "start_failures": stats.start_failures,
+                "retired": stats.retired,
+            }
+        return result
+
+    async def _wait_for_container_ready(
         self,
         container: "Container",
         timeout: int = 30,
@@ -271,10 +701,11 @@ class ContainerPool:
         """Wait for container to start."""
         started = time.perf_counter()
         attempts = 0
+        delay = READY_POLL_INITIAL_SECONDS
 
         while time.perf_counter() - started < timeout:
             attempts += 1
-            container.reload()
+            await self._docker(container.reload)
             if container.status == "running":
                 logger.info(
                     "timing",
@@ -287,7 +718,8 @@ class ContainerPool:
                     },
                 )
                 return
-            time.sleep(1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, READY_POLL_MAX_SECONDS)
 
         logger.warning(
             "timing",
@@ -304,7 +736,7 @@ class ContainerPool:
             message=f"Container {container.name} failed to start within {timeout}s",
         )
 
-    def _wait_for_service_ready(
+    async def _wait_for_service_ready(
         self,
         executor_url: str,
         timeout: int = 60,
@@ -312,30 +744,30 @@ class ContainerPool:
         """Wait for executor HTTP service to be ready."""
         started = time.perf_counter()
         attempts = 0
+        delay = READY_POLL_INITIAL_SECONDS
         health_url = f"{executor_url}/health"
+        client = get_http_client()
 
         while time.perf_counter() - started < timeout:
             attempts += 1
             try:
-                with httpx.Client(timeout=2.0) as client:
-                    response = client.get(health_url)
-                    if response.status_code == 200:
-                        logger.info(
-                            "timing",
-                            extra={
-                                "step": "container_wait_service_ready",
-                                "duration_ms": int(
-                                    (time.perf_counter() - started) * 1000
-                                ),
-                                "attempts": attempts,
-                                "executor_url": executor_url,
-                            },
-                        )
-                        logger.info(f"Executor service ready at {executor_url}")
-                        return
+                response = await client.get(health_url, timeout=2.0)
+                if response.status_code == 200:
+                    logger.info(
+                        "timing",
+                        extra={
+                            "step": "container_wait_service_ready",
+                            "duration_ms": int((time.perf_counter() - started) * 1000),
+                            "attempts": attempts,
+                            "executor_url": executor_url,
+                        },
+                    )
+                    logger.info(f"Executor service ready at {executor_url}")
+                    return
             except httpx.RequestError:
                 pass
-            time.sleep(1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, READY_POLL_MAX_SECONDS)
 
         logger.warning(
             "timing",
@@ -370,12 +802,14 @@ class ContainerPool:
 
         if container_id in self.containers:
             container = self.containers.pop(container_id)
-            container_mode = container.labels.get("container_mode", "ephemeral")
+            labels = self._get_labels(container_id, container)
+            self.bound_labels.pop(container_id, None)
+            container_mode = labels.get("container_mode", "ephemeral")
 
             if container_mode == "ephemeral":
                 logger.info(f"Container {container_id} is ephemeral, stopping")
                 try:
-                    container.stop(timeout=10)
+                    await self._docker(container.stop, timeout=10)
                 except Exception as e:
                     logger.error(f"Failed to stop container {container_id}: {e}")
 
@@ -395,17 +829,18 @@ class ContainerPool:
         for sid in sessions:
             self.session_to_container.pop(sid, None)
 
+        self.bound_labels.pop(cid, None)
         container = self.containers.pop(cid, None)
         if not container:
             return
 
         try:
-            container.stop(timeout=10)
+            await self._docker(container.stop, timeout=10)
         except Exception as e:
             logger.error(f"Failed to stop container {cid}: {e}")
 
         try:
-            container.remove(force=True)
+            await self._docker(container.remove, force=True)
         except Exception:
             # Best-effort: the container might have already been removed.
             pass
@@ -424,6 +859,8 @@ class ContainerPool:
         seen: set[str] = set()
 
         tracked = self.containers.pop(container_id, None) if container_id else None
+        if container_id:
+            self.bound_labels.pop(container_id, None)
         if tracked is not None:
             containers_to_stop.append(tracked)
             cid = getattr(tracked, "id", None)
@@ -442,8 +879,10 @@ class ContainerPool:
 
         # Prefer exact match by full session_id label.
         try:
-            found = self.docker_client.containers.list(
-                all=True, filters={"label": f"session_id={session_id}"}
+            found = await self._docker(
+                self.docker_client.containers.list,
+                all=True,
+                filters={"label": f"session_id={session_id}"},
             )
             _extend_unique(found)
         except Exception:
@@ -452,8 +891,10 @@ class ContainerPool:
         # Best-effort: if we know the logical container_id label, try to locate by that label too.
         if container_id:
             try:
-                found = self.docker_client.containers.list(
-                    all=True, filters={"label": f"container_id={container_id}"}
+                found = await self._docker(
+                    self.docker_client.containers.list,
+                    all=True,
+                    filters={"label": f"container_id={container_id}"},
                 )
                 _extend_unique(found)
             except Exception:
@@ -462,7 +903,7 @@ class ContainerPool:
         # Fallback to deterministic name (used by get_or_create_container).
         try:
             name = f"executor-{session_id[:8]}"
-            found = self.docker_client.containers.get(name)
+            found = await self._docker(self.docker_client.containers.get, name)
             _extend_unique([found])
         except docker.errors.NotFound:
             pass
@@ -480,7 +921,7 @@ class ContainerPool:
             labels = getattr(container, "labels", None) or {}
             logical_id = labels.get("container_id")
             try:
-                container.stop(timeout=10)
+                await self._docker(container.stop, timeout=10)
                 logger.info(
                     "container_stopped",
                     extra={
@@ -508,6 +949,7 @@ class ContainerPool:
             # Clean up any stale bookkeeping for this logical container_id.
             if isinstance(logical_id, str) and logical_id:
                 self.containers.pop(logical_id, None)
+                self.bound_labels.pop(logical_id, None)
                 bound_sessions = [
                     sid
                     for sid, cid in self.session_to_container.items()
@@ -516,29 +958,32 @@ class ContainerPool:
                 for sid in bound_sessions:
                     self.session_to_container.pop(sid, None)
 
-    def get_container_stats(self) -> dict[str, int | list[dict]]:
+    def get_container_stats(self) -> dict[str, int | list[dict] | dict]:
         """Get container statistics."""
         persistent = 0
         ephemeral = 0
+        containers: list[dict] = []
 
-        for container in self.containers.values():
-            mode = container.labels.get("container_mode", "ephemeral")
+        for cid, container in self.containers.items():
+            labels = self._get_labels(cid, container)
+            mode = labels.get("container_mode", "ephemeral")
             if mode == "persistent":
                 persistent += 1
             else:
                 ephemeral += 1
+            containers.append(
+                {
+                    "container_id": labels.get("container_id", container.name),
+                    "name": container.name,
+                    "status": container.status,
+                    "mode": mode,
+                }
+            )
 
         return {
             "total_active": len(self.containers),
             "persistent_containers": persistent,
             "ephemeral_containers": ephemeral,
-            "containers": [
-                {
-                    "container_id": c.labels.get("container_id", c.name),
-                    "name": c.name,
-                    "status": c.status,
-                    "mode": c.labels.get("container_mode", "ephemeral"),
-                }
-                for c in self.containers.values()
-            ],
+            "containers": containers,
+            "warm_pool": self.get_warm_pool_stats(),
         }
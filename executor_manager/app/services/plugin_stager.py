@@ -97,15 +97,17 @@ class PluginStager:
             try:
                 step_started = time.perf_counter()
                 if entry.get("is_prefix") or str(s3_key).endswith("/"):
-                    self.storage_service.download_prefix(
+                    results = self.storage_service.download_prefix(
                         prefix=str(s3_key), destination_dir=target_dir
                     )
                 else:
                     filename = Path(str(s3_key)).name
                     destination = target_dir / filename
-                    self.storage_service.download_file(
-                        key=str(s3_key), destination=destination
-                    )
+                    results = [
+                        self.storage_service.download_file(
+                            key=str(s3_key), destination=destination
+                        )
+                    ]
                 logger.info(
                     "timing",
                     extra={
@@ -117,6 +119,9 @@ class PluginStager:
                         "s3_key": str(s3_key),
                         "is_prefix": bool(entry.get("is_prefix"))
                         or str(s3_key).endswith("/"),
+                        "files": len(results),
+                        "cache_hits": sum(1 for r in results if r.cache_hit),
+                        "bytes_saved": sum(r.size for r in results if r.cache_hit),
                     },
                 )
             except Exception as exc:
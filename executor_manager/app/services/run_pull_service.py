@@ -11,12 +11,7 @@ from app.scheduler.task_dispatcher import TaskDispatcher
 from app.services.backend_client import BackendClient
 from app.services.executor_client import ExecutorClient
 from app.services.config_resolver import ConfigResolver
-from app.services.skill_stager import SkillStager
-from app.services.plugin_stager import PluginStager
-from app.services.attachment_stager import AttachmentStager
-from app.services.claude_md_stager import ClaudeMdStager
-from app.services.slash_command_stager import SlashCommandStager
-from app.services.sub_agent_stager import SubAgentStager
+from app.services.staging_pipeline import StagingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +25,9 @@ class RunPullService:
         self.executor_client = ExecutorClient()
         self.container_pool = TaskDispatcher.get_container_pool()
         self.config_resolver = ConfigResolver(self.backend_client)
-        self.skill_stager = SkillStager()
-        self.plugin_stager = PluginStager()
-        self.attachment_stager = AttachmentStager()
-        self.claude_md_stager = ClaudeMdStager()
-        self.slash_command_stager = SlashCommandStager()
-        self.subagent_stager = SubAgentStager()
+        self.staging_pipeline = StagingPipeline(
+            self.backend_client, self.config_resolver
+        )
 
         self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
         self._semaphore = asyncio.Semaphore(self.settings.max_concurrent_tasks)
@@ -44,6 +36,13 @@ class RunPullService:
         self._logged_started = False
         self._windows_until: dict[str, datetime] = {}
         self._window_locks: dict[str, asyncio.Lock] = {}
+        self._wakeup_tasks: list[asyncio.Task[None]] = []
+        # Runs claimed but not started yet, with the monotonic time their lease was
+        # last confirmed; leases are renewed in one batched heartbeat until
+        # start_run/fail_run.
+        self._leased_runs: dict[str, float] = {}
+        self._lost_runs: set[str] = set()
+        self._lease_task: asyncio.Task[None] | None = None
 
     def _get_window_lock(self, window_id: str) -> asyncio.Lock:
         lock = self._window_locks.get(window_id)
@@ -107,10 +106,13 @@ class RunPullService:
 
         await self.poll(schedule_modes=schedule_modes)
 
-    async def poll(self, schedule_modes: list[str] | None = None) -> None:
-        """Poll backend run queue and dispatch as many as capacity allows."""
+    async def poll(self, schedule_modes: list[str] | None = None) -> int:
+        """Poll backend run queue and dispatch as many as capacity allows.
+
+        Returns the number of runs claimed.
+        """
         if self._shutdown:
-            return
+            return 0
 
         lease_seconds = max(5, int(self.settings.task_claim_lease_seconds))
 
@@ -121,46 +123,187 @@ class RunPullService:
             )
             self._logged_started = True
 
+        claimed_total = 0
         while not self._shutdown and not self._semaphore.locked():
-            await self._semaphore.acquire()
+            # Reserve every free slot, then fill them with a single batch claim.
+            slots = 0
+            while not self._semaphore.locked():
+                await self._semaphore.acquire()
+                slots += 1
 
             try:
                 step_started = time.perf_counter()
-                claim = await self.backend_client.claim_run(
+                claimed_at = time.monotonic()
+                claims = await self.backend_client.claim_run_batch(
                     worker_id=self.worker_id,
+                    max_runs=slots,
                     lease_seconds=lease_seconds,
                     schedule_modes=schedule_modes,
                 )
-                if claim:
+                if claims:
                     logger.info(
                         "timing",
                         extra={
-                            "step": "run_pull_claim_run",
+                            "step": "run_pull_claim_batch",
                             "duration_ms": int(
                                 (time.perf_counter() - step_started) * 1000
                             ),
                             "worker_id": self.worker_id,
                             "lease_seconds": lease_seconds,
                             "schedule_modes": schedule_modes,
+                            "slots": slots,
+                            "claimed": len(claims),
                         },
                     )
             except Exception as e:
-                logger.error(f"Failed to claim run from backend: {e}")
-                self._semaphore.release()
-                return
+                logger.error(f"Failed to claim runs from backend: {e}")
+                for _ in range(slots):
+                    self._semaphore.release()
+                return claimed_total
 
-            if not claim:
+            for _ in range(slots - len(claims)):
                 self._semaphore.release()
-                return
 
-            task = asyncio.create_task(self._handle_claim(claim))
-            self._tasks.add(task)
-            task.add_done_callback(self._on_task_done)
+            claimed_total += len(claims[:slots])
+            for claim in claims[:slots]:
+                task = asyncio.create_task(self._handle_claim(claim, claimed_at))
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+
+            if len(claims) < slots:
+                return claimed_total
+        return claimed_total
+
+    def start_wakeup_loops(self, schedule_modes_groups: list[list[str] | None]) -> None:
+        """Start one long-poll wakeup loop per queue (interval pull rule)."""
+        wait_seconds = int(self.settings.task_pull_wait_seconds)
+        if wait_seconds <= 0:
+            return
+        for schedule_modes in schedule_modes_groups:
+            task = asyncio.create_task(self._wakeup_loop(schedule_modes, wait_seconds))
+            self._wakeup_tasks.append(task)
+
+    async def _wakeup_loop(
+        self, schedule_modes: list[str] | None, wait_seconds: int
+    ) -> None:
+        """Long-poll the backend for claimable runs and poll as soon as one shows up.
+
+        No dispatch slot is held while waiting: the loop only waits while a slot is free
+        and claims through poll(), so interval polls keep the full capacity.
+        """
+        backoff_seconds = 1.0
+        while not self._shutdown:
+            # Wait for free capacity without reserving it.
+            await self._semaphore.acquire()
+            self._semaphore.release()
+
+            started = time.monotonic()
+            try:
+                available = await self.backend_client.wait_for_runs(
+                    schedule_modes=schedule_modes,
+                    wait_seconds=wait_seconds,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Run wakeup long-poll failed: {e}")
+                await asyncio.sleep(backoff_seconds)
+                backoff_seconds = min(30.0, backoff_seconds * 2)
+                continue
+
+            backoff_seconds = 1.0
+            answered_fast = time.monotonic() - started < 1.0
+            if not available:
+                # Guard against a backend that answers immediately (no long-poll support).
+                if answered_fast:
+                    await asyncio.sleep(float(wait_seconds))
+                continue
+
+            claimed = await self.poll(schedule_modes=schedule_modes)
+            if claimed:
+                logger.info(
+                    "run_pull_wakeup_claimed",
+                    extra={
+                        "worker_id": self.worker_id,
+                        "schedule_modes": schedule_modes,
+                        "claimed": claimed,
+                    },
+                )
+            elif answered_fast:
+                # Another worker won the run, or the claim failed: don't spin on it.
+                await asyncio.sleep(1.0)
 
     async def shutdown(self) -> None:
         """Request shutdown and cancel inflight dispatch tasks."""
         self._shutdown = True
+        for task in self._wakeup_tasks:
+            task.cancel()
+        await asyncio.gather(*self._wakeup_tasks, return_exceptions=True)
+        self._wakeup_tasks.clear()
         await self._drain_tasks()
+        if self._lease_task is not None:
+            self._lease_task.cancel()
+            await asyncio.gather(self._lease_task, return_exceptions=True)
+            self._lease_task = None
+
+    def _ensure_lease_renewer(self) -> None:
+        if self._lease_task is not None and not self._lease_task.done():
+            return
+        self._lease_task = asyncio.create_task(self._renew_leases())
+
+    async def _renew_leases(self) -> None:
+        """Heartbeat the leases of all runs still being dispatched, every lease/3."""
+        while self._leased_runs and not self._shutdown:
+            lease_seconds = max(5, int(self.settings.task_claim_lease_seconds))
+            await asyncio.sleep(lease_seconds / 3)
+            run_ids = sorted(self._leased_runs)
+            if not run_ids:
+                continue
+            step_started = time.perf_counter()
+            renewed_at = time.monotonic()
+            try:
+                result = await self.backend_client.heartbeat_runs(
+                    worker_id=self.worker_id,
+                    run_ids=run_ids,
+                    lease_seconds=lease_seconds,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to renew run leases: {e}")
+                continue
+
+            for run_id in result.get("renewed") or []:
+                if str(run_id) in self._leased_runs:
+                    self._leased_runs[str(run_id)] = renewed_at
+            lost = {str(r) for r in result.get("lost") or []} & self._leased_runs.keys()
+            self._lost_runs |= lost
+            for run_id in lost:
+                logger.warning(
+                    "run_lease_lost",
+                    extra={"run_id": run_id, "worker_id": self.worker_id},
+                )
+            logger.debug(
+                "timing",
+                extra={
+                    "step": "run_lease_heartbeat",
+                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
+                    "runs": len(run_ids),
+                    "lost": len(lost),
+                },
+            )
+
+    def _lease_lost(self, run_key: str) -> bool:
+        """Whether the lease of a run was reported lost or may have expired.
+
+        A lease not confirmed for a whole lease period (e.g. the backend was
+        unreachable) may already have been reclaimed by the lease reaper.
+        """
+        if run_key in self._lost_runs:
+            return True
+        confirmed_at = self._leased_runs.get(run_key)
+        if confirmed_at is None:
+            return True
+        lease_seconds = max(5, int(self.settings.task_claim_lease_seconds))
+        return time.monotonic() - confirmed_at >= lease_seconds
 
     def _on_task_done(self, task: asyncio.Task[None]) -> None:
         self._tasks.discard(task)
@@ -181,7 +324,7 @@ class RunPullService:
         await asyncio.gather(*tasks, return_exceptions=True)
         self._tasks.clear()
 
-    async def _handle_claim(self, claim: dict[str, Any]) -> None:
+    async def _handle_claim(self, claim: dict[str, Any], claimed_at: float) -> None:
         dispatch_started = time.perf_counter()
         run = claim.get("run") or {}
         run_id = run.get("run_id")
@@ -197,6 +340,10 @@ class RunPullService:
             logger.error(f"Invalid claim payload: {claim}")
             return
 
+        run_key = str(run_id)
+        self._leased_runs[run_key] = claimed_at
+        self._ensure_lease_renewer()
+
         container_mode = config_snapshot.get("container_mode", "ephemeral")
         container_id = config_snapshot.get("container_id")
 
@@ -224,158 +371,56 @@ class RunPullService:
                 },
             )
 
-            step_started = time.perf_counter()
-            staged_skills = self.skill_stager.stage_skills(
-                user_id=user_id,
-                session_id=session_id,
-                skills=resolved_config.get("skill_files") or {},
-            )
-            resolved_config["skill_files"] = staged_skills
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_skills",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "skills_staged": len(staged_skills),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_plugins = self.plugin_stager.stage_plugins(
-                user_id=user_id,
-                session_id=session_id,
-                plugins=resolved_config.get("plugin_files") or {},
-            )
-            resolved_config["plugin_files"] = staged_plugins
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_plugins",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "plugins_staged": len(staged_plugins),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_inputs = self.attachment_stager.stage_inputs(
-                user_id=user_id,
-                session_id=session_id,
-                inputs=resolved_config.get("input_files") or [],
-            )
-            resolved_config["input_files"] = staged_inputs
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_inputs",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "inputs_staged": len(staged_inputs),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            resolved_commands = await self.backend_client.resolve_slash_commands(
-                user_id=user_id
-            )
-            staged_commands = self.slash_command_stager.stage_commands(
-                user_id=user_id,
-                session_id=session_id,
-                commands=resolved_commands,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_slash_commands",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "commands_staged": len(staged_commands),
-                    **ctx,
-                },
-            )
+            browser_enabled = bool(resolved_config.get("browser_enabled"))
 
-            # Stage user-level CLAUDE.md (persistent instructions) into ~/.claude.
-            step_started = time.perf_counter()
-            try:
-                claude_md = await self.backend_client.get_claude_md(user_id=user_id)
-                enabled = bool(claude_md.get("enabled"))
-                content = (
-                    claude_md.get("content")
-                    if isinstance(claude_md.get("content"), str)
-                    else ""
-                )
-                staged_md = self.claude_md_stager.stage(
-                    user_id=user_id,
+            async def acquire_container(
+                workspace_ready: asyncio.Future[None],
+            ) -> tuple[str, str]:
+                step_started = time.perf_counter()
+                result = await self.container_pool.get_or_create_container(
                     session_id=session_id,
-                    enabled=enabled,
-                    content=content,
-                )
-                bytes_val = staged_md.get("bytes", 0)
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "run_dispatch_stage_claude_md",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "enabled": bool(staged_md.get("enabled")),
-                        "bytes": int(bytes_val) if isinstance(bytes_val, int) else 0,
-                        **ctx,
-                    },
-                )
-            except Exception as exc:
-                # Best-effort: don't block execution if CLAUDE.md staging fails.
-                logger.warning(
-                    f"Failed to stage CLAUDE.md for session {session_id}: {exc}"
-                )
-
-            step_started = time.perf_counter()
-            raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
-            raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
-            try:
-                staged_agents = self.subagent_stager.stage_raw_agents(
                     user_id=user_id,
-                    session_id=session_id,
-                    raw_agents=raw_agents,
+                    browser_enabled=browser_enabled,
+                    container_mode=container_mode,
+                    container_id=container_id,
+                    workspace_ready=workspace_ready,
                 )
                 logger.info(
                     "timing",
                     extra={
-                        "step": "run_dispatch_stage_subagents",
+                        "step": "run_dispatch_get_or_create_container",
                         "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "subagents_requested": len(raw_agents),
-                        "subagents_staged": len(staged_agents),
+                        "container_mode": container_mode,
+                        "container_id": result[1],
+                        "browser_enabled": browser_enabled,
                         **ctx,
                     },
                 )
-            except Exception as exc:
-                # Best-effort: keep tasks running even if staging fails.
-                logger.warning(
-                    f"Failed to stage subagents for session {session_id}: {exc}"
-                )
+                return result
 
-            step_started = time.perf_counter()
-            browser_enabled = bool(resolved_config.get("browser_enabled"))
             (
                 executor_url,
                 container_id,
-            ) = await self.container_pool.get_or_create_container(
-                session_id=session_id,
+            ) = await self.staging_pipeline.stage_and_acquire(
+                acquire_container,
                 user_id=user_id,
-                browser_enabled=browser_enabled,
-                container_mode=container_mode,
-                container_id=container_id,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_get_or_create_container",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "container_mode": container_mode,
-                    "container_id": container_id,
-                    "browser_enabled": browser_enabled,
-                    **ctx,
-                },
+                session_id=session_id,
+                resolved_config=resolved_config,
+                step_prefix="run_dispatch",
+                log_context=ctx,
+                stage_claude_md=True,
             )
 
+            if self._lease_lost(run_key):
+                # The lease expired and another worker may own the run now: starting
+                # it here too would execute it twice.
+                logger.warning(
+                    "run_dispatch_skipped_lease_lost",
+                    extra={"container_id": container_id, **ctx},
+                )
+                await self.container_pool.on_task_complete(session_id)
+                return
+
             step_started = time.perf_counter()
             await self.executor_client.execute_task(
                 executor_url=executor_url,
@@ -446,3 +491,6 @@ class RunPullService:
                 logger.error(
                     f"Failed to cancel task for session {session_id}: {cancel_err}"
                 )
+        finally:
+            self._leased_runs.pop(run_key, None)
+            self._lost_runs.discard(run_key)
@@ -0,0 +1,290 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.settings import get_settings
+from app.services.attachment_stager import AttachmentStager
+from app.services.backend_client import BackendClient
+from app.services.claude_md_stager import ClaudeMdStager
+from app.services.config_resolver import ConfigResolver
+from app.services.plugin_stager import PluginStager
+from app.services.skill_stager import SkillStager
+from app.services.slash_command_stager import SlashCommandStager
+from app.services.sub_agent_stager import SubAgentStager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_staging_executor() -> ThreadPoolExecutor:
+    """Get the process-wide thread pool that runs the blocking stagers."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, int(get_settings().staging_max_workers)),
+                thread_name_prefix="staging",
+            )
+        return _executor
+
+
+class StagingPipeline:
+    """Stages everything a session needs in its workspace before the executor starts.
+
+    Skills, plugins, inputs, slash commands, CLAUDE.md and subagents write to separate
+    directories, so the stages run concurrently on a bounded thread pool
+    (`STAGING_MAX_WORKERS`) instead of one after another on the event loop. Each stage
+    logs its own timing; `<prefix>_stage_all` is the critical path of staging and
+    `<prefix>_stage_and_acquire` the combined wait together with container acquisition.
+    """
+
+    def __init__(
+        self,
+        backend_client: BackendClient,
+        config_resolver: ConfigResolver,
+        *,
+        skill_stager: SkillStager | None = None,
+        plugin_stager: PluginStager | None = None,
+        attachment_stager: AttachmentStager | None = None,
+        slash_command_stager: SlashCommandStager | None = None,
+        claude_md_stager: ClaudeMdStager | None = None,
+        subagent_stager: SubAgentStager | None = None,
+    ) -> None:
+        self.backend_client = backend_client
+        self.config_resolver = config_resolver
+        self.skill_stager = skill_stager or SkillStager()
+        self.plugin_stager = plugin_stager or PluginStager()
+        self.attachment_stager = attachment_stager or AttachmentStager()
+        self.slash_command_stager = slash_command_stager or SlashCommandStager()
+        self.claude_md_stager = claude_md_stager or ClaudeMdStager()
+        self.subagent_stager = subagent_stager or SubAgentStager()
+
+    @staticmethod
+    async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        # Keep request/trace ids in the logs written from the worker thread.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            get_staging_executor(),
+            functools.partial(context.run, func, *args, **kwargs),
+        )
+
+    async def stage_and_acquire(
+        self,
+        acquire: Callable[[asyncio.Future[None]], Awaitable[T]],
+        *,
+        user_id: str,
+        session_id: str,
+        resolved_config: dict,
+        step_prefix: str,
+        log_context: dict[str, Any],
+        stage_claude_md: bool = False,
+    ) -> T:
+        """Stage the workspace while `acquire` gets a container, and wait for both.
+
+        `acquire` receives the staging task so it can wait for the workspace where it
+        must (binding a warm container moves the workspace directory). Staged paths are
+        written back into `resolved_config`. A staging error is raised in preference to
+        an acquisition error, and only once both have finished, so the workspace is no
+        longer being written when the caller cleans up.
+        """
+        started = time.perf_counter()
+        staging = asyncio.ensure_future(
+            self.stage(
+                user_id=user_id,
+                session_id=session_id,
+                resolved_config=resolved_config,
+                step_prefix=step_prefix,
+                log_context=log_context,
+                stage_claude_md=stage_claude_md,
+            )
+        )
+        acquiring = asyncio.ensure_future(acquire(staging))
+        try:
+            await asyncio.wait([staging, acquiring])
+        except asyncio.CancelledError:
+            staging.cancel()
+            acquiring.cancel()
+            raise
+        logger.info(
+            "timing",
+            extra={
+                "step": f"{step_prefix}_stage_and_acquire",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                **log_context,
+            },
+        )
+        if staging.exception() is not None and not acquiring.cancelled():
+            acquiring.exception()  # mark retrieved; the staging error wins
+        staging.result()
+        return acquiring.result()
+
+    async def stage(
+        self,
+        *,
+        user_id: str,
+        session_id: str,
+        resolved_config: dict,
+        step_prefix: str,
+        log_context: dict[str, Any],
+        stage_claude_md: bool = False,
+    ) -> None:
+        """Run all stages concurrently, writing staged paths into `resolved_config`."""
+        started = time.perf_counter()
+        raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
+        raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
+
+        stages = [
+            self._stage_skills(user_id, session_id, resolved_config),
+            self._stage_plugins(user_id, session_id, resolved_config),
+            self._stage_inputs(user_id, session_id, resolved_config),
+            self._stage_slash_commands(user_id, session_id),
+            self._stage_subagents(user_id, session_id, raw_agents),
+        ]
+        if stage_claude_md:
+            stages.append(self._stage_claude_md(user_id, session_id))
+
+        timed = [self._timed(stage, step_prefix, log_context) for stage in stages]
+        results = await asyncio.gather(*timed, return_exceptions=True)
+        durations = [r for r in results if isinstance(r, int)]
+        logger.info(
+            "timing",
+            extra={
+                "step": f"{step_prefix}_stage_all",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                "stages_sum_ms": sum(durations),
+                **log_context,
+            },
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    @staticmethod
+    async def _timed(
+        stage: Awaitable[tuple[str, dict[str, Any]]],
+        step_prefix: str,
+        log_context: dict[str, Any],
+    ) -> int:
+        started = time.perf_counter()
+        name, extra = await stage
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        if name:
+            logger.info(
+                "timing",
+                extra={
+                    "step": f"{step_prefix}_stage_{name}",
+                    "duration_ms": duration_ms,
+                    **extra,
+                    **log_context,
+                },
+            )
+        return duration_ms
+
+    async def _stage_skills(
+        self, user_id: str, session_id: str, resolved_config: dict
+    ) -> tuple[str, dict[str, Any]]:
+        staged_skills = await self._run_blocking(
+            self.skill_stager.stage_skills,
+            user_id=user_id,
+            session_id=session_id,
+            skills=resolved_config.get("skill_files") or {},
+        )
+        resolved_config["skill_files"] = staged_skills
+        return "skills", {"skills_staged": len(staged_skills)}
+
+    async def _stage_plugins(
+        self, user_id: str, session_id: str, resolved_config: dict
+    ) -> tuple[str, dict[str, Any]]:
+        staged_plugins = await self._run_blocking(
+            self.plugin_stager.stage_plugins,
+            user_id=user_id,
+            session_id=session_id,
+            plugins=resolved_config.get("plugin_files") or {},
+        )
+        resolved_config["plugin_files"] = staged_plugins
+        return "plugins", {"plugins_staged": len(staged_plugins)}
+
+    async def _stage_inputs(
+        self, user_id: str, session_id: str, resolved_config: dict
+    ) -> tuple[str, dict[str, Any]]:
+        staged_inputs = await self._run_blocking(
+            self.attachment_stager.stage_inputs,
+            user_id=user_id,
+            session_id=session_id,
+            inputs=resolved_config.get("input_files") or [],
+        )
+        resolved_config["input_files"] = staged_inputs
+        return "inputs", {"inputs_staged": len(staged_inputs)}
+
+    async def _stage_slash_commands(
+        self, user_id: str, session_id: str
+    ) -> tuple[str, dict[str, Any]]:
+        resolved_commands = await self.config_resolver.resolve_slash_commands(
+            user_id=user_id
+        )
+        staged_commands = await self._run_blocking(
+            self.slash_command_stager.stage_commands,
+            user_id=user_id,
+            session_id=session_id,
+            commands=resolved_commands,
+        )
+        return "slash_commands", {"commands_staged": len(staged_commands)}
+
+    async def _stage_claude_md(
+        self, user_id: str, session_id: str
+    ) -> tuple[str, dict[str, Any]]:
+        """Stage user-level CLAUDE.md (persistent instructions) into ~/.claude."""
+        try:
+            claude_md = await self.backend_client.get_claude_md(user_id=user_id)
+            enabled = bool(claude_md.get("enabled"))
+            content = (
+                claude_md.get("content")
+                if isinstance(claude_md.get("content"), str)
+                else ""
+            )
+            staged_md = await self._run_blocking(
+                self.claude_md_stager.stage,
+                user_id=user_id,
+                session_id=session_id,
+                enabled=enabled,
+                content=content,
+            )
+        except Exception as exc:
+            # Best-effort: don't block execution if CLAUDE.md staging fails.
+            logger.warning(f"Failed to stage CLAUDE.md for session {session_id}: {exc}")
+            return "", {}
+        bytes_val = staged_md.get("bytes", 0)
+        return "claude_md", {
+            "enabled": bool(staged_md.get("enabled")),
+            "bytes": int(bytes_val) if isinstance(bytes_val, int) else 0,
+        }
+
+    async def _stage_subagents(
+        self, user_id: str, session_id: str, raw_agents: dict
+    ) -> tuple[str, dict[str, Any]]:
+        try:
+            staged_agents = await self._run_blocking(
+                self.subagent_stager.stage_raw_agents,
+                user_id=user_id,
+                session_id=session_id,
+                raw_agents=raw_agents,
+            )
+        except Exception as exc:
+            # Best-effort: keep tasks running even if staging fails.
+            logger.warning(f"Failed to stage subagents for session {session_id}: {exc}")
+            return "", {}
+        return "subagents", {
+            "subagents_requested": len(raw_agents),
+            "subagents_staged": len(staged_agents),
+        }
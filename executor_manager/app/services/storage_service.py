@@ -1,4 +1,7 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any, Iterable
 
@@ -9,10 +12,27 @@ from botocore.exceptions import BotoCoreError, ClientError
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.core.settings import get_settings
+from app.services.blob_cache import get_blob_cache
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DownloadItem:
+    key: str
+    destination: Path
+    etag: str | None = None
+
+
+@dataclass
+class DownloadResult:
+    key: str
+    destination: Path
+    size: int
+    duration_ms: int
+    cache_hit: bool = False
+
+
 class S3StorageService:
     def __init__(self) -> None:
         settings = get_settings()
@@ -33,6 +53,7 @@ class S3StorageService:
             )
 
         self.bucket = settings.s3_bucket
+        self.download_concurrency = max(1, settings.s3_download_concurrency)
 
         config_kwargs: dict[str, Any] = {
             "connect_timeout": settings.s3_connect_timeout_seconds,
@@ -41,6 +62,12 @@ class S3StorageService:
                 "max_attempts": settings.s3_max_attempts,
                 "mode": "standard",
             },
+            # Bulk transfers run one request per worker thread.
+            "max_pool_connections": max(
+                10,
+                self.download_concurrency,
+                settings.workspace_export_concurrency,
+            ),
         }
         if settings.s3_force_path_style:
             config_kwargs["s3"] = {"addressing_style": "path"}
@@ -96,14 +123,40 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    def get_object(self, *, key: str) -> bytes | None:
+        """Read a small object into memory; returns None when it does not exist."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+            return response["Body"].read()
+        except ClientError as exc:
+            code = str(exc.response.get("Error", {}).get("Code", ""))
+            if code in ("NoSuchKey", "404", "NotFound"):
+                return None
+            logger.error(f"Failed to get object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to read object",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+        except BotoCoreError as exc:
+            logger.error(f"Failed to get object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to read object",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+
     def list_objects(self, prefix: str) -> Iterable[str]:
+        for item in self._list_object_entries(prefix):
+            yield item["Key"]
+
+    def _list_object_entries(self, prefix: str) -> Iterable[dict[str, Any]]:
         try:
             paginator = self.client.get_paginator("list_objects_v2")
             for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
                 for item in page.get("Contents", []) or []:
-                    key = item.get("Key")
-                    if key:
-                        yield key
+                    if item.get("Key"):
+                        yield item
         except (ClientError, BotoCoreError) as exc:
             logger.error(f"Failed to list objects for {prefix}: {exc}")
             raise AppException(
@@ -112,10 +165,30 @@ class S3StorageService:
                 details={"prefix": prefix, "error": str(exc)},
             ) from exc
 
-    def download_file(self, *, key: str, destination: Path) -> None:
+    def download_file(
+        self, *, key: str, destination: Path, etag: str | None = None
+    ) -> DownloadResult:
+        """Download an object, serving it from the host blob cache when possible.
+
+        `etag` skips the HEAD request when the caller already listed the object.
+        """
+        started = time.perf_counter()
+        cache = get_blob_cache()
+        if cache is not None and etag is None:
+            etag = self._head_etag(key)
+
         try:
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            self.client.download_file(self.bucket, key, str(destination))
+            if cache is not None and etag:
+                size, cache_hit = cache.fetch(
+                    bucket=self.bucket,
+                    key=key,
+                    etag=etag,
+                    destination=destination,
+                    download=lambda path: self._download_to(key, path),
+                )
+            else:
+                self._download_to(key, destination)
+                size, cache_hit = destination.stat().st_size, False
         except (ClientError, BotoCoreError) as exc:
             logger.error(f"Failed to download {key}: {exc}")
             raise AppException(
@@ -124,15 +197,100 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
-    def download_prefix(self, *, prefix: str, destination_dir: Path) -> None:
-        for key in self.list_objects(prefix):
+        return DownloadResult(
+            key=key,
+            destination=destination,
+            size=size,
+            duration_ms=int((time.perf_counter() - started) * 1000),
+            cache_hit=cache_hit,
+        )
+
+    def _download_to(self, key: str, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        self.client.download_file(self.bucket, key, str(destination))
+
+    def _head_etag(self, key: str) -> str | None:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except (ClientError, BotoCoreError) as exc:
+            logger.warning(f"Failed to read ETag for {key}, bypassing cache: {exc}")
+            return None
+        return response.get("ETag")
+
+    def download_files(
+        self, items: list[DownloadItem], *, max_concurrency: int | None = None
+    ) -> list[DownloadResult]:
+        """Download many objects with bounded concurrency.
+
+        Results are returned in the order of `items`. The first failure cancels the
+        downloads that have not started yet and is re-raised.
+        """
+        if not items:
+            return []
+        started = time.perf_counter()
+        concurrency = min(max_concurrency or self.download_concurrency, len(items))
+        if concurrency <= 1:
+            results = [
+                self.download_file(
+                    key=item.key, destination=item.destination, etag=item.etag
+                )
+                for item in items
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="s3-download"
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        self.download_file,
+                        key=item.key,
+                        destination=item.destination,
+                        etag=item.etag,
+                    )
+                    for item in items
+                ]
+                try:
+                    results = [future.result() for future in futures]
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        logger.info(
+            "timing",
+            extra={
+                "step": "s3_download_batch",
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+                "files": len(results),
+                "bytes": sum(r.size for r in results),
+                "concurrency": concurrency,
+                "max_file_ms": max(r.duration_ms for r in results),
+                "cache_hits": sum(1 for r in results if r.cache_hit),
+            },
+        )
+        return results
+
+    def download_prefix(
+        self,
+        *,
+        prefix: str,
+        destination_dir: Path,
+        max_concurrency: int | None = None,
+    ) -> list[DownloadResult]:
+        items: list[DownloadItem] = []
+        for entry in self._list_object_entries(prefix):
+            key = entry["Key"]
             if key.endswith("/"):
                 continue
             relative = key[len(prefix) :].lstrip("/")
             if not relative:
                 continue
+            # Validate every key before the first byte is written.
             target = self._safe_destination(destination_dir, relative)
-            self.download_file(key=key, destination=target)
+            items.append(
+                DownloadItem(key=key, destination=target, etag=entry.get("ETag"))
+            )
+        return self.download_files(items, max_concurrency=max_concurrency)
 
     @staticmethod
     def _safe_destination(destination_dir: Path, relative: str) -> Path:
@@ -1,12 +1,17 @@
+import hashlib
 import json
 import logging
 import mimetypes
 import os
+import stat
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
 from app.schemas.workspace import WorkspaceExportResult
 from app.services.storage_service import S3StorageService
 from app.services.workspace_manager import WorkspaceManager
@@ -17,8 +22,44 @@ logger = logging.getLogger(__name__)
 workspace_manager = WorkspaceManager()
 storage_service = S3StorageService()
 
+_STORED_SUFFIXES = {
+    ".7z",
+    ".avi",
+    ".br",
+    ".bz2",
+    ".docx",
+    ".gif",
+    ".gz",
+    ".heic",
+    ".jar",
+    ".jpeg",
+    ".jpg",
+    ".m4a",
+    ".mkv",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".ogg",
+    ".png",
+    ".pptx",
+    ".rar",
+    ".tgz",
+    ".webm",
+    ".webp",
+    ".whl",
+    ".woff",
+    ".woff2",
+    ".xlsx",
+    ".xz",
+    ".zip",
+    ".zst",
+}
+
 
 class WorkspaceExportService:
+    def __init__(self) -> None:
+        self.settings = get_settings()
+
     def export_workspace(self, session_id: str) -> WorkspaceExportResult:
         user_id = workspace_manager.resolve_user_id(session_id)
         if not user_id:
@@ -42,59 +83,94 @@ class WorkspaceExportService:
         archive_key = f"{prefix}/archive.zip"
 
         try:
+            started = time.perf_counter()
             files = self._collect_files(workspace_dir)
-            manifest = {
-                "version": 1,
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-                "files": [],
+            previous = self._load_previous_manifest(manifest_key)
+            previous_by_path = {
+                entry["path"]: entry
+                for entry in previous.get("files") or []
+                if isinstance(entry, dict) and isinstance(entry.get("path"), str)
             }
 
-            for file_path in files:
-                rel_path = file_path.relative_to(workspace_dir).as_posix()
-                object_key = f"{files_prefix}/{rel_path}"
-                mime_type, _ = mimetypes.guess_type(file_path.name)
-
-                storage_service.upload_file(
-                    file_path=str(file_path),
-                    key=object_key,
-                    content_type=mime_type,
+            # Cheap check first: when every file keeps its size and mtime, the previous
+            # archive is still valid and no content needs to be read.
+            rel_paths = [
+                file_path.relative_to(workspace_dir).as_posix()
+                for file_path, _ in files
+            ]
+            previous_archive = previous.get("archive")
+            archive_current = (
+                isinstance(previous_archive, dict)
+                and previous_archive.get("key") == archive_key
+                and set(rel_paths) == set(previous_by_path)
+                and all(
+                    self._unchanged_by_stat(previous_by_path.get(rel_path), st)
+                    for rel_path, (_, st) in zip(rel_paths, files)
                 )
+            )
 
-                manifest["files"].append(
-                    {
-                        "path": rel_path,
-                        "key": object_key,
-                        "size": file_path.stat().st_size,
-                        "mimeType": mime_type,
-                        "status": "uploaded",
-                        "last_modified": datetime.fromtimestamp(
-                            file_path.stat().st_mtime, tz=timezone.utc
-                        ).isoformat(),
-                    }
-                )
+            concurrency = max(1, self.settings.workspace_export_concurrency)
+            with ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="workspace-export"
+            ) as pool:
+                archive_future = None
+                if not archive_current:
+                    archive_future = pool.submit(
+                        self._create_and_upload_archive,
+                        workspace_dir=workspace_dir,
+                        session_id=session_id,
+                        files=[file_path for file_path, _ in files],
+                        archive_key=archive_key,
+                    )
+                futures = [
+                    pool.submit(
+                        self._export_file,
+                        file_path=file_path,
+                        st=st,
+                        rel_path=rel_path,
+                        object_key=f"{files_prefix}/{rel_path}",
+                        previous=previous_by_path.get(rel_path),
+                    )
+                    for rel_path, (file_path, st) in zip(rel_paths, files)
+                ]
+                try:
+                    results = [future.result() for future in futures]
+                    if archive_future is not None:
+                        archive_future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
 
+            manifest = {
+                "version": 1,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "files": [entry for entry, _ in results],
+                "archive": {"key": archive_key},
+            }
+            # Written last so a failed archive upload is retried on the next export.
             storage_service.put_object(
                 key=manifest_key,
                 body=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
                 content_type="application/json",
             )
 
-            archive_path = self._create_archive(
-                workspace_dir=workspace_dir,
-                session_id=session_id,
-                files=files,
-            )
-            storage_service.upload_file(
-                file_path=str(archive_path),
-                key=archive_key,
-                content_type="application/zip",
+            uploaded = [entry for entry, changed in results if changed]
+            logger.info(
+                "timing",
+                extra={
+                    "step": "workspace_export_total",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "files_total": len(results),
+                    "files_uploaded": len(uploaded),
+                    "files_unchanged": len(results) - len(uploaded),
+                    "bytes_uploaded": sum(entry["size"] for entry in uploaded),
+                    "archive_rebuilt": archive_future is not None,
+                },
             )
 
-            try:
-                archive_path.unlink(missing_ok=True)
-            except Exception:
-                logger.warning(f"Failed to cleanup archive temp file: {archive_path}")
-
             return WorkspaceExportResult(
                 workspace_files_prefix=files_prefix,
                 workspace_manifest_key=manifest_key,
@@ -112,8 +188,86 @@ class WorkspaceExportService:
                 error=str(exc), workspace_export_status="failed"
             )
 
-    def _collect_files(self, workspace_dir: Path) -> list[Path]:
-        files: list[Path] = []
+    def _load_previous_manifest(self, manifest_key: str) -> dict:
+        try:
+            raw = storage_service.get_object(key=manifest_key)
+        except AppException as exc:
+            logger.warning(f"Failed to read previous manifest {manifest_key}: {exc}")
+            return {}
+        if not raw:
+            return {}
+        try:
+            manifest = json.loads(raw)
+        except ValueError:
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    @staticmethod
+    def _unchanged_by_stat(previous: dict | None, st: os.stat_result) -> bool:
+        return (
+            previous is not None
+            and bool(previous.get("sha256"))
+            and previous.get("size") == st.st_size
+            and previous.get("mtime_ns") == st.st_mtime_ns
+        )
+
+    def _export_file(
+        self,
+        *,
+        file_path: Path,
+        st: os.stat_result,
+        rel_path: str,
+        object_key: str,
+        previous: dict | None,
+    ) -> tuple[dict, bool]:
+        """Upload one file unless the previous export already has the same content.
+
+        Returns:
+            (manifest entry, whether the file was uploaded)
+        """
+        mime_type, _ = mimetypes.guess_type(file_path.name)
+        entry = {
+            "path": rel_path,
+            "key": object_key,
+            "size": st.st_size,
+            "mimeType": mime_type,
+            "status": "uploaded",
+            "last_modified": datetime.fromtimestamp(
+                st.st_mtime, tz=timezone.utc
+            ).isoformat(),
+            "mtime_ns": st.st_mtime_ns,
+        }
+
+        if self._unchanged_by_stat(previous, st) and previous.get("key") == object_key:
+            entry["sha256"] = previous["sha256"]
+            return entry, False
+
+        entry["sha256"] = self._sha256(file_path)
+        if (
+            previous is not None
+            and previous.get("key") == object_key
+            and previous.get("size") == st.st_size
+            and previous.get("sha256") == entry["sha256"]
+        ):
+            return entry, False
+
+        storage_service.upload_file(
+            file_path=str(file_path),
+            key=object_key,
+            content_type=mime_type,
+        )
+        return entry, True
+
+    @staticmethod
+    def _sha256(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _collect_files(self, workspace_dir: Path) -> list[tuple[Path, os.stat_result]]:
+        files: list[tuple[Path, os.stat_result]] = []
         ignore_names = workspace_manager._ignore_names
         ignore_dot = workspace_manager.ignore_dot_files
 
@@ -125,17 +279,47 @@ class WorkspaceExportService:
                 if not self._should_skip(root_path / d, ignore_names, ignore_dot)
             ]
             for filename in filenames:
-                file_path = root_path / filename
-                if self._should_skip(file_path, ignore_names, ignore_dot):
+                if filename in ignore_names or (
+                    ignore_dot and filename.startswith(".")
+                ):
                     continue
-                if file_path.is_symlink():
+                file_path = root_path / filename
+                # One lstat covers the symlink and regular-file checks and the manifest.
+                try:
+                    st = file_path.lstat()
+                except OSError:
                     continue
-                if not file_path.is_file():
+                if not stat.S_ISREG(st.st_mode):
                     continue
-                files.append(file_path)
+                files.append((file_path, st))
 
         return files
 
+    def _create_and_upload_archive(
+        self,
+        *,
+        workspace_dir: Path,
+        session_id: str,
+        files: list[Path],
+        archive_key: str,
+    ) -> None:
+        archive_path = self._create_archive(
+            workspace_dir=workspace_dir,
+            session_id=session_id,
+            files=files,
+        )
+        try:
+            storage_service.upload_file(
+                file_path=str(archive_path),
+                key=archive_key,
+                content_type="application/zip",
+            )
+        finally:
+            try:
+                archive_path.unlink(missing_ok=True)
+            except Exception:
+                logger.warning(f"Failed to cleanup archive temp file: {archive_path}")
+
     def _create_archive(
         self,
         *,
@@ -154,7 +338,17 @@ class WorkspaceExportService:
         ) as zipf:
             for file_path in files:
                 rel_path = file_path.relative_to(workspace_dir).as_posix()
-                zipf.write(file_path, arcname=f"workspace/{rel_path}")
+                # Deflating already-compressed formats burns CPU for no gain.
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if file_path.suffix.lower() in _STORED_SUFFIXES
+                    else zipfile.ZIP_DEFLATED
+                )
+                zipf.write(
+                    file_path,
+                    arcname=f"workspace/{rel_path}",
+                    compress_type=compress_type,
+                )
 
         return archive_path
 
@@ -0,0 +1,80 @@
+"""Concurrent container start benchmark for the executor container pool.
+
+Starts N executor containers at once through `ContainerPool.get_or_create_container`
+while a ticker task measures event loop lag, then deletes them, e.g.:
+
+    cd executor_manager && python scripts/bench_container_starts.py --count 4
+
+When starts do not serialize, the wall time stays close to the slowest single start
+(well below the sum of all starts) and the event loop lag stays in the milliseconds.
+Needs a Docker daemon and the configured `EXECUTOR_IMAGE`.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.http_client import close_http_client  # noqa: E402
+from app.services.container_pool import ContainerPool  # noqa: E402
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float], interval: float) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def _start(pool: ContainerPool, browser_enabled: bool) -> tuple[str, float]:
+    session_id = str(uuid.uuid4())
+    started = time.perf_counter()
+    _, container_id = await pool.get_or_create_container(
+        session_id, "bench", browser_enabled=browser_enabled
+    )
+    return container_id, time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=4)
+    parser.add_argument("--browser", action="store_true")
+    args = parser.parse_args()
+
+    pool = ContainerPool()
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(_measure_lag(stop, lags, 0.01))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_start(pool, args.browser) for _ in range(args.count)),
+        return_exceptions=True,
+    )
+    wall = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    durations = [r[1] for r in results if isinstance(r, tuple)]
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"start failed: {result}")
+    if durations:
+        print(
+            f"starts={len(durations)} wall={wall:.2f}s "
+            f"slowest={max(durations):.2f}s sum={sum(durations):.2f}s "
+            f"max_loop_lag={max(lags, default=0) * 1000:.1f}ms"
+        )
+
+    await asyncio.gather(
+        *(pool.delete_container(r[0]) for r in results if isinstance(r, tuple))
+    )
+    await close_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
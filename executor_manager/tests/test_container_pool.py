@@ -0,0 +1,122 @@
+"""ContainerPool concurrency tests with a stubbed Docker client (no daemon needed).
+
+Run with `cd executor_manager && pytest tests`.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import docker.errors
+import pytest
+
+from app.services import container_pool as container_pool_module
+from app.services.container_pool import ContainerPool
+
+DOCKER_RUN_SECONDS = 0.4
+DOCKER_RELOAD_SECONDS = 0.05
+
+
+class FakeContainer:
+    def __init__(self, name: str, labels: dict[str, str]) -> None:
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.labels = labels
+        self.status = "created"
+        self.ports: dict = {}
+
+    def reload(self) -> None:
+        # The docker SDK blocks the calling thread for the whole API round trip.
+        time.sleep(DOCKER_RELOAD_SECONDS)
+        self.status = "running"
+        self.ports = {"8000/tcp": [{"HostPort": "18000"}]}
+
+
+class FakeContainers:
+    def __init__(self) -> None:
+        self.active_runs = 0
+        self.max_active_runs = 0
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> FakeContainer:
+        raise docker.errors.NotFound(name)
+
+    def run(self, **kwargs) -> FakeContainer:
+        with self._lock:
+            self.active_runs += 1
+            self.max_active_runs = max(self.max_active_runs, self.active_runs)
+        try:
+            time.sleep(DOCKER_RUN_SECONDS)
+        finally:
+            with self._lock:
+                self.active_runs -= 1
+        return FakeContainer(kwargs["name"], kwargs["labels"])
+
+
+class FakeDockerClient:
+    def __init__(self) -> None:
+        self.containers = FakeContainers()
+
+
+class FakeWorkspaceManager:
+    def __init__(self, root: Path) -> None:
+        self.temp_dir = root / "temp"
+
+    def get_workspace_volume(self, *, user_id: str, session_id: str) -> str:
+        return str(self.temp_dir.parent / "active" / user_id / session_id)
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ContainerPool:
+    client = FakeDockerClient()
+    monkeypatch.setattr(container_pool_module.docker, "from_env", lambda: client)
+    monkeypatch.setattr(
+        container_pool_module,
+        "WorkspaceManager",
+        lambda: FakeWorkspaceManager(tmp_path),
+    )
+    pool = ContainerPool()
+    pool.settings = pool.settings.model_copy(update={"warm_pool_enabled": False})
+
+    async def service_ready(executor_url: str, timeout: int = 60) -> None:
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(pool, "_wait_for_service_ready", service_ready)
+    return pool
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    interval = 0.01
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def _start_concurrently(pool: ContainerPool, count: int):
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(_measure_lag(stop, lags))
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(pool.get_or_create_container(str(uuid.uuid4()), "user") for _ in range(count))
+    )
+    wall = time.perf_counter() - started
+    stop.set()
+    await ticker
+    return results, wall, lags
+
+
+def test_concurrent_starts_do_not_serialize(pool: ContainerPool) -> None:
+    count = 8
+    results, wall, lags = asyncio.run(_start_concurrently(pool, count))
+
+    assert len({container_id for _, container_id in results}) == count
+    assert pool.docker_client.containers.max_active_runs == count
+    # One start is docker run plus two reloads; serialized starts would take 8x that.
+    single_start = DOCKER_RUN_SECONDS + 2 * DOCKER_RELOAD_SECONDS
+    assert wall < single_start * 2
+    # Blocking SDK calls run on the Docker API thread pool, not on the event loop.
+    assert max(lags) < 0.1
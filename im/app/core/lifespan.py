@@ -6,6 +6,7 @@ from fastapi import FastAPI
 
 from app.core.database import Base, engine
 import app.models  # noqa: F401
+from app.services.dedup_store import dedup_store
 from app.services.dingtalk_stream_service import DingTalkStreamService
 from app.services.poller_service import PollerService
 
@@ -22,6 +23,7 @@ async def lifespan(_: FastAPI):
     tasks: list[asyncio.Task[None]] = []
 
     try:
+        tasks.append(asyncio.create_task(dedup_store.run_maintenance_loop()))
         tasks.append(asyncio.create_task(poller.run_user_input_loop()))
         tasks.append(asyncio.create_task(poller.run_session_messages_loop()))
         tasks.append(asyncio.create_task(poller.run_sessions_recent_loop()))
@@ -33,3 +35,7 @@ async def lifespan(_: FastAPI):
         for t in tasks:
             t.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await dedup_store.flush()
+        except Exception:
+            logger.exception("dedup_flush_on_shutdown_failed")
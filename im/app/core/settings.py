@@ -39,6 +39,26 @@ class Settings(BaseSettings):
     poll_http_timeout_seconds: float = Field(
         default=10.0, alias="POLL_HTTP_TIMEOUT_SECONDS"
     )
+    # Terminal notifications follow the Backend status change feed; events written in
+    # the last this many seconds are re-read each poll to catch transitions committed
+    # behind the cursor (keep it above the longest Backend transaction).
+    poll_session_changes_lookback_seconds: int = Field(
+        default=300, alias="POLL_SESSION_CHANGES_LOOKBACK_SECONDS"
+    )
+
+    # Notification dedup keys: in-memory LRU + bloom filter in front of the dedup_events
+    # table. New keys are written in batches every DEDUP_FLUSH_INTERVAL_SECONDS; keys
+    # older than DEDUP_TTL_DAYS are pruned (0 keeps them forever).
+    dedup_ttl_days: float = Field(default=30.0, alias="DEDUP_TTL_DAYS")
+    dedup_lru_size: int = Field(default=50000, alias="DEDUP_LRU_SIZE")
+    dedup_bloom_capacity: int = Field(default=1000000, alias="DEDUP_BLOOM_CAPACITY")
+    dedup_batch_size: int = Field(default=500, alias="DEDUP_BATCH_SIZE")
+    dedup_flush_interval_seconds: float = Field(
+        default=1.0, alias="DEDUP_FLUSH_INTERVAL_SECONDS"
+    )
+    dedup_prune_interval_seconds: float = Field(
+        default=3600.0, alias="DEDUP_PRUNE_INTERVAL_SECONDS"
+    )
 
     # Telegram bot integration
     telegram_bot_token: str = Field(default="", alias="TELEGRAM_BOT_TOKEN")
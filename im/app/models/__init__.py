@@ -4,6 +4,7 @@ from app.models.active_session import ActiveSession
 from app.models.channel import Channel
 from app.models.channel_delivery import ChannelDelivery
 from app.models.dedup_event import DedupEvent
+from app.models.message_watermark import MessageWatermark
 from app.models.watched_session import WatchedSession
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "ActiveSession",
     "WatchedSession",
     "DedupEvent",
+    "MessageWatermark",
 ]
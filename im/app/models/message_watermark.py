@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, ForeignKey, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base, TimestampMixin
+
+
+class MessageWatermark(Base, TimestampMixin):
+    """Highest Backend message id already delivered to a channel for a session."""
+
+    __tablename__ = "message_watermarks"
+    __table_args__ = (
+        UniqueConstraint(
+            "channel_id", "session_id", name="uq_message_watermark_channel_session"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    channel_id: Mapped[int] = mapped_column(
+        ForeignKey("channels.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    session_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    last_message_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -35,3 +35,12 @@ class ActiveSessionRepository:
     def list_by_session(db: Session, *, session_id: str) -> list[ActiveSession]:
         stmt = select(ActiveSession).where(ActiveSession.session_id == session_id)
         return list(db.execute(stmt).scalars().all())
+
+    @staticmethod
+    def list_pairs(db: Session) -> list[tuple[int, str]]:
+        """Return every (channel_id, session_id) binding."""
+        stmt = select(ActiveSession.channel_id, ActiveSession.session_id)
+        return [
+            (int(channel_id), session_id)
+            for channel_id, session_id in db.execute(stmt).all()
+        ]
@@ -18,6 +18,14 @@ class ChannelDeliveryRepository:
             return None
         return row.send_address
 
+    @staticmethod
+    def list_send_addresses(db: Session) -> dict[int, str]:
+        stmt = select(ChannelDelivery.channel_id, ChannelDelivery.send_address)
+        return {
+            int(channel_id): send_address
+            for channel_id, send_address in db.execute(stmt).all()
+        }
+
     @staticmethod
     def upsert_send_address(
         db: Session, *, channel_id: int, send_address: str
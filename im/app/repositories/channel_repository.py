@@ -41,6 +41,10 @@ class ChannelRepository:
         db.refresh(channel)
         return channel
 
+    @staticmethod
+    def list_all(db: Session) -> list[Channel]:
+        return list(db.execute(select(Channel)).scalars().all())
+
     @staticmethod
     def list_enabled(db: Session) -> list[Channel]:
         stmt = select(Channel).where(Channel.enabled.is_(True))
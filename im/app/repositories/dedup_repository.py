@@ -1,4 +1,8 @@
-from sqlalchemy import select
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -27,3 +31,40 @@ class DedupRepository:
             db.rollback()
             return False
         return True
+
+    @staticmethod
+    def put_many(db: Session, *, keys: list[str]) -> None:
+        """Insert keys in one statement, ignoring ones that already exist."""
+        if not keys:
+            return
+        rows = [{"key": key} for key in keys]
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(DedupEvent).values(rows).on_conflict_do_nothing()
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(DedupEvent).values(rows).on_conflict_do_nothing()
+        else:
+            for key in keys:
+                if not DedupRepository.exists(db, key=key):
+                    db.add(DedupEvent(key=key))
+            db.commit()
+            return
+        db.execute(stmt)
+        db.commit()
+
+    @staticmethod
+    def iter_keys_since(
+        db: Session, *, since: datetime | None, batch_size: int = 10000
+    ) -> Iterator[str]:
+        stmt = select(DedupEvent.key)
+        if since is not None:
+            stmt = stmt.where(DedupEvent.created_at >= since)
+        for key in db.execute(stmt.execution_options(yield_per=batch_size)).scalars():
+            yield key
+
+    @staticmethod
+    def delete_older_than(db: Session, *, cutoff: datetime) -> int:
+        stmt = delete(DedupEvent).where(DedupEvent.created_at < cutoff)
+        result = db.connection().execute(stmt)
+        db.commit()
+        return int(result.rowcount or 0)
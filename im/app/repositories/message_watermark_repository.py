@@ -0,0 +1,51 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.message_watermark import MessageWatermark
+
+
+class MessageWatermarkRepository:
+    @staticmethod
+    def get_by_session(db: Session, *, session_id: str) -> dict[int, int]:
+        """Return {channel_id: last_message_id} for a session."""
+        stmt = select(
+            MessageWatermark.channel_id, MessageWatermark.last_message_id
+        ).where(MessageWatermark.session_id == session_id)
+        return {
+            int(channel_id): int(last_message_id)
+            for channel_id, last_message_id in db.execute(stmt).all()
+        }
+
+    @staticmethod
+    def advance(
+        db: Session, *, channel_id: int, session_id: str, last_message_id: int
+    ) -> None:
+        """Move the watermark forward; it never moves backwards."""
+        stmt = (
+            select(MessageWatermark)
+            .where(MessageWatermark.channel_id == channel_id)
+            .where(MessageWatermark.session_id == session_id)
+        )
+        current = db.execute(stmt).scalars().first()
+        if current:
+            if last_message_id > current.last_message_id:
+                current.last_message_id = last_message_id
+                db.commit()
+            return
+
+        db.add(
+            MessageWatermark(
+                channel_id=channel_id,
+                session_id=session_id,
+                last_message_id=last_message_id,
+            )
+        )
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            current = db.execute(stmt).scalars().first()
+            if current and last_message_id > current.last_message_id:
+                current.last_message_id = last_message_id
+                db.commit()
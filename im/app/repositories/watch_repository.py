@@ -50,6 +50,15 @@ class WatchRepository:
         stmt = select(WatchedSession).where(WatchedSession.session_id == session_id)
         return list(db.execute(stmt).scalars().all())
 
+    @staticmethod
+    def list_pairs(db: Session) -> list[tuple[int, str]]:
+        """Return every (channel_id, session_id) watch."""
+        stmt = select(WatchedSession.channel_id, WatchedSession.session_id)
+        return [
+            (int(channel_id), session_id)
+            for channel_id, session_id in db.execute(stmt).all()
+        ]
+
     @staticmethod
     def list_by_channel(db: Session, *, channel_id: int) -> list[WatchedSession]:
         stmt = (
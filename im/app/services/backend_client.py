@@ -92,6 +92,28 @@ class BackendClient:
             return []
         return data
 
+    async def list_session_changes(
+        self,
+        *,
+        since: int | None,
+        limit: int = 200,
+        kind: str = "chat",
+        lookback_seconds: int = 0,
+    ) -> dict[str, Any]:
+        """Fetch session/run status transitions after `since` (None: head cursor).
+
+        With `lookback_seconds`, only transitions written in that recent window.
+        """
+        params: dict[str, Any] = {"limit": limit, "kind": kind}
+        if since is not None:
+            params["since"] = since
+        if lookback_seconds > 0:
+            params["lookback_seconds"] = lookback_seconds
+        data = await self._request("GET", "/session-changes", params=params)
+        if not isinstance(data, dict):
+            raise BackendClientError("Unexpected session changes payload")
+        return data
+
     async def get_session_state(self, *, session_id: str) -> dict[str, Any]:
         data = await self._request("GET", f"/sessions/{session_id}/state")
         return data if isinstance(data, dict) else {}
@@ -108,6 +130,21 @@ class BackendClient:
             return []
         return data
 
+    async def get_session_messages_page(
+        self, *, session_id: str, after_id: int | None = None, limit: int = 200
+    ) -> dict[str, Any]:
+        """Fetch messages with id > after_id (keyset page with `next_cursor`).
+
+        The capped message count is not requested: paging by cursor never needs it.
+        """
+        params: dict[str, Any] = {"limit": limit}
+        if after_id is not None:
+            params["after_id"] = after_id
+        data = await self._request(
+            "GET", f"/sessions/{session_id}/messages", params=params
+        )
+        return data if isinstance(data, dict) else {}
+
     async def list_user_input_requests(
         self, *, session_id: str | None = None
     ) -> list[dict[str, Any]]:
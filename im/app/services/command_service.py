@@ -10,6 +10,7 @@ from app.repositories.active_session_repository import ActiveSessionRepository
 from app.repositories.watch_repository import WatchRepository
 from app.services.backend_client import BackendClient, BackendClientError
 from app.services.message_formatter import MessageFormatter
+from app.services.subscription_index import subscription_index
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +80,7 @@ class CommandService:
         run_id = str(result.get("run_id") or "")
         status = str(result.get("status") or "")
         WatchRepository.add_watch(db, channel_id=channel.id, session_id=session_id)
+        subscription_index.add_watch(channel_id=channel.id, session_id=session_id)
         return [
             self.formatter.format_task_created(
                 session_id=session_id,
@@ -156,7 +158,9 @@ class CommandService:
                 channel_id=channel.id,
                 session_id=session_id,
             )
+            subscription_index.set_active(channel_id=channel.id, session_id=session_id)
             WatchRepository.add_watch(db, channel_id=channel.id, session_id=session_id)
+            subscription_index.add_watch(channel_id=channel.id, session_id=session_id)
 
         created_text = self.formatter.format_task_created(
             session_id=session_id,
@@ -183,7 +187,9 @@ class CommandService:
             channel_id=channel.id,
             session_id=session_id,
         )
+        subscription_index.set_active(channel_id=channel.id, session_id=session_id)
         WatchRepository.add_watch(db, channel_id=channel.id, session_id=session_id)
+        subscription_index.add_watch(channel_id=channel.id, session_id=session_id)
         return [
             f"🔗 已连接会话：{session_id}\n"
             f"🌐 前端查看: {self.formatter.session_url(session_id)}"
@@ -194,6 +200,7 @@ class CommandService:
         if not session_id:
             return ["用法：/watch <session_id>"]
         WatchRepository.add_watch(db, channel_id=channel.id, session_id=session_id)
+        subscription_index.add_watch(channel_id=channel.id, session_id=session_id)
         return [
             f"👀 已订阅会话：{session_id}\n"
             f"🌐 前端查看: {self.formatter.session_url(session_id)}"
@@ -236,6 +243,7 @@ class CommandService:
             channel_id=channel.id,
             session_id=session_id,
         )
+        subscription_index.remove_watch(channel_id=channel.id, session_id=session_id)
         if removed <= 0:
             return [f"未找到订阅：{session_id}"]
         return [f"✅ 已取消订阅：{session_id}"]
@@ -255,6 +263,7 @@ class CommandService:
     async def _cmd_clear(self, db: Session, channel: Channel, args: str) -> list[str]:
         _ = args
         ActiveSessionRepository.clear(db, channel_id=channel.id)
+        subscription_index.clear_active(channel_id=channel.id)
         return ["已清除当前会话绑定"]
 
     async def _cmd_answer(self, db: Session, channel: Channel, args: str) -> list[str]:
@@ -0,0 +1,272 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.settings import get_settings
+from app.repositories.dedup_repository import DedupRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over string keys (double hashing on BLAKE2b)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class DedupStore:
+    """Dedup keys for outbound notifications, fronted by an in-process LRU and bloom filter.
+
+    Lookups are answered from memory whenever possible: recently seen keys hit the LRU,
+    and keys the bloom filter has never seen are known to be absent without a query.
+    Only bloom positives that miss the LRU go to the database. New keys are buffered and
+    written in batches with INSERT ... ON CONFLICT DO NOTHING, and keys older than the
+    TTL are pruned. The maintenance loop does the flushing, pruning and bloom filter
+    builds (at startup and after each prune) in worker threads, off the event loop;
+    until the bloom filter is ready, lookups go to the database.
+
+    A crash can lose keys buffered since the last flush, so at most the notifications of
+    one flush interval may be sent twice.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        *,
+        ttl_seconds: float | None = None,
+        lru_size: int | None = None,
+        bloom_capacity: int | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._session_factory = session_factory
+        self.ttl_seconds = (
+            settings.dedup_ttl_days * 86400 if ttl_seconds is None else ttl_seconds
+        )
+        self.lru_size = max(1, lru_size or settings.dedup_lru_size)
+        self.bloom_capacity = max(1, bloom_capacity or settings.dedup_bloom_capacity)
+        self.batch_size = max(1, batch_size or settings.dedup_batch_size)
+        self._lru: OrderedDict[str, None] = OrderedDict()
+        self._pending: list[str] = []
+        self._pending_set: set[str] = set()
+        # Keys of the batch being written by flush(), still unknown to the database.
+        self._flushing_set: set[str] = set()
+        self._flush_requested = asyncio.Event()
+        self._bloom: BloomFilter | None = None
+        # Keys put while a bloom filter is being built, added to it once it is ready.
+        self._bloom_backlog: list[str] | None = None
+        self.lru_hits = 0
+        self.bloom_negatives = 0
+        self.db_lookups = 0
+        self.flushed = 0
+
+    def _cutoff(self) -> datetime | None:
+        if self.ttl_seconds <= 0:
+            return None
+        return datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+
+    def _load_bloom(self) -> tuple[BloomFilter, int]:
+        """Build a bloom filter from the stored keys (blocking; run in a thread)."""
+        db = self._session_factory()
+        try:
+            # Load every stored key, including expired ones not pruned yet, so a bloom
+            # negative always means the key is absent.
+            keys = list(DedupRepository.iter_keys_since(db, since=None))
+        finally:
+            db.close()
+        # Leave headroom for keys added until the next rebuild (after pruning).
+        bloom = BloomFilter(max(self.bloom_capacity, len(keys) * 2))
+        for key in keys:
+            bloom.add(key)
+        return bloom, len(keys)
+
+    async def build_bloom(self) -> None:
+        """(Re)build the bloom filter in a worker thread without blocking lookups."""
+        self._bloom = None
+        self._bloom_backlog = []
+        started = time.perf_counter()
+        try:
+            bloom, loaded = await asyncio.to_thread(self._load_bloom)
+            # Keys put meanwhile may have been flushed after the load read the table.
+            for key in self._bloom_backlog:
+                bloom.add(key)
+            for key in self._pending:
+                bloom.add(key)
+        finally:
+            self._bloom_backlog = None
+        self._bloom = bloom
+        logger.info(
+            "dedup_bloom_loaded",
+            extra={
+                "keys": loaded,
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+            },
+        )
+
+    def _remember(self, key: str) -> None:
+        self._lru[key] = None
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def _is_buffered(self, key: str) -> bool:
+        return key in self._pending_set or key in self._flushing_set or key in self._lru
+
+    def exists(self, key: str) -> bool:
+        if self._is_buffered(key):
+            self.lru_hits += 1
+            if key in self._lru:
+                self._lru.move_to_end(key)
+            return True
+
+        bloom = self._bloom
+        if bloom is not None and key not in bloom:
+            self.bloom_negatives += 1
+            return False
+
+        db = self._session_factory()
+        try:
+            self.db_lookups += 1
+            found = DedupRepository.exists(db, key=key)
+        finally:
+            db.close()
+        if found:
+            self._remember(key)
+        return found
+
+    def put(self, key: str) -> None:
+        if self._is_buffered(key):
+            return
+        self._pending.append(key)
+        self._pending_set.add(key)
+        if self._bloom is not None:
+            self._bloom.add(key)
+        if self._bloom_backlog is not None:
+            self._bloom_backlog.append(key)
+        self._remember(key)
+        if len(self._pending) >= self.batch_size:
+            # Wake the maintenance loop instead of writing on the caller's stack.
+            self._flush_requested.set()
+
+    def _write_keys(self, keys: list[str]) -> None:
+        """Insert a batch of keys (blocking; run in a thread)."""
+        db = self._session_factory()
+        try:
+            DedupRepository.put_many(db, keys=keys)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def flush(self) -> int:
+        """Write the pending keys in a worker thread.
+
+        The batch is swapped out on the event loop, so keys put meanwhile start the next
+        batch; if the write fails, its keys go back to the pending batch.
+        """
+        if not self._pending:
+            return 0
+        keys = self._pending
+        self._flushing_set = self._pending_set
+        self._pending = []
+        self._pending_set = set()
+        try:
+            await asyncio.to_thread(self._write_keys, keys)
+        except BaseException:
+            self._pending = keys + self._pending
+            self._pending_set |= self._flushing_set
+            raise
+        finally:
+            self._flushing_set = set()
+        self.flushed += len(keys)
+        return len(keys)
+
+    def _delete_expired(self, cutoff: datetime) -> int:
+        """Delete keys older than `cutoff` (blocking; run in a thread)."""
+        db = self._session_factory()
+        try:
+            return DedupRepository.delete_older_than(db, cutoff=cutoff)
+        finally:
+            db.close()
+
+    async def prune(self) -> int:
+        """Delete expired keys in a worker thread and drop the bloom filter if any went."""
+        cutoff = self._cutoff()
+        if cutoff is None:
+            return 0
+        deleted = await asyncio.to_thread(self._delete_expired, cutoff)
+        if deleted:
+            # Bloom filters cannot forget; drop it until the maintenance loop rebuilds it.
+            self._bloom = None
+            self._lru.clear()
+            logger.info("dedup_keys_pruned", extra={"deleted": deleted})
+        return deleted
+
+    async def run_maintenance_loop(self) -> None:
+        settings = get_settings()
+        flush_interval = max(0.2, float(settings.dedup_flush_interval_seconds))
+        prune_interval = max(60.0, float(settings.dedup_prune_interval_seconds))
+        next_prune = time.monotonic() + prune_interval
+        while True:
+            try:
+                if self._bloom is None:
+                    await self.build_bloom()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("dedup_bloom_build_failed")
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+                if time.monotonic() >= next_prune:
+                    next_prune = time.monotonic() + prune_interval
+                    await self.prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("dedup_maintenance_failed")
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "lru_entries": len(self._lru),
+            "pending": len(self._pending) + len(self._flushing_set),
+            "lru_hits": self.lru_hits,
+            "bloom_negatives": self.bloom_negatives,
+            "db_lookups": self.db_lookups,
+            "flushed": self.flushed,
+        }
+
+
+dedup_store = DedupStore()
@@ -8,6 +8,7 @@ from app.repositories.dedup_repository import DedupRepository
 from app.schemas.im_message import InboundMessage
 from app.services.command_service import CommandService
 from app.services.notification_gateway import NotificationGateway
+from app.services.subscription_index import subscription_index
 
 
 class InboundMessageService:
@@ -30,6 +31,7 @@ class InboundMessageService:
                 provider=message.provider,
                 destination=message.destination,
             )
+            subscription_index.upsert_channel(channel)
             send_address = _resolve_send_address(
                 db,
                 channel=channel,
@@ -68,6 +70,9 @@ def _resolve_send_address(
             channel_id=channel.id,
             send_address=candidate,
         )
+        subscription_index.set_send_address(
+            channel_id=channel.id, send_address=candidate
+        )
         return candidate
 
     stored = ChannelDeliveryRepository.get_send_address(db, channel_id=channel.id)
@@ -1,18 +1,18 @@
 import asyncio
 import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
 
 from app.core.database import SessionLocal
 from app.core.settings import get_settings
-from app.repositories.active_session_repository import ActiveSessionRepository
-from app.repositories.channel_repository import ChannelRepository
-from app.repositories.channel_delivery_repository import ChannelDeliveryRepository
-from app.repositories.dedup_repository import DedupRepository
-from app.repositories.watch_repository import WatchRepository
+from app.repositories.message_watermark_repository import MessageWatermarkRepository
 from app.services.backend_client import BackendClient, BackendClientError
+from app.services.dedup_store import dedup_store
 from app.services.message_formatter import MessageFormatter
 from app.services.notification_gateway import NotificationGateway
+from app.services.subscription_index import subscription_index
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,14 @@ class PollerService:
         self.gateway = NotificationGateway()
         # Hint updated by the session-messages loop to gate user-input polling.
         self._has_non_terminal_targets = True
+        # session_id -> {channel_id: last delivered message id}, mirrored from the DB.
+        self._watermarks: OrderedDict[str, dict[int, int]] = OrderedDict()
+        self._max_cached_sessions = 4096
+        self._message_page_size = 200
+        # Status change feed cursor (None until the head is fetched) and processed ids.
+        self._feed_cursor: int | None = None
+        self._feed_healthy = False
+        self._processed_events: OrderedDict[int, None] = OrderedDict()
 
     async def run_user_input_loop(self) -> None:
         interval = max(0.2, float(self.settings.poll_user_input_interval_seconds))
@@ -44,7 +52,8 @@ class PollerService:
         interval = max(1.0, float(self.settings.poll_sessions_recent_interval_seconds))
         while True:
             try:
-                await self._poll_recent_sessions()
+                if not await self._poll_status_changes():
+                    await self._poll_recent_sessions()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -53,9 +62,15 @@ class PollerService:
 
     async def run_sessions_full_loop(self) -> None:
         interval = max(10.0, float(self.settings.poll_sessions_full_interval_seconds))
+        recovered = False
         while True:
             try:
-                await self._poll_all_sessions()
+                # The change feed covers steady state. Scan everything once at startup
+                # (to catch up on anything missed while down) and whenever the feed is
+                # unavailable.
+                if not recovered or not self._feed_healthy:
+                    await self._poll_all_sessions()
+                    recovered = True
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -74,21 +89,7 @@ class PollerService:
             await asyncio.sleep(interval)
 
     def _get_target_channel_ids(self, db: Session, *, session_id: str) -> set[int]:
-        target: set[int] = set()
-
-        for ch in ChannelRepository.list_enabled(db):
-            if ch.subscribe_all:
-                target.add(ch.id)
-
-        for watch in WatchRepository.list_by_session(db, session_id=session_id):
-            target.add(watch.channel_id)
-
-        for active in ActiveSessionRepository.list_by_session(
-            db, session_id=session_id
-        ):
-            target.add(active.channel_id)
-
-        return target
+        return subscription_index.get_target_channel_ids(db, session_id=session_id)
 
     async def _poll_user_input_requests(self) -> None:
         try:
@@ -121,7 +122,7 @@ class PollerService:
 
                 for channel_id in target_channel_ids:
                     key = f"ui:{channel_id}:{request_id}"
-                    if DedupRepository.exists(db, key=key):
+                    if dedup_store.exists(key):
                         continue
 
                     text = self.formatter.format_user_input_request(
@@ -132,7 +133,7 @@ class PollerService:
                         expires_at=str(expires_at) if expires_at else None,
                     )
                     await self._send_to_channel(db, channel_id=channel_id, text=text)
-                    DedupRepository.put(db, key=key)
+                    dedup_store.put(key)
         finally:
             db.close()
 
@@ -213,47 +214,179 @@ class PollerService:
 
                 if status not in {"completed", "failed", "canceled"}:
                     continue
+                if self._is_past_dedup_ttl(item.get("updated_at")):
+                    # Its dedup keys may have been pruned; never re-notify old sessions.
+                    continue
 
-                target_channel_ids = self._get_target_channel_ids(
-                    db, session_id=session_id
+                await self._notify_terminal_session(
+                    db, session_id=session_id, session_status=status, title=title
                 )
-                if not target_channel_ids:
-                    continue
+        finally:
+            db.close()
 
-                # Flush assistant text updates first so terminal notifications come last.
-                await self._emit_assistant_text_updates(
+        return len(sessions)
+
+    async def _poll_status_changes(self) -> bool:
+        """Consume the Backend status change feed.
+
+        Returns:
+            False when the feed is unavailable and callers should fall back to scans.
+        """
+        if self._feed_cursor is None:
+            try:
+                head = await self.backend.list_session_changes(since=None)
+            except BackendClientError as exc:
+                logger.warning(
+                    "backend_session_changes_failed", extra={"error": str(exc)}
+                )
+                self._feed_healthy = False
+                return False
+            self._feed_cursor = _parse_message_id(head.get("next_cursor")) or 0
+            self._feed_healthy = True
+            return True
+
+        # Follow the cursor, then re-read a recent time window: ids are assigned when a
+        # transition is written, so a long transaction can commit an event below the
+        # cursor. Processed ids are skipped.
+        terminal: dict[str, list[dict]] = {}
+        if not await self._read_status_changes(self._feed_cursor, terminal=terminal):
+            return False
+        lookback_seconds = int(self.settings.poll_session_changes_lookback_seconds)
+        if lookback_seconds > 0 and not await self._read_status_changes(
+            0, terminal=terminal, lookback_seconds=lookback_seconds
+        ):
+            return False
+
+        while len(self._processed_events) > 10000:
+            self._processed_events.popitem(last=False)
+        self._feed_healthy = True
+
+        if not terminal:
+            return True
+
+        db = SessionLocal()
+        try:
+            for session_id, events in terminal.items():
+                # The window re-read can add events older than the cursor read's.
+                events.sort(key=lambda e: _parse_message_id(e.get("event_id")) or 0)
+                latest = events[-1]
+                run_events = [e for e in events if e.get("entity") == "run"]
+                run_detail = None
+                if run_events:
+                    run_event = run_events[-1]
+                    run_detail = (
+                        str(run_event.get("run_id") or "").strip() or None,
+                        str(run_event.get("status") or "").strip() or None,
+                        str(run_event.get("last_error") or "").strip() or None,
+                    )
+                await self._notify_terminal_session(
                     db,
                     session_id=session_id,
-                    title=title,
-                    target_channel_ids=target_channel_ids,
+                    session_status=_normalize_status(
+                        str(latest.get("session_status") or latest.get("status") or "")
+                    ),
+                    title=str(latest.get("title") or "").strip() or None,
+                    run_detail=run_detail,
                 )
+        finally:
+            db.close()
+        return True
 
-                run_id, run_status, last_error = await self._get_latest_run_detail(
-                    session_id=session_id
+    async def _read_status_changes(
+        self,
+        since: int,
+        *,
+        terminal: dict[str, list[dict]],
+        lookback_seconds: int = 0,
+    ) -> bool:
+        """Page through the feed after `since`, collecting unprocessed terminal events."""
+        while True:
+            try:
+                page = await self.backend.list_session_changes(
+                    since=since, limit=200, lookback_seconds=lookback_seconds
                 )
-                run_id = run_id or None
-                run_status = _effective_notification_status(
-                    run_status=run_status,
-                    session_status=status,
+            except BackendClientError as exc:
+                logger.warning(
+                    "backend_session_changes_failed", extra={"error": str(exc)}
                 )
+                self._feed_healthy = False
+                return False
+            for item in page.get("items") or []:
+                if not isinstance(item, dict):
+                    continue
+                event_id = _parse_message_id(item.get("event_id"))
+                session_id = str(item.get("session_id") or "").strip()
+                if event_id is None or not session_id:
+                    continue
+                if event_id in self._processed_events:
+                    continue
+                self._processed_events[event_id] = None
+                status = _normalize_status(str(item.get("status") or ""))
+                if status in {"completed", "failed", "canceled"}:
+                    terminal.setdefault(session_id, []).append(item)
+            next_cursor = _parse_message_id(page.get("next_cursor"))
+            if next_cursor is None or next_cursor <= since:
+                return True
+            since = next_cursor
+            self._feed_cursor = max(self._feed_cursor or 0, next_cursor)
+            if not page.get("has_more"):
+                return True
+
+    async def _notify_terminal_session(
+        self,
+        db: Session,
+        *,
+        session_id: str,
+        session_status: str,
+        title: str | None,
+        run_detail: tuple[str | None, str | None, str | None] | None = None,
+    ) -> None:
+        target_channel_ids = self._get_target_channel_ids(db, session_id=session_id)
+        if not target_channel_ids:
+            return
 
-                for channel_id in target_channel_ids:
-                    dedup_key = f"run:{channel_id}:{run_id or session_id}:{run_status}"
-                    if DedupRepository.exists(db, key=dedup_key):
-                        continue
-                    text = self.formatter.format_terminal_notification(
-                        session_id=session_id,
-                        title=title,
-                        status=run_status,
-                        run_id=run_id,
-                        last_error=last_error if run_status == "failed" else None,
-                    )
-                    await self._send_to_channel(db, channel_id=channel_id, text=text)
-                    DedupRepository.put(db, key=dedup_key)
-        finally:
-            db.close()
+        # Flush assistant text updates first so terminal notifications come last.
+        await self._emit_assistant_text_updates(
+            db,
+            session_id=session_id,
+            title=title,
+            target_channel_ids=target_channel_ids,
+        )
 
-        return len(sessions)
+        if run_detail is None:
+            run_detail = await self._get_latest_run_detail(session_id=session_id)
+        run_id, run_status, last_error = run_detail
+        run_id = run_id or None
+        run_status = _effective_notification_status(
+            run_status=run_status,
+            session_status=session_status,
+        )
+
+        for channel_id in target_channel_ids:
+            dedup_key = f"run:{channel_id}:{run_id or session_id}:{run_status}"
+            if dedup_store.exists(dedup_key):
+                continue
+            text = self.formatter.format_terminal_notification(
+                session_id=session_id,
+                title=title,
+                status=run_status,
+                run_id=run_id,
+                last_error=last_error if run_status == "failed" else None,
+            )
+            await self._send_to_channel(db, channel_id=channel_id, text=text)
+            dedup_store.put(dedup_key)
+
+    def _is_past_dedup_ttl(self, updated_at: object) -> bool:
+        ttl_days = float(self.settings.dedup_ttl_days)
+        if ttl_days <= 0 or not isinstance(updated_at, str):
+            return False
+        try:
+            parsed = datetime.fromisoformat(updated_at)
+        except ValueError:
+            return False
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed < datetime.now(timezone.utc) - timedelta(days=ttl_days)
 
     async def _emit_assistant_text_updates(
         self,
@@ -263,45 +396,121 @@ class PollerService:
         title: str | None,
         target_channel_ids: set[int],
     ) -> None:
+        watermarks = self._get_watermarks(db, session_id=session_id)
+        known = [watermarks[c] for c in target_channel_ids if c in watermarks]
+        # A channel without a watermark bootstraps from the start of the session.
+        after_id = (
+            min(known) if known and len(known) == len(target_channel_ids) else None
+        )
+
         try:
-            messages = await self.backend.get_session_messages(session_id=session_id)
+            messages = await self._fetch_messages_after(
+                session_id=session_id, after_id=after_id
+            )
         except BackendClientError:
             return
+        if not messages:
+            return
 
+        message_ids = [
+            message_id
+            for message_id in (
+                _parse_message_id(m.get("id")) for m in messages if isinstance(m, dict)
+            )
+            if message_id is not None
+        ]
+        last_message_id = max(message_ids) if message_ids else None
         text_entries = _extract_assistant_text_entries(messages)
-        if not text_entries:
-            return
 
         bootstrap_tail = 3
         for channel_id in target_channel_ids:
-            init_key = f"msg:init:{channel_id}:{session_id}"
-            if not DedupRepository.exists(db, key=init_key):
-                # Avoid flooding historical records when the text-stream feature is first enabled.
-                if len(text_entries) > bootstrap_tail:
-                    for message_id, _ in text_entries[:-bootstrap_tail]:
-                        key = f"msg:{channel_id}:{session_id}:{message_id}"
-                        DedupRepository.put(db, key=key)
-                    pending_entries = text_entries[-bootstrap_tail:]
+            watermark = watermarks.get(channel_id)
+            if watermark is None:
+                init_key = f"msg:init:{channel_id}:{session_id}"
+                if dedup_store.exists(init_key):
+                    # Already streamed under the per-message dedup keys; resume from now.
+                    pending_entries = []
                 else:
-                    pending_entries = text_entries
-                DedupRepository.put(db, key=init_key)
+                    # Avoid flooding historical records when the text-stream feature is first enabled.
+                    pending_entries = text_entries[-bootstrap_tail:]
             else:
-                pending_entries = text_entries
+                pending_entries = [
+                    (message_id, text)
+                    for message_id, text in text_entries
+                    if message_id > watermark
+                ]
 
             for message_id, text in pending_entries:
-                key = f"msg:{channel_id}:{session_id}:{message_id}"
-                if DedupRepository.exists(db, key=key):
-                    continue
                 rendered = self.formatter.format_assistant_text_update(
                     session_id=session_id,
                     text=text,
                     title=title,
                 )
-                if not rendered:
-                    DedupRepository.put(db, key=key)
-                    continue
-                await self._send_to_channel(db, channel_id=channel_id, text=rendered)
-                DedupRepository.put(db, key=key)
+                if rendered:
+                    await self._send_to_channel(
+                        db, channel_id=channel_id, text=rendered
+                    )
+                self._advance_watermark(
+                    db,
+                    channel_id=channel_id,
+                    session_id=session_id,
+                    message_id=message_id,
+                )
+
+            if last_message_id is not None:
+                self._advance_watermark(
+                    db,
+                    channel_id=channel_id,
+                    session_id=session_id,
+                    message_id=last_message_id,
+                )
+
+    async def _fetch_messages_after(
+        self, *, session_id: str, after_id: int | None
+    ) -> list[dict]:
+        messages: list[dict] = []
+        cursor = after_id
+        while True:
+            page = await self.backend.get_session_messages_page(
+                session_id=session_id,
+                after_id=cursor,
+                limit=self._message_page_size,
+            )
+            items = page.get("items")
+            if isinstance(items, list):
+                messages.extend(items)
+            next_cursor = _parse_message_id(page.get("next_cursor"))
+            if not page.get("has_more") or next_cursor is None or next_cursor == cursor:
+                return messages
+            cursor = next_cursor
+
+    def _get_watermarks(self, db: Session, *, session_id: str) -> dict[int, int]:
+        watermarks = self._watermarks.get(session_id)
+        if watermarks is None:
+            watermarks = MessageWatermarkRepository.get_by_session(
+                db, session_id=session_id
+            )
+            self._watermarks[session_id] = watermarks
+            while len(self._watermarks) > self._max_cached_sessions:
+                self._watermarks.popitem(last=False)
+        else:
+            self._watermarks.move_to_end(session_id)
+        return watermarks
+
+    def _advance_watermark(
+        self, db: Session, *, channel_id: int, session_id: str, message_id: int
+    ) -> None:
+        watermarks = self._get_watermarks(db, session_id=session_id)
+        current = watermarks.get(channel_id)
+        if current is not None and message_id <= current:
+            return
+        MessageWatermarkRepository.advance(
+            db,
+            channel_id=channel_id,
+            session_id=session_id,
+            last_message_id=message_id,
+        )
+        watermarks[channel_id] = message_id
 
     async def _get_latest_run_detail(
         self, *, session_id: str
@@ -325,22 +534,12 @@ class PollerService:
     async def _send_to_channel(
         self, db: Session, *, channel_id: int, text: str
     ) -> None:
-        from app.models.channel import Channel  # local import to avoid circulars
-
-        ch: Channel | None = db.get(Channel, channel_id)
-        if not ch or not ch.enabled:
+        target = subscription_index.get_channel(db, channel_id=channel_id)
+        if not target or not target.enabled:
             return
-        # DingTalk sessionWebhook can expire; prefer stable conversationId for polling-based notifications.
-        if ch.provider == "dingtalk":
-            destination = ch.destination
-        else:
-            destination = (
-                ChannelDeliveryRepository.get_send_address(db, channel_id=channel_id)
-                or ch.destination
-            )
         await self.gateway.send_text(
-            provider=ch.provider,
-            destination=destination,
+            provider=target.provider,
+            destination=target.delivery_address,
             text=text,
         )
 
@@ -0,0 +1,136 @@
+import logging
+from dataclasses import dataclass, replace
+
+from sqlalchemy.orm import Session
+
+from app.models.channel import Channel
+from app.repositories.active_session_repository import ActiveSessionRepository
+from app.repositories.channel_delivery_repository import ChannelDeliveryRepository
+from app.repositories.channel_repository import ChannelRepository
+from app.repositories.watch_repository import WatchRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelTarget:
+    id: int
+    provider: str
+    destination: str
+    enabled: bool
+    subscribe_all: bool
+    send_address: str | None = None
+
+    @property
+    def delivery_address(self) -> str:
+        # DingTalk sessionWebhook can expire; prefer stable conversationId for polling-based notifications.
+        if self.provider == "dingtalk":
+            return self.destination
+        return self.send_address or self.destination
+
+
+class SubscriptionIndex:
+    """In-memory map of session -> subscribed channels and channel -> delivery address.
+
+    Loaded from the database on first use, then kept current by the services that change
+    channels, watches, active sessions and delivery addresses, so the poll loops resolve
+    targets without queries. The IM service runs as a single process; call `invalidate`
+    after changing these tables by any other means.
+    """
+
+    def __init__(self) -> None:
+        self._loaded = False
+        self._channels: dict[int, ChannelTarget] = {}
+        self._watches: dict[str, set[int]] = {}
+        self._active: dict[int, str] = {}
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def _ensure_loaded(self, db: Session) -> None:
+        if self._loaded:
+            return
+        send_addresses = ChannelDeliveryRepository.list_send_addresses(db)
+        self._channels = {
+            ch.id: ChannelTarget(
+                id=ch.id,
+                provider=ch.provider,
+                destination=ch.destination,
+                enabled=bool(ch.enabled),
+                subscribe_all=bool(ch.subscribe_all),
+                send_address=send_addresses.get(ch.id),
+            )
+            for ch in ChannelRepository.list_all(db)
+        }
+        self._watches = {}
+        for channel_id, session_id in WatchRepository.list_pairs(db):
+            self._watches.setdefault(session_id, set()).add(channel_id)
+        self._active = dict(ActiveSessionRepository.list_pairs(db))
+        self._loaded = True
+        logger.info(
+            "subscription_index_loaded",
+            extra={
+                "channels": len(self._channels),
+                "watched_sessions": len(self._watches),
+                "active_sessions": len(self._active),
+            },
+        )
+
+    def get_target_channel_ids(self, db: Session, *, session_id: str) -> set[int]:
+        self._ensure_loaded(db)
+        target = {
+            ch.id for ch in self._channels.values() if ch.enabled and ch.subscribe_all
+        }
+        target.update(self._watches.get(session_id, ()))
+        target.update(
+            channel_id
+            for channel_id, active_session_id in self._active.items()
+            if active_session_id == session_id
+        )
+        return target
+
+    def get_channel(self, db: Session, *, channel_id: int) -> ChannelTarget | None:
+        self._ensure_loaded(db)
+        return self._channels.get(channel_id)
+
+    def upsert_channel(self, channel: Channel) -> None:
+        if not self._loaded:
+            return
+        current = self._channels.get(channel.id)
+        self._channels[channel.id] = ChannelTarget(
+            id=channel.id,
+            provider=channel.provider,
+            destination=channel.destination,
+            enabled=bool(channel.enabled),
+            subscribe_all=bool(channel.subscribe_all),
+            send_address=current.send_address if current else None,
+        )
+
+    def set_send_address(self, *, channel_id: int, send_address: str) -> None:
+        current = self._channels.get(channel_id) if self._loaded else None
+        if current:
+            self._channels[channel_id] = replace(current, send_address=send_address)
+
+    def add_watch(self, *, channel_id: int, session_id: str) -> None:
+        if self._loaded:
+            self._watches.setdefault(session_id, set()).add(channel_id)
+
+    def remove_watch(self, *, channel_id: int, session_id: str) -> None:
+        if not self._loaded:
+            return
+        channels = self._watches.get(session_id)
+        if channels is not None:
+            channels.discard(channel_id)
+            if not channels:
+                self._watches.pop(session_id, None)
+
+    def set_active(self, *, channel_id: int, session_id: str) -> None:
+        if self._loaded:
+            self._active[channel_id] = session_id
+
+    def clear_active(self, *, channel_id: int) -> None:
+        if self._loaded:
+            self._active.pop(channel_id, None)
+
+
+subscription_index = SubscriptionIndex()
@@ -6,6 +6,7 @@ from app.core.database import SessionLocal
 from app.repositories.channel_repository import ChannelRepository
 from app.services.command_service import CommandService
 from app.services.telegram_client import TelegramClient
+from app.services.subscription_index import subscription_index
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,7 @@ class TelegramService:
                 provider="telegram",
                 destination=str(chat_id),
             )
+            subscription_index.upsert_channel(channel)
             responses = await self.commands.handle_text(
                 db=db, channel=channel, text=text
             )
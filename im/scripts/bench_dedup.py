@@ -0,0 +1,103 @@
+"""Dedup throughput benchmark: per-key DedupRepository vs the batched DedupStore.
+
+Replays the poller access pattern (check a key, store it if new, re-check old keys on
+later ticks) against a scratch database and reports operations per second:
+
+    python scripts/bench_dedup.py --database-url sqlite:////tmp/im-bench.db \\
+        --keys 20000 --rechecks 5
+
+Point --database-url at a throwaway Postgres database to measure production-like
+numbers. The dedup_events table of that database is cleared before each run.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite:////tmp/im-dedup-bench.db")
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--rechecks", type=int, default=5)
+    args = parser.parse_args()
+
+    # Settings are read at import time.
+    os.environ["DATABASE_URL"] = args.database_url
+
+    from sqlalchemy import delete
+
+    from app.core.database import Base, SessionLocal, engine
+    from app.models.dedup_event import DedupEvent
+    from app.repositories.dedup_repository import DedupRepository
+    from app.services.dedup_store import DedupStore
+
+    Base.metadata.create_all(bind=engine)
+    keys = [f"msg:1:session-{i // 50}:{i}" for i in range(args.keys)]
+
+    def reset() -> None:
+        db = SessionLocal()
+        try:
+            db.execute(delete(DedupEvent))
+            db.commit()
+        finally:
+            db.close()
+
+    def run_repository() -> int:
+        ops = 0
+        db = SessionLocal()
+        try:
+            for key in keys:
+                if not DedupRepository.exists(db, key=key):
+                    DedupRepository.put(db, key=key)
+                ops += 1
+            for _ in range(args.rechecks):
+                for key in keys:
+                    DedupRepository.exists(db, key=key)
+                    ops += 1
+        finally:
+            db.close()
+        return ops
+
+    async def fill_store(store: DedupStore) -> int:
+        # Full batches are written by the maintenance loop, as in the service.
+        await store.build_bloom()
+        maintenance = asyncio.create_task(store.run_maintenance_loop())
+        ops = 0
+        try:
+            for key in keys:
+                if not store.exists(key):
+                    store.put(key)
+                ops += 1
+                await asyncio.sleep(0)
+        finally:
+            maintenance.cancel()
+            await asyncio.gather(maintenance, return_exceptions=True)
+        await store.flush()
+        return ops
+
+    def run_store() -> int:
+        store = DedupStore(SessionLocal)
+        ops = asyncio.run(fill_store(store))
+        for _ in range(args.rechecks):
+            for key in keys:
+                store.exists(key)
+                ops += 1
+        print(f"  store stats: {store.get_stats()}")
+        return ops
+
+    for label, run in (("repository", run_repository), ("store", run_store)):
+        reset()
+        started = time.perf_counter()
+        ops = run()
+        elapsed = time.perf_counter() - started
+        print(f"{label}: {ops} ops in {elapsed:.2f}s ({ops / elapsed:.0f} ops/s)")
+
+
+if __name__ == "__main__":
+    main()